@@ -4,62 +4,187 @@ chrome_manager/cli.py - Main Entry Point
 """
 
 import sys
+import argparse
 import logging
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Callable, List, Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 
-from chrome_manager.commands.profile_sync import sync_profiles
-from chrome_manager.commands.viewer import view_profiles, view_tmp_files, view_sheets_history
+from chrome_manager.commands.backfill import backfill_tmp_snapshots
+from chrome_manager.commands.profile_sync import stream_sync, sync_profiles
+from chrome_manager.commands.viewer import (
+    view_profiles, view_tmp_files, view_sheets_history, stream_profiles, export_history,
+    view_analytics
+)
 from chrome_manager.commands.maintenance import clean_old_entries, configure_settings
+from chrome_manager.core.analytics import ProfileAggregates
+from chrome_manager.core.fanout import MultiTargetSync, SyncTarget, parse_targets
+from chrome_manager.core.read_cache import ReadCache
 from chrome_manager.core.sheets import SheetsManager
+from chrome_manager.core.singleflight import SharedBackoff
+from chrome_manager.config.settings import (
+    PARTITION_MODE, PARTITION_ROWS, SHEET_LAYOUT, APPEND_CHUNK_ROWS, APPEND_CHUNK_BYTES,
+    SYNC_TARGETS, FANOUT_WORKERS, FANOUT_TIMEOUT, RUN_DIR, CURRENT_STATE,
+    HOST_SUMMARY, READ_CACHE_CELLS
+)
+from chrome_manager.utils.formatters import BINARY_FORMATS, FORMATS
+from chrome_manager.utils.profiling import Profiler
 
 # Constants
 SPREADSHEET_ID = "1xDJeKh11yj_E_eO7PCrAVGy7UJa-7d_5zBx94alVfa8"
 CREDENTIALS_PATH = Path("chrome_manager/config/credentials/service_account.json")
 
-# Initialize console and logging
+# Initialize console and logging (logs go to stderr so stdout can be piped)
 console = Console()
 logging.basicConfig(
     level="DEBUG",
     format="%(message)s",
     datefmt="[%X]",
-    handlers=[RichHandler(rich_tracebacks=True)]
+    handlers=[RichHandler(console=Console(stderr=True), rich_tracebacks=True)]
 )
 log = logging.getLogger("chrome_manager")
 
+# SheetsManager options shared by the primary and fan-out targets
+MANAGER_OPTIONS = {
+    'partition_mode': PARTITION_MODE or None,
+    'partition_rows': PARTITION_ROWS,
+    'layout': SHEET_LAYOUT,
+    'chunk_rows': APPEND_CHUNK_ROWS,
+    'chunk_bytes': APPEND_CHUNK_BYTES,
+    'current_state': CURRENT_STATE,
+    'summary': HOST_SUMMARY,
+    'backoff': SharedBackoff(RUN_DIR / "sheets-backoff.json"),
+    'read_cache': ReadCache(READ_CACHE_CELLS) if READ_CACHE_CELLS else None
+}
+
+def create_sheets_manager(
+    aggregates: Optional[ProfileAggregates] = None
+) -> SheetsManager:
+    """
+    Create the sheets manager for the configured spreadsheet
+    
+    Every row it commits is also folded into the analytics aggregates, so
+    syncs and backfills from subcommands (e.g. cron jobs) count too.
+    
+    Args:
+        aggregates: Aggregates to feed (defaults to the persisted ones)
+    """
+    sheets_manager = SheetsManager(
+        credentials_path=CREDENTIALS_PATH,
+        spreadsheet_id=SPREADSHEET_ID,
+        **MANAGER_OPTIONS
+    )
+    aggregates = aggregates or ProfileAggregates()
+    sheets_manager.add_row_listener(aggregates.on_rows)
+    sheets_manager.add_sync_listener(aggregates.flush)
+    return sheets_manager
+
+def build_fanout(sheets_manager: SheetsManager,
+                 include_primary: bool = True) -> Optional[MultiTargetSync]:
+    """
+    Set up concurrent sync when extra targets are configured
+    
+    Args:
+        sheets_manager: Manager of the configured spreadsheet, reused as its target
+        include_primary: Sync the configured spreadsheet along with the extras
+    """
+    extra = parse_targets(SYNC_TARGETS)
+    if not extra:
+        return None
+    
+    primary = SyncTarget(SPREADSHEET_ID)
+    if include_primary:
+        targets = [primary] + extra
+    else:
+        targets = [target for target in extra if target != primary]
+    if not targets:
+        return None
+    return MultiTargetSync(
+        credentials_path=CREDENTIALS_PATH,
+        targets=targets,
+        max_workers=FANOUT_WORKERS,
+        timeout=FANOUT_TIMEOUT,
+        managers={primary: sheets_manager},
+        manager_kwargs=MANAGER_OPTIONS
+    )
+
 class ChromeSheetsCLI:
     """🎮 Main CLI application controller"""
     
-    def __init__(self):
-        """Initialize CLI application"""
+    # Profiling modes cycled by the menu toggle (None = off)
+    PROFILE_CYCLE = (None,) + Profiler.MODES
+    
+    def __init__(self, profile_mode: Optional[str] = None,
+                 profile_dir: Path = Path("tmp") / "profiles"):
+        """
+        Initialize CLI application
+        
+        Args:
+            profile_mode: Profile every menu command ('sample' or 'cprofile')
+            profile_dir: Directory for profile output
+        """
         self._running = True
+        self.profile_mode = profile_mode
+        self.profile_dir = profile_dir
         
         # Initialize sheets manager
-        self.sheets_manager = SheetsManager(
-            credentials_path=CREDENTIALS_PATH,
-            spreadsheet_id=SPREADSHEET_ID
-        )
+        self.aggregates = ProfileAggregates()
+        self.sheets_manager = create_sheets_manager(self.aggregates)
+        self.fanout = build_fanout(self.sheets_manager)
         
         self.menu_options = {
             '1': ('🔍 Scan Profiles to tmp', view_profiles),
             '2': ('📁 View tmp Files', view_tmp_files),
             '3': ('🔄 Sync Profiles to Sheets', self._sync_profiles),
-            '4': ('📊 View Sheets History', self._view_sheets_history),
-            '5': ('🧹 Clean Old Entries', clean_old_entries),
-            '6': ('⚙️ Configure Settings', configure_settings),
-            '7': ('❌ Exit', self.exit_cli)
+            '4': ('🖥️ Sweep Host to Sheets', self._sweep_profiles),
+            '5': ('📊 View Sheets History', self._view_sheets_history),
+            '6': ('📈 Profile Analytics', self._view_analytics),
+            '7': ('🧹 Clean Old Entries', clean_old_entries),
+            '8': ('⚙️ Configure Settings', configure_settings),
+            '9': ('❌ Exit', self.exit_cli),
+            'p': (self._profile_label(), self._toggle_profiling)
         }
+        # Commands that are never profiled
+        self._unprofiled = {'9', 'p'}
+
+    def _profile_label(self) -> str:
+        """Menu text of the profiling toggle"""
+        return f"⏱️ Profiling: {self.profile_mode or 'off'}"
+
+    def _toggle_profiling(self) -> None:
+        """Cycle profiling of menu commands: off, sampling, cProfile"""
+        position = self.PROFILE_CYCLE.index(self.profile_mode)
+        self.profile_mode = self.PROFILE_CYCLE[(position + 1) % len(self.PROFILE_CYCLE)]
+        self.menu_options['p'] = (self._profile_label(), self._toggle_profiling)
+
+    def _run_command(self, choice: str, handler: Callable[[], None]) -> None:
+        """Run a menu command, profiled if profiling is on"""
+        if not self.profile_mode or choice in self._unprofiled:
+            handler()
+            return
+        label = getattr(handler, '__name__', 'command').strip('_')
+        with Profiler(self.profile_mode, self.profile_dir, label=label):
+            handler()
 
     def _sync_profiles(self) -> None:
         """Wrapper for sync_profiles command"""
-        sync_profiles(self.sheets_manager)
+        sync_profiles(self.sheets_manager, fanout=self.fanout)
+
+    def _sweep_profiles(self) -> None:
+        """Wrapper for sync_profiles in host-sweep mode"""
+        sync_profiles(self.sheets_manager, sweep=True, fanout=self.fanout)
 
     def _view_sheets_history(self) -> None:
         """Wrapper for view_sheets_history command"""
         view_sheets_history(self.sheets_manager)
 
+    def _view_analytics(self) -> None:
+        """Wrapper for view_analytics command"""
+        view_analytics(self.sheets_manager, self.aggregates)
+
     def display_menu(self) -> None:
         """Display main menu"""
         console.clear()
@@ -78,7 +203,7 @@ class ChromeSheetsCLI:
                     
                     if choice in self.menu_options:
                         _, handler = self.menu_options[choice]
-                        handler()
+                        self._run_command(choice, handler)
                     else:
                         console.print("❌ Invalid choice", style="bold red")
                         
@@ -99,16 +224,131 @@ class ChromeSheetsCLI:
     def exit_cli(self) -> None:
         """Clean exit from CLI"""
         console.print("\n👋 Goodbye!", style="bold blue")
+        if self.fanout:
+            self.fanout.close()
         self._running = False
 
-def main() -> int:
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
+    parser = argparse.ArgumentParser(
+        prog="chrome-manager",
+        description="Chrome Profile Sheet Manager "
+                    "(interactive menu when no command is given)"
+    )
+    parser.add_argument("--profile", choices=Profiler.MODES,
+                        help="Profile the command: 'sample' writes folded stacks "
+                             "for flame graphs, 'cprofile' a .prof file covering "
+                             "every thread the command starts; both print a "
+                             "per-phase summary")
+    parser.add_argument("--profile-dir", type=Path, default=Path("tmp") / "profiles",
+                        help="Directory for profile output")
+    commands = parser.add_subparsers(dest="command")
+    
+    scan = commands.add_parser("scan", help="Stream scanned profiles as they are found")
+    scan.add_argument("--format", choices=FORMATS, default="ndjson",
+                      help="Output format")
+    scan.add_argument("--sweep", action="store_true",
+                      help="Scan every user and browser on the host")
+    scan.add_argument("--output", type=Path, help="Write to a file instead of stdout")
+    
+    export = commands.add_parser("export", help="Stream sheet history in chunks")
+    export.add_argument("--format", choices=FORMATS + BINARY_FORMATS, default="csv",
+                        help="Output format (parquet requires pyarrow)")
+    export.add_argument("--output", type=Path, help="Write to a file instead of stdout")
+    export.add_argument("--start", help="Only rows at or after this ISO timestamp")
+    export.add_argument("--end", help="Only rows at or before this ISO timestamp")
+    export.add_argument("--chunk-rows", type=int, default=5000,
+                        help="Rows per read request")
+    export.add_argument("--current", action="store_true",
+                        help="Export the Current State worksheet "
+                             "instead of the history")
+    
+    sync = commands.add_parser(
+        "sync", help="Scan, record and sync in one streaming pass (no review)"
+    )
+    sync.add_argument("--sweep", action="store_true",
+                      help="Scan every user and browser on the host")
+    
+    backfill = commands.add_parser(
+        "backfill", help="Upload legacy tmp/chrome_profiles_*.json snapshots",
+        description="Upload legacy snapshots with their original timestamps. "
+                    "Snapshots already uploaded by a backfill are skipped, but rows "
+                    "synced before sync IDs existed are not recognized: a snapshot "
+                    "that was synced back then is uploaded again, stamped with its "
+                    "scan time."
+    )
+    backfill.add_argument("--tmp-dir", type=Path, default=Path("tmp"),
+                          help="Directory holding the legacy snapshot files")
+    backfill.add_argument("--requests-per-minute", type=float, default=50.0,
+                          help="Write request pacing "
+                               "(the Sheets API allows 60/min per user)")
+    
+    return parser
+
+def run_scan(args: argparse.Namespace) -> int:
+    """Run the streaming scan command"""
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            stream_profiles(args.format, args.sweep, f)
+    else:
+        stream_profiles(args.format, args.sweep)
+    return 0
+
+def run_export(args: argparse.Namespace) -> int:
+    """Run the chunked history export command"""
+    sheets_manager = create_sheets_manager()
+    options = dict(
+        start=args.start, end=args.end, chunk_rows=args.chunk_rows, current=args.current
+    )
+    if args.output:
+        binary = args.format in BINARY_FORMATS
+        with open(args.output, 'wb' if binary else 'w',
+                  **({} if binary else {'encoding': 'utf-8', 'newline': ''})) as f:
+            count = export_history(sheets_manager, args.format, f, **options)
+    else:
+        count = export_history(sheets_manager, args.format, **options)
+    log.info(f"Exported {count} rows")
+    return 0
+
+def run_sync(args: argparse.Namespace) -> int:
+    """Run the streaming sync command"""
+    sheets_manager = create_sheets_manager()
+    fanout = build_fanout(sheets_manager, include_primary=False)
+    try:
+        return 0 if stream_sync(sheets_manager, args.sweep, fanout) else 1
+    finally:
+        if fanout:
+            fanout.close()
+
+def run_backfill(args: argparse.Namespace) -> int:
+    """Run the legacy snapshot backfill command"""
+    sheets_manager = create_sheets_manager()
+    ok = backfill_tmp_snapshots(sheets_manager, args.tmp_dir, args.requests_per_minute)
+    return 0 if ok else 1
+
+def main(argv: Optional[List[str]] = None) -> int:
     """CLI entry point"""
+    args = build_parser().parse_args(argv)
     try:
-        cli = ChromeSheetsCLI()
+        commands = {
+            "scan": run_scan, "export": run_export,
+            "sync": run_sync, "backfill": run_backfill
+        }
+        if args.command in commands:
+            profiler = (
+                Profiler(args.profile, args.profile_dir, label=args.command)
+                if args.profile else nullcontext()
+            )
+            with profiler:
+                return commands[args.command](args)
+        
+        cli = ChromeSheetsCLI(args.profile, args.profile_dir)
         return cli.run()
     except KeyboardInterrupt:
         console.print("\n\n👋 Goodbye!", style="bold blue")
         return 0
+    except BrokenPipeError:
+        return 0
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
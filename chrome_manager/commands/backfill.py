@@ -0,0 +1,99 @@
+"""
+chrome_manager/commands/backfill.py
+📼 Bulk upload of legacy tmp snapshot files into the sheet
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+from rich.console import Console
+
+from chrome_manager.core.sheets import SheetsManager
+from chrome_manager.utils.profiling import phase
+from chrome_manager.utils.system_info import SystemInfoCollector
+
+console = Console()
+log = logging.getLogger("backfill")
+
+# Written per scan before the snapshot history existed
+LEGACY_PATTERN = "chrome_profiles_*.json"
+
+def iter_legacy_snapshots(tmp_dir: Path) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    📂 Stream legacy snapshot files in timestamp order
+
+    File names embed the ISO scan time (':' replaced by '-'), so name order
+    is time order and only one file is held in memory at a time.
+
+    Args:
+        tmp_dir: Directory holding chrome_profiles_*.json files
+
+    Yields:
+        (snapshot timestamp, profile dicts) pairs
+    """
+    for path in sorted(tmp_dir.glob(LEGACY_PATTERN)):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            timestamp = data['timestamp']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.warning(f"Skipping unreadable snapshot {path.name}: {e}")
+            continue
+        yield timestamp, data.get('profiles') or []
+
+def backfill_tmp_snapshots(sheets_manager: SheetsManager, tmp_dir: Path = Path("tmp"),
+                           requests_per_minute: float = 50.0) -> bool:
+    """
+    📼 Upload every legacy tmp snapshot with its original timestamp
+
+    Legacy files recorded only the profiles, so every host column (hostname,
+    user, OS, IP, memory) is left blank rather than filled with what this
+    host looks like today. This host's hostname and username only key the
+    sync IDs and Sync Log entries, so a snapshot is recognized as present
+    by the sync ID a backfill (or a regular sync of it) from this host gives
+    it; one synced before sync IDs were recorded is uploaded a second time.
+
+    Args:
+        sheets_manager: Sheets manager to upload through
+        tmp_dir: Directory holding the legacy snapshot files
+        requests_per_minute: Upper bound on write requests per minute
+
+    Returns:
+        True if every snapshot is now in the sheet
+    """
+    try:
+        files = len(list(tmp_dir.glob(LEGACY_PATTERN)))
+        if not files:
+            console.print(f"\n📂 No legacy snapshots in {tmp_dir}", style="yellow")
+            return True
+
+        console.print(f"\n📼 Backfilling {files} legacy snapshots...", style="bold blue")
+        with phase('system-info'):
+            identity = SystemInfoCollector().get_sheet_data()
+        unrecorded = dict.fromkeys(identity, '')
+        unrecorded.pop('timestamp', None)
+
+        with phase('sheets'):
+            result = sheets_manager.backfill(
+                iter_legacy_snapshots(tmp_dir), unrecorded, requests_per_minute,
+                identity=identity
+            )
+
+        if not result.complete:
+            console.print(
+                f"\n⚠️ Stopped after {result.uploaded} snapshots; run again to resume",
+                style="yellow"
+            )
+            return False
+        console.print(
+            f"\n✅ Uploaded {result.uploaded} snapshots, "
+            f"{result.skipped} already present",
+            style="bold green"
+        )
+        return True
+
+    except Exception as e:
+        log.error(f"Error backfilling snapshots: {e}")
+        console.print(f"\n❌ Error backfilling snapshots: {e}", style="bold red")
+        return False
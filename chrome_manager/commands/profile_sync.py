@@ -3,45 +3,121 @@ chrome_manager/commands/profile_sync.py
 🔄 Profile scanning and syncing command implementation
 """
 
-import json
 import logging
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Iterator, Optional, List, Dict, Tuple
 from rich.console import Console
 from rich.prompt import Confirm
+from rich.table import Table
 
-from chrome_manager.utils.chrome_scanner import ChromeProfileScanner
+from chrome_manager.config.settings import (
+    COLLECT_INVENTORY, MEASURE_DISK_USAGE, RUN_DIR, SCAN_QUEUE_SIZE, SWEEP_HOME_ROOT,
+    SWEEP_WORKERS
+)
+from chrome_manager.core.fanout import MultiTargetSync, TargetResult
+from chrome_manager.core.pipeline import bounded
+from chrome_manager.core.records import ProfileRecord
+from chrome_manager.core.scanner import ProfileScanner
+from chrome_manager.core.singleflight import SingleFlight, flight_key
+from chrome_manager.core.sweep import iter_sweep
+from chrome_manager.utils.chrome_scanner import write_scan_to_tmp
+from chrome_manager.utils.profiling import phase
+from chrome_manager.utils.snapshots import SnapshotStore
 from chrome_manager.utils.system_info import SystemInfoCollector
 from chrome_manager.core.sheets import SheetsManager
 
 console = Console()
 log = logging.getLogger("profile_sync")
 
-def scan_to_tmp() -> Optional[Path]:
-    """Scan Chrome profiles to tmp file"""
+def _scanned_records(sweep: bool) -> Iterator[ProfileRecord]:
+    """Scan on a background thread, at most SCAN_QUEUE_SIZE records ahead"""
+    if sweep:
+        records = iter_sweep(
+            SWEEP_HOME_ROOT, SWEEP_WORKERS or None,
+            MEASURE_DISK_USAGE, COLLECT_INVENTORY
+        )
+    else:
+        records = ProfileScanner(
+            measure_disk=MEASURE_DISK_USAGE, collect_inventory=COLLECT_INVENTORY
+        ).iter_profiles()
+    return bounded(records, SCAN_QUEUE_SIZE, name="scanner")
+
+def _waits_as_scan(records: Iterator[ProfileRecord]) -> Iterator[ProfileRecord]:
+    """Attribute a consumer's waits for the next scanned record to the 'scan' phase"""
+    while True:
+        with phase('scan'):
+            record = next(records, None)
+        if record is None:
+            return
+        yield record
+
+def _scan(sweep: bool) -> Optional[str]:
+    """Scan and record a snapshot, returning its timestamp"""
+    count = 0
+    
+    def counted() -> Iterator[ProfileRecord]:
+        nonlocal count
+        for record in _scanned_records(sweep):
+            count += 1
+            yield record
+    
+    timestamp = write_scan_to_tmp(counted(), Path("tmp"))
+    if sweep:
+        console.print(f"\n🖥️ Swept {count} profiles", style="bold blue")
+        return timestamp if count else None
+    return timestamp
+
+def scan_to_tmp(sweep: bool = False) -> Optional[str]:
+    """
+    Scan Chrome profiles to the tmp snapshot history (all users and browsers if sweep)
+    
+    Concurrent invocations on the host that would record the same scan
+    into the same history share one scan.
+    """
     try:
-        scanner = ChromeProfileScanner()
-        profiles = scanner.get_profiles()  # This now writes to tmp and returns data
-        return next(Path("tmp").glob("chrome_profiles_*.json"), None)
+        key = flight_key(
+            'scan', sweep, Path("tmp").resolve(), '' if sweep else Path.home()
+        )
+        with phase('scan'):
+            return SingleFlight(RUN_DIR).run(key, lambda: _scan(sweep))
     except Exception as e:
         log.error(f"Error scanning profiles: {e}")
         console.print(f"\n❌ Error scanning profiles: {e}", style="bold red")
         return None
 
-def review_tmp_data(tmp_file: Path) -> bool:
-    """Review the temporary data before syncing"""
+def load_snapshot(snapshot: str) -> Tuple[str, List[Dict]]:
+    """Load a snapshot's profiles from the tmp snapshot history"""
+    loaded = SnapshotStore().load(snapshot)
+    if loaded is None:
+        raise FileNotFoundError(f"Snapshot not found: {snapshot}")
+    return loaded
+
+def review_tmp_data(snapshot: str,
+                    loaded: Optional[Tuple[str, List[Dict]]] = None) -> bool:
+    """Review the snapshot data (loaded if not given) before syncing"""
     try:
-        with open(tmp_file, 'r') as f:
-            data = json.load(f)
+        timestamp, profiles = loaded or load_snapshot(snapshot)
         
         console.print("\n📊 Scanned Profile Data:", style="bold blue")
-        console.print(f"Total Profiles: {data['total_profiles']}")
+        console.print(f"Snapshot: {timestamp}")
+        console.print(f"Total Profiles: {len(profiles)}")
         console.print("\nProfiles:")
-        for profile in data['profiles']:
+        for profile in profiles:
             console.print(f"\n• {profile['name']}")
+            if profile.get('username'):
+                console.print(
+                    f"  User: {profile['username']} ({profile.get('browser')})"
+                )
             console.print(f"  Email: {profile['email']}")
             console.print(f"  Type: {'Local' if profile['is_local'] else 'Signed-in'}")
             console.print(f"  Last Used: {profile['last_used']}")
+            if profile.get('disk_usage') is not None:
+                console.print(f"  Disk Usage: {profile['disk_usage'] / 2**20:.1f} MB")
+            inventory = (profile.get('extensions'), profile.get('bookmarks'))
+            if any(value is not None for value in inventory):
+                console.print(f"  Extensions: {profile.get('extensions')}, "
+                              f"Bookmarks: {profile.get('bookmarks')}")
         
         return Confirm.ask("\nSync this data to Google Sheets?")
     except Exception as e:
@@ -49,18 +125,59 @@ def review_tmp_data(tmp_file: Path) -> bool:
         console.print(f"\n❌ Error reviewing data: {e}", style="bold red")
         return False
 
-def sync_to_sheets(tmp_file: Path, sheets_manager: SheetsManager) -> bool:
-    """Sync data from tmp file to Google Sheets"""
-    try:
-        # Read tmp file
-        with open(tmp_file, 'r') as f:
-            data = json.load(f)
-        
-        # Get system info
+def show_target_results(results: List[TargetResult]) -> None:
+    """Display the per-target outcome of a fan-out sync"""
+    table = Table(title="🌐 Sync Targets")
+    table.add_column("Target", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    
+    for result in results:
+        if result.ok:
+            status = "[green]✅ synced[/green]"
+        else:
+            status = f"[red]❌ {result.error}[/red]"
+        table.add_row(result.target.label, status, f"{result.elapsed:.1f}s")
+    
+    console.print(table)
+
+def _sync_snapshot(snapshot: str, sheets_manager: SheetsManager,
+                   fanout: Optional[MultiTargetSync],
+                   loaded: Optional[Tuple[str, List[Dict]]] = None) -> bool:
+    """Send a snapshot to the sheet (or every fan-out target)"""
+    timestamp, profiles = loaded or load_snapshot(snapshot)
+    
+    # Get system info
+    with phase('system-info'):
         system_info = SystemInfoCollector().get_sheet_data()
-        
-        # Sync to sheets
-        success = sheets_manager.update_profiles(data['profiles'], system_info)
+    
+    # Sync to sheets, stamped with the scan time so a replay is a no-op
+    if fanout:
+        with phase('sheets'):
+            results = fanout.sync(profiles, system_info, timestamp=timestamp)
+        show_target_results(results)
+        return all(result.ok for result in results)
+    with phase('sheets'):
+        return sheets_manager.update_profiles(
+            profiles, system_info, timestamp=timestamp
+        )
+
+def sync_to_sheets(snapshot: str, sheets_manager: SheetsManager,
+                   fanout: Optional[MultiTargetSync] = None,
+                   loaded: Optional[Tuple[str, List[Dict]]] = None) -> bool:
+    """
+    Sync a snapshot from the tmp history to Google Sheets (every target if fanout)
+    
+    Concurrent invocations on the host syncing the same snapshot to the
+    same spreadsheet wait for the one in flight and share its outcome.
+    Pass the snapshot as already loaded for review to avoid a second load.
+    """
+    try:
+        key = flight_key('sync', sheets_manager.spreadsheet_id, Path("tmp").resolve(),
+                         snapshot, *(t.label for t in fanout.targets) if fanout else ())
+        success = SingleFlight(RUN_DIR).run(
+            key, lambda: _sync_snapshot(snapshot, sheets_manager, fanout, loaded)
+        )
         
         if success:
             console.print("\n✅ Successfully synced to Google Sheets!", style="bold green")
@@ -74,21 +191,23 @@ def sync_to_sheets(tmp_file: Path, sheets_manager: SheetsManager) -> bool:
         console.print(f"\n❌ Error syncing to sheets: {e}", style="bold red")
         return False
 
-def sync_profiles(sheets_manager: SheetsManager) -> None:
+def sync_profiles(sheets_manager: SheetsManager, sweep: bool = False,
+                  fanout: Optional[MultiTargetSync] = None) -> None:
     """Main profile sync command"""
     try:
         # First scan to tmp
         console.print("\n🔍 Scanning Chrome profiles...", style="bold blue")
-        tmp_file = scan_to_tmp()
+        snapshot = scan_to_tmp(sweep)
         
-        if not tmp_file:
+        if not snapshot:
             console.print("\n❌ No profile data found", style="bold red")
             return
             
-        # Review the data
-        if review_tmp_data(tmp_file):
+        # Review the data (loaded once for both review and sync)
+        loaded = load_snapshot(snapshot)
+        if review_tmp_data(snapshot, loaded):
             # Sync to sheets if approved
-            sync_to_sheets(tmp_file, sheets_manager)
+            sync_to_sheets(snapshot, sheets_manager, fanout, loaded)
         else:
             console.print("\nSync cancelled", style="yellow")
             
@@ -96,4 +215,81 @@ def sync_profiles(sheets_manager: SheetsManager) -> None:
         log.error(f"Error in profile sync: {e}")
         console.print(f"\n❌ Error: {e}", style="bold red")
     
-    input("\nPress Enter to continue...")
\ No newline at end of file
+    input("\nPress Enter to continue...")
+
+def _stream_sync(sheets_manager: SheetsManager, sweep: bool,
+                 fanout: Optional[MultiTargetSync]) -> bool:
+    """Scan, record and upload one snapshot in a single pass"""
+    with phase('system-info'):
+        system_info = SystemInfoCollector().get_sheet_data()
+    
+    timestamp = datetime.now().isoformat()
+    store = SnapshotStore(Path("tmp") / "snapshots")
+    recorded = False
+    
+    def recording() -> Iterator[ProfileRecord]:
+        nonlocal recorded
+        yield from store.record(_waits_as_scan(_scanned_records(sweep)), timestamp)
+        recorded = True
+    
+    records = recording()
+    with phase('sheets'):
+        success = sheets_manager.stream_update(records, system_info, timestamp)
+    for _ in records:  # Finish recording the scan if the upload stopped early
+        pass
+    
+    if not recorded:
+        return False
+    console.print(f"\n💾 Profile snapshot recorded: {timestamp}", style="bold green")
+    
+    # Extra targets get the recorded snapshot, stamped like the streamed one
+    if fanout:
+        _, profiles = store.load(timestamp)
+        with phase('sheets'):
+            results = fanout.sync(profiles, system_info, timestamp=timestamp)
+        show_target_results(results)
+        success = success and all(result.ok for result in results)
+    return success
+
+def stream_sync(sheets_manager: SheetsManager, sweep: bool = False,
+                fanout: Optional[MultiTargetSync] = None) -> bool:
+    """
+    🚰 Scan, record and sync in one pass without review, in flat memory
+    
+    The scanner runs on its own thread at most SCAN_QUEUE_SIZE records
+    ahead; each record is appended to the snapshot history as it arrives
+    and handed to the uploader, which sends a chunk whenever one fills.
+    If the upload fails, the rest of the scan is still recorded.
+    
+    Only the primary spreadsheet is streamed to. Extra fan-out targets
+    are synced from the recorded snapshot afterwards, which holds that
+    snapshot in memory once.
+    
+    Args:
+        sheets_manager: Sheets manager to sync through
+        sweep: Scan every user and browser on the host
+        fanout: Extra targets (not including sheets_manager's spreadsheet)
+        
+    Returns:
+        True if every scanned profile is in the sheet
+    """
+    try:
+        console.print("\n🚰 Scanning and syncing Chrome profiles...", style="bold blue")
+        key = flight_key('stream-sync', sheets_manager.spreadsheet_id,
+                         Path("tmp").resolve(), sweep, '' if sweep else Path.home(),
+                         *(t.label for t in fanout.targets) if fanout else ())
+        success = SingleFlight(RUN_DIR).run(
+            key, lambda: _stream_sync(sheets_manager, sweep, fanout)
+        )
+        
+        if success:
+            console.print("\n✅ Successfully synced to Google Sheets!",
+                          style="bold green")
+            return True
+        console.print("\n❌ Failed to sync to Google Sheets", style="bold red")
+        return False
+        
+    except Exception as e:
+        log.error(f"Error in streaming sync: {e}")
+        console.print(f"\n❌ Error: {e}", style="bold red")
+        return False
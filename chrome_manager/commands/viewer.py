@@ -3,42 +3,130 @@ chrome_manager/commands/viewer.py
 👀 Profile and file viewing command implementations
 """
 
-import json
 import logging
-from pathlib import Path
-from typing import List, Optional
+import sys
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from rich.console import Console
 from rich.table import Table
-from rich.prompt import Prompt
+from rich.prompt import Confirm, IntPrompt, Prompt
 
-from chrome_manager.utils.chrome_scanner import ChromeProfileScanner
+from chrome_manager.config.settings import (
+    COLLECT_INVENTORY, MEASURE_DISK_USAGE, PAGE_SIZE, SWEEP_HOME_ROOT, SWEEP_WORKERS
+)
+from chrome_manager.core.analytics import ProfileAggregates
+from chrome_manager.core.scanner import ProfileScanner
+from chrome_manager.core.sweep import iter_sweep
 from chrome_manager.core.sheets import SheetsManager
+from chrome_manager.utils.formatters import BINARY_FORMATS, open_writer
+from chrome_manager.utils.profiling import phase
+from chrome_manager.utils.snapshots import SnapshotStore
 
 console = Console()
 log = logging.getLogger("viewer")
 
-def view_profiles() -> None:
-    """Scan and display current Chrome profiles"""
-    try:
-        scanner = ChromeProfileScanner()
-        profiles = scanner.get_profiles()  # This now writes to tmp
-        
-        table = Table(title="Current Chrome Profiles")
-        table.add_column("Name", style="cyan")
-        table.add_column("Type", style="green")
-        table.add_column("Email/Identity", style="blue")
-        table.add_column("Last Used", style="magenta")
+# Field order for streamed profile output
+PROFILE_COLUMNS = [
+    'name', 'path', 'is_local', 'email', 'custom_name', 'last_used', 'username',
+    'browser', 'disk_usage', 'extensions', 'bookmarks', 'history_size'
+]
+
+# Typed columns of exported sheet history (others are strings)
+HISTORY_TYPES = {
+    'Timestamp': 'timestamp',
+    'Memory Total': 'float',
+    'Memory Available': 'float',
+    'Last Used': 'timestamp',
+    'Disk Usage (MB)': 'float',
+    'Extensions': 'int',
+    'Bookmarks': 'int',
+    'History Size (MB)': 'float',
+}
+
+def page_table(title: str, columns: List[Tuple[str, str]], items: Iterable[Any],
+               format_row: Callable[[Any], List[str]],
+               page_size: int = PAGE_SIZE) -> None:
+    """
+    📄 Render items as an interactive paged table
+    
+    Items are pulled only as far as the pages shown, so the first page of
+    a lazy source (e.g. a running scan) appears before the rest is
+    produced. Only the rows of the visible page are formatted and rendered.
+    
+    Args:
+        title: Table title
+        columns: (header, style) pairs
+        items: Items to display (consumed lazily)
+        format_row: Turns one item into table cells
+        page_size: Rows per page
+    """
+    source = iter(items)
+    shown: List[Any] = []
+    exhausted = False
+    page = 0
+    while True:
+        # One item past the page tells whether another page follows
+        wanted = (page + 1) * page_size + 1
+        if not exhausted and len(shown) < wanted:
+            shown.extend(islice(source, wanted - len(shown)))
+            exhausted = len(shown) < wanted
+        pages = max(1, -(-len(shown) // page_size))
         
-        for profile in profiles:
-            table.add_row(
-                profile['name'],
-                "🔒 Local" if profile['is_local'] else "🌐 Signed-in",
-                profile['email'] or "N/A",
-                profile['last_used'] or "Unknown"
-            )
+        if exhausted:
+            counts = f"{pages}, {len(shown)} total"
+        else:
+            counts = f"?, {len(shown)}+ so far"
+        table = Table(title=f"{title} (page {page + 1}/{counts})")
+        for header, style in columns:
+            table.add_column(header, style=style)
+        for item in shown[page * page_size:(page + 1) * page_size]:
+            table.add_row(*format_row(item))
         
         console.print("\n")
         console.print(table)
+        if exhausted and pages == 1:
+            return
+        
+        choice = Prompt.ask(
+            "[n]ext, [p]revious, [q]uit", choices=["n", "p", "q"], default="n"
+        )
+        if choice == "q":
+            return
+        if choice == "p" and page == 0 and not exhausted:
+            shown.extend(source)  # Wrapping around needs the last page
+            exhausted = True
+            pages = max(1, -(-len(shown) // page_size))
+        page += 1 if choice == "n" else -1
+        if exhausted:
+            page %= pages
+
+def view_profiles() -> None:
+    """Scan and display current Chrome profiles, paging as the scan runs"""
+    try:
+        scanner = ProfileScanner(
+            measure_disk=MEASURE_DISK_USAGE, collect_inventory=COLLECT_INVENTORY
+        )
+        timestamp = datetime.now().isoformat()
+        profiles = SnapshotStore().record(scanner.iter_profiles(), timestamp)
+        
+        page_table(
+            "Current Chrome Profiles",
+            [("Name", "cyan"), ("Type", "green"), ("Email/Identity", "blue"),
+             ("Last Used", "magenta"), ("Disk (MB)", "yellow")],
+            profiles,
+            lambda profile: [
+                profile.name,
+                "🔒 Local" if profile.is_local else "🌐 Signed-in",
+                profile.identity,
+                profile.last_used or "Unknown",
+                str(profile.disk_usage_mb)
+            ]
+        )
+        for _ in profiles:  # Finish recording the scan if paging stopped early
+            pass
+        console.print(f"\n💾 Profile snapshot recorded: {timestamp}", style="bold green")
         
     except Exception as e:
         log.error(f"Error viewing profiles: {e}")
@@ -47,43 +135,40 @@ def view_profiles() -> None:
     input("\nPress Enter to continue...")
 
 def view_tmp_files() -> None:
-    """View and inspect temporary profile scan files"""
+    """View and inspect recorded profile snapshots"""
     try:
-        tmp_dir = Path("tmp")
-        if not tmp_dir.exists():
-            console.print("\n❌ No tmp directory found", style="bold red")
-            return
-            
-        files = list(tmp_dir.glob("chrome_profiles_*.json"))
-        if not files:
+        snapshots = SnapshotStore().list_snapshots(limit=20)
+        if not snapshots:
             console.print("\n📂 No profile scans found", style="yellow")
+            input("\nPress Enter to continue...")
             return
             
-        # Show available files
-        console.print("\n📁 Available Profile Scans:", style="bold blue")
-        for i, file in enumerate(files, 1):
-            console.print(f"{i}. {file.name}")
+        # Show the most recent snapshots
+        console.print("\n📁 Recent Profile Scans:", style="bold blue")
+        for i, snapshot in enumerate(snapshots, 1):
+            console.print(f"{i}. {snapshot}")
             
-        # Let user choose a file to view
+        # Let user choose a snapshot to view
         choice = Prompt.ask(
-            "\nSelect a file to view (number)", 
-            choices=[str(i) for i in range(1, len(files) + 1)]
+            "\nSelect a scan to view (number)", 
+            choices=[str(i) for i in range(1, len(snapshots) + 1)]
         )
         
-        # Display chosen file contents
-        file = files[int(choice) - 1]
-        with open(file, 'r') as f:
-            data = json.load(f)
-            
-        console.print(f"\n📄 File: {file.name}", style="bold blue")
-        console.print(f"Timestamp: {data['timestamp']}")
-        console.print(f"Total Profiles: {data['total_profiles']}")
-        
-        for profile in data['profiles']:
-            console.print(f"\n• {profile['name']}")
-            console.print(f"  Email: {profile['email']}")
-            console.print(f"  Type: {'Local' if profile['is_local'] else 'Signed-in'}")
-            console.print(f"  Last Used: {profile['last_used']}")
+        # Display chosen snapshot contents
+        timestamp, profiles = SnapshotStore().load(snapshots[int(choice) - 1])
+        
+        page_table(
+            f"Snapshot {timestamp}",
+            [("Name", "cyan"), ("Email", "blue"), ("Type", "green"),
+             ("Last Used", "magenta")],
+            profiles,
+            lambda profile: [
+                profile['name'],
+                profile['email'] or "N/A",
+                'Local' if profile['is_local'] else 'Signed-in',
+                profile['last_used'] or "Unknown"
+            ]
+        )
             
     except Exception as e:
         log.error(f"Error viewing tmp files: {e}")
@@ -91,16 +176,165 @@ def view_tmp_files() -> None:
     
     input("\nPress Enter to continue...")
 
+def stream_profiles(fmt: str, sweep: bool = False,
+                    output: Optional[IO[str]] = None) -> int:
+    """
+    🧾 Stream scanned profiles to a file or stdout as they are scanned
+    
+    Args:
+        fmt: Output format ('json', 'csv' or 'ndjson')
+        sweep: Scan every user and browser on the host
+        output: Text stream (defaults to stdout)
+        
+    Returns:
+        Number of profiles written
+    """
+    if sweep:
+        records = iter_sweep(
+            SWEEP_HOME_ROOT, SWEEP_WORKERS or None,
+            MEASURE_DISK_USAGE, COLLECT_INVENTORY
+        )
+    else:
+        records = ProfileScanner(
+            measure_disk=MEASURE_DISK_USAGE, collect_inventory=COLLECT_INVENTORY
+        ).iter_profiles()
+    
+    writer = open_writer(fmt, output or sys.stdout, PROFILE_COLUMNS)
+    with writer, phase('scan'):
+        for record in records:
+            writer.write(record.to_dict())
+    
+    log.debug(f"Streamed {writer.count} profiles as {fmt}")
+    return writer.count
+
+def _to_float(value: str) -> Optional[float]:
+    """Parse a number with an optional unit suffix (e.g. '15.53GB')"""
+    try:
+        return float(value.rstrip('KMGTB '))
+    except ValueError:
+        return None
+
+def history_record(row: List[str], columns: Sequence[str]) -> Dict[str, Any]:
+    """Convert a sheet history row to a typed record ('' becomes None)"""
+    record: Dict[str, Any] = {}
+    for column, value in zip(columns, list(row) + [''] * (len(columns) - len(row))):
+        if value == '':
+            record[column] = None
+        elif HISTORY_TYPES.get(column) == 'float':
+            record[column] = _to_float(value)
+        elif HISTORY_TYPES.get(column) == 'int':
+            number = _to_float(value)
+            record[column] = None if number is None else int(number)
+        else:
+            record[column] = value
+    return record
+
+def export_history(sheets_manager: SheetsManager, fmt: str, output: Optional[IO] = None,
+                   start: Optional[str] = None, end: Optional[str] = None,
+                   chunk_rows: int = 5000, current: bool = False) -> int:
+    """
+    📤 Stream sheet history to CSV, NDJSON, JSON or Parquet
+    
+    Rows are read in chunks (the next one prefetched while the current
+    one is written), so memory stays bounded regardless of sheet size.
+    
+    Args:
+        sheets_manager: Sheets manager to read from
+        fmt: Output format (FORMATS or 'parquet')
+        output: Stream to write to (text, or binary for parquet; defaults to stdout)
+        start: Optional ISO timestamp lower bound
+        end: Optional ISO timestamp upper bound
+        chunk_rows: Rows per read request
+        current: Export the Current State worksheet (one read) instead
+        
+    Returns:
+        Number of rows written
+    """
+    columns = SheetsManager.SHEET_CONFIG['headers']
+    if output is None:
+        output = sys.stdout.buffer if fmt in BINARY_FORMATS else sys.stdout
+    
+    if current:
+        chunks = iter([sheets_manager.get_current_state()])
+    else:
+        chunks = sheets_manager.iter_history(start, end, chunk_rows)
+    
+    writer = open_writer(fmt, output, columns, flush=False, types=HISTORY_TYPES)
+    with writer, phase('sheets'):
+        for chunk in chunks:
+            for row in chunk:
+                writer.write(history_record(row, columns))
+            output.flush()
+    
+    log.debug(f"Exported {writer.count} history rows as {fmt}")
+    return writer.count
+
 def view_sheets_history(sheets_manager: SheetsManager) -> None:
     """View Google Sheets sync history"""
     try:
         last_sync = sheets_manager.get_last_sync_time()
-        if last_sync:
-            console.print(f"\n📅 Last sync: {last_sync}", style="bold blue")
-        else:
+        if not last_sync:
             console.print("\n⚠️ No sync history found", style="yellow")
+            input("\nPress Enter to continue...")
+            return
+        
+        console.print(f"\n📅 Last sync: {last_sync}", style="bold blue")
+        
+        # Only partitions overlapping the last week are read
+        since = (datetime.now() - timedelta(days=7)).isoformat()
+        syncs = Counter(row[0] for row in sheets_manager.get_history(start=since))
+        
+        table = Table(title="Recent Syncs (last 7 days)")
+        table.add_column("Timestamp", style="cyan")
+        table.add_column("Profiles", style="green")
+        for timestamp, count in sorted(syncs.items(), reverse=True)[:10]:
+            table.add_row(timestamp, str(count))
+        
+        console.print("\n")
+        console.print(table)
     except Exception as e:
         log.error(f"Error viewing sheets history: {e}")
         console.print(f"\n❌ Error: {e}", style="bold red")
     
-    input("\nPress Enter to continue...")
\ No newline at end of file
+    input("\nPress Enter to continue...")
+
+def view_analytics(sheets_manager: SheetsManager,
+                   aggregates: ProfileAggregates) -> None:
+    """View stale-profile and shared-account reports from the running aggregates"""
+    try:
+        if not aggregates.rows:
+            console.print("\n📈 No analytics yet; building from sheet history...",
+                          style="bold blue")
+            aggregates.catch_up(sheets_manager, rebuild=True)
+        elif Confirm.ask(
+            f"\nInclude rows synced by other hosts since {aggregates.caught_up}?",
+            default=False
+        ):
+            aggregates.catch_up(sheets_manager)
+        
+        days = IntPrompt.ask("Stale after how many days", default=90)
+        min_hosts = IntPrompt.ask("Shared accounts seen on at least N hosts", default=2)
+        
+        page_table(
+            f"🕸️ Profiles not used in {days} days",
+            [("Host", "cyan"), ("User", "green"), ("Profile", "blue"),
+             ("Email", "white"), ("Last Used", "magenta"), ("Last Seen", "yellow")],
+            aggregates.stale_profiles(days),
+            lambda p: [p['hostname'], p['username'], p['profile'], p['email'],
+                       p['last_used'] or 'Never', p['last_seen']]
+        )
+        page_table(
+            f"🔗 Accounts on {min_hosts}+ hosts",
+            [("Email", "cyan"), ("Hosts", "green"), ("First Seen", "magenta"),
+             ("Last Seen", "yellow")],
+            aggregates.shared_accounts(min_hosts),
+            lambda e: [e['email'],
+                       f"{len(e['hosts'])} ({', '.join(sorted(e['hosts']))})",
+                       e['first_seen'], e['last_seen']]
+        )
+        
+    except Exception as e:
+        log.error(f"Error viewing analytics: {e}")
+        console.print(f"\n❌ Error: {e}", style="bold red")
+    
+    input("\nPress Enter to continue...")
@@ -27,6 +27,34 @@ class EnvManager:
         'CHROME_MANAGER_CREDENTIALS': {
             'default': str(Path(__file__).parent / 'credentials' / 'service_account.json'),
             'description': 'Path to service account credentials'
+        },
+        'CHROME_MANAGER_PARTITION_MODE': {
+            'default': '',
+            'description': 'Sheet partitioning (empty, monthly or rows)'
+        },
+        'CHROME_MANAGER_PARTITION_ROWS': {
+            'default': '50000',
+            'description': 'Rows per partition when partitioning by rows'
+        },
+        'CHROME_MANAGER_SHEET_LAYOUT': {
+            'default': 'wide',
+            'description': 'Sheet layout (wide or normalized with a Hosts sheet)'
+        },
+        'CHROME_MANAGER_CURRENT_STATE': {
+            'default': '1',
+            'description': (
+                'Keep a Current State worksheet of the latest profiles (1 or 0)'
+            )
+        },
+        'CHROME_MANAGER_HOST_SUMMARY': {
+            'default': '1',
+            'description': 'Keep a Host Summary worksheet for dashboards (1 or 0)'
+        },
+        'CHROME_MANAGER_SYNC_TARGETS': {
+            'default': '',
+            'description': (
+                'Extra sync targets (comma-separated spreadsheet_id[:worksheet])'
+            )
         }
     }
     
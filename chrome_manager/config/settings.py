@@ -4,6 +4,7 @@ cli/config/settings.py
 """
 
 import os
+import tempfile
 from pathlib import Path
 
 # Application Information
@@ -28,14 +29,60 @@ CREDENTIALS_PATH = Path(os.getenv(
 ))
 SPREADSHEET_ID = os.getenv('CHROME_MANAGER_SPREADSHEET_ID', '')
 
+# Per-user run directory (0700) for single-flight locks and shared backoff
+RUN_DIR = Path(os.getenv('CHROME_MANAGER_RUN_DIR') or Path(
+    os.getenv('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+) / f"chrome-manager-{os.getuid()}")
+
 # Chrome Configuration
 CHROME_CONFIG_PATH = Path.home() / '.config' / 'google-chrome'
 
+# Record each profile's disk usage (cached by directory mtime under tmp/disk_usage)
+MEASURE_DISK_USAGE = os.getenv('CHROME_MANAGER_DISK_USAGE', '1') == '1'
+
+# Record extension/bookmark counts and History size (sources re-read only when changed)
+COLLECT_INVENTORY = os.getenv('CHROME_MANAGER_INVENTORY', '1') == '1'
+
+# Host Sweep Configuration (0 workers means one per CPU)
+SWEEP_HOME_ROOT = Path(os.getenv('CHROME_MANAGER_HOME_ROOT', '/home'))
+SWEEP_WORKERS = int(os.getenv('CHROME_MANAGER_SWEEP_WORKERS', '0'))
+
+# Scanned profiles buffered ahead of the snapshot writer and uploader
+SCAN_QUEUE_SIZE = int(os.getenv('CHROME_MANAGER_SCAN_QUEUE_SIZE', '256'))
+
 # Sheet Management Configuration
 DEFAULT_RETENTION_DAYS = int(os.getenv('CHROME_MANAGER_RETENTION_DAYS', '30'))
 WORKSHEET_NAME = "Chrome Profiles"
 MAX_ROWS = 1000
 
+# Partitioning Configuration ('' disables, 'monthly' or 'rows' enables rollover)
+PARTITION_MODE = os.getenv('CHROME_MANAGER_PARTITION_MODE', '')
+PARTITION_ROWS = int(os.getenv('CHROME_MANAGER_PARTITION_ROWS', '50000'))
+
+# Sheet layout ('wide' repeats host columns per row, 'normalized' uses a Hosts sheet)
+SHEET_LAYOUT = os.getenv('CHROME_MANAGER_SHEET_LAYOUT', 'wide')
+
+# Keep a "Current State" worksheet with the latest row of every profile
+CURRENT_STATE = os.getenv('CHROME_MANAGER_CURRENT_STATE', '1') == '1'
+
+# Keep a "Host Summary" worksheet of per-host profile counts for dashboards
+HOST_SUMMARY = os.getenv('CHROME_MANAGER_HOST_SUMMARY', '1') == '1'
+
+# Cells of Sheets reads cached in memory (validated by revision; 0 disables)
+READ_CACHE_CELLS = int(os.getenv('CHROME_MANAGER_READ_CACHE_CELLS', '250000'))
+
+# Append chunking (each chunk is one batchUpdate request, committed in order)
+APPEND_CHUNK_ROWS = int(os.getenv('CHROME_MANAGER_APPEND_CHUNK_ROWS', '5000'))
+APPEND_CHUNK_BYTES = int(os.getenv('CHROME_MANAGER_APPEND_CHUNK_BYTES', '2000000'))
+
+# Fan-out Configuration (comma-separated "spreadsheet_id[:worksheet]" extra targets)
+SYNC_TARGETS = os.getenv('CHROME_MANAGER_SYNC_TARGETS', '')
+FANOUT_WORKERS = int(os.getenv('CHROME_MANAGER_FANOUT_WORKERS', '4'))
+FANOUT_TIMEOUT = float(os.getenv('CHROME_MANAGER_FANOUT_TIMEOUT', '120'))
+
+# Display Configuration
+PAGE_SIZE = int(os.getenv('CHROME_MANAGER_PAGE_SIZE', '25'))
+
 # Error Messages
 ERROR_MESSAGES = {
     'no_chrome': "❌ Chrome configuration not found",
@@ -80,5 +127,11 @@ def get_env_settings() -> dict:
         'log_level': LOG_LEVEL,
         'credentials_path': str(CREDENTIALS_PATH),
         'spreadsheet_id': SPREADSHEET_ID,
-        'retention_days': DEFAULT_RETENTION_DAYS
+        'retention_days': DEFAULT_RETENTION_DAYS,
+        'partition_mode': PARTITION_MODE,
+        'partition_rows': PARTITION_ROWS,
+        'sheet_layout': SHEET_LAYOUT,
+        'current_state': CURRENT_STATE,
+        'host_summary': HOST_SUMMARY,
+        'sync_targets': SYNC_TARGETS
     }
\ No newline at end of file
@@ -0,0 +1,286 @@
+"""
+chrome_manager/core/analytics.py
+📈 Running profile aggregates maintained from synced rows
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+log = logging.getLogger("analytics")
+
+# Column positions in SheetsManager.SHEET_CONFIG['headers'] order
+TIMESTAMP, HOSTNAME, PROFILE_NAME, PROFILE_EMAIL, PROFILE_TYPE, LAST_USED, USERNAME = (
+    0, 1, 6, 7, 8, 10, 11
+)
+
+def _max(current: Optional[str], value: str) -> Optional[str]:
+    return value if value and (current is None or value > current) else current
+
+def _min(current: Optional[str], value: str) -> Optional[str]:
+    return value if value and (current is None or value < current) else current
+
+class ProfileAggregates:
+    """
+    📈 Per-profile, per-email and per-host aggregates of the sync log
+
+    Every aggregate is a min, max or set union, so rows applied both as
+    this host commits them and again by a catch-up leave the result
+    unchanged. Catch-ups read each log worksheet from the row position
+    they last stopped at, so rows committed later with older timestamps
+    (other hosts' delayed syncs, backfills) are still picked up, and
+    committed rows are applied at most once per sync ID. Reports read
+    only the aggregates, never the sheet.
+
+    Sync IDs applied by the row listener are only kept until a catch-up
+    has read past their rows (and at most MAX_SYNCED of them), and rows
+    applied by the listener are persisted by flush() once per sync.
+    """
+
+    # Sync IDs remembered between catch-ups; forgetting one early at worst
+    # applies its rows twice, which leaves the aggregates unchanged
+    MAX_SYNCED = 10000
+
+    def __init__(self, path: Path = Path("tmp") / "analytics.json"):
+        """
+        Initialize aggregates
+
+        Args:
+            path: JSON file the aggregates are persisted to
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self.emails: Dict[str, Dict[str, Any]] = {}
+        self.hosts: Dict[str, Dict[str, Any]] = {}    # By "hostname|username"
+        # Per log worksheet: data rows read by catch-ups and the last one read
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        # Sync IDs applied as they were committed, oldest first
+        self.synced: Dict[str, None] = {}
+        self.caught_up: Optional[str] = None  # Time of the last catch-up
+        self._dirty = False  # Rows applied since the last save
+        self.load()
+
+    # --------------------------------------------------------------- state
+
+    def load(self) -> bool:
+        """📂 Load persisted aggregates (returns False if there are none)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable analytics state: {e}")
+            return False
+
+        self.profiles = state.get('profiles', {})
+        self.emails = state.get('emails', {})
+        self.hosts = state.get('hosts', {})
+        self.positions = state.get('positions', {})
+        self.synced = dict.fromkeys(state.get('synced', []))
+        self.caught_up = state.get('caught_up')
+        return True
+
+    def save(self) -> None:
+        """💾 Atomically persist the aggregates"""
+        with self._lock:
+            state = {
+                'caught_up': self.caught_up,
+                'positions': self.positions,
+                'synced': list(self.synced),
+                'profiles': self.profiles,
+                'emails': self.emails,
+                'hosts': self.hosts,
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.path.with_suffix('.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, separators=(',', ':'))
+                os.replace(tmp_file, self.path)
+                self._dirty = False
+            except OSError as e:
+                log.error(f"Could not save analytics state: {e}")
+
+    def reset(self) -> None:
+        """Drop all aggregates"""
+        with self._lock:
+            self.profiles, self.emails, self.hosts = {}, {}, {}
+            self.positions, self.synced, self.caught_up = {}, {}, None
+
+    @property
+    def rows(self) -> int:
+        """Log rows read by catch-ups"""
+        return sum(mark['rows'] for mark in self.positions.values())
+
+    # -------------------------------------------------------------- update
+
+    def update(self, rows: Iterable[Sequence[str]],
+               sync_id: Optional[str] = None) -> int:
+        """
+        ➕ Fold a batch of synced rows into the aggregates
+
+        Args:
+            rows: Rows in SheetsManager.SHEET_CONFIG['headers'] order
+            sync_id: Sync ID the rows were committed under; rows of a sync
+                already applied are ignored
+
+        Returns:
+            Number of rows applied
+        """
+        applied = 0
+        with self._lock:
+            if sync_id is not None:
+                if sync_id in self.synced:
+                    return 0
+                self.synced[sync_id] = None
+                while len(self.synced) > self.MAX_SYNCED:
+                    del self.synced[next(iter(self.synced))]
+            for row in rows:
+                if len(row) <= PROFILE_NAME or not row[TIMESTAMP]:
+                    continue
+                row = list(row) + [''] * (USERNAME + 1 - len(row))
+                seen = row[TIMESTAMP]
+                hostname, username = row[HOSTNAME], row[USERNAME]
+
+                host = self.hosts.setdefault(
+                    f"{hostname}|{username}", {'first_seen': None, 'last_seen': None}
+                )
+                host['first_seen'] = _min(host['first_seen'], seen)
+                host['last_seen'] = _max(host['last_seen'], seen)
+
+                key = '|'.join((hostname, username, row[PROFILE_NAME]))
+                profile = self.profiles.setdefault(key, {
+                    'hostname': hostname, 'username': username,
+                    'profile': row[PROFILE_NAME], 'email': '',
+                    'first_seen': None, 'last_seen': None, 'last_used': None,
+                })
+                if seen >= (profile['last_seen'] or ''):
+                    profile['email'] = row[PROFILE_EMAIL]
+                profile['first_seen'] = _min(profile['first_seen'], seen)
+                profile['last_seen'] = _max(profile['last_seen'], seen)
+                profile['last_used'] = _max(profile['last_used'], row[LAST_USED])
+
+                if row[PROFILE_TYPE] != 'Local' and row[PROFILE_EMAIL]:
+                    email = self.emails.setdefault(row[PROFILE_EMAIL], {
+                        'hosts': [], 'first_seen': None, 'last_seen': None,
+                    })
+                    if hostname not in email['hosts']:
+                        email['hosts'].append(hostname)
+                    email['first_seen'] = _min(email['first_seen'], seen)
+                    email['last_seen'] = _max(email['last_seen'], seen)
+
+                applied += 1
+        return applied
+
+    def on_rows(self, rows: List[List[str]], sync_id: str) -> None:
+        """SheetsManager row listener: apply committed rows (saved by flush)"""
+        if self.update(rows, sync_id):
+            self._dirty = True
+
+    def flush(self) -> None:
+        """SheetsManager sync listener: persist rows applied during the sync"""
+        if self._dirty:
+            self.save()
+
+    def _catch_up_sheet(self, sheets_manager: Any, name: str) -> int:
+        """Apply a log worksheet's rows past its recorded position"""
+        mark = self.positions.get(name) or {'rows': 0, 'last': None}
+        position, last = mark['rows'], mark['last']
+        chunks = sheets_manager.iter_log_rows(name, max(position - 1, 0))
+        if position:
+            # Re-read the last row applied to make sure nothing above it moved
+            first = next(chunks, [])
+            if first[:1] != [last]:
+                log.warning(
+                    f"Rows of {name} moved since the last catch-up; re-reading it"
+                )
+                chunks.close()
+                position, last = 0, None
+                chunks = sheets_manager.iter_log_rows(name)
+            else:
+                chunks = chain([first[1:]], chunks)
+
+        applied = 0
+        for rows in chunks:
+            if rows:
+                applied += self.update(rows)
+                position += len(rows)
+                last = list(rows[-1])
+        with self._lock:
+            self.positions[name] = {'rows': position, 'last': last}
+        return applied
+
+    def catch_up(self, sheets_manager: Any, rebuild: bool = False) -> int:
+        """
+        🔄 Apply rows appended to the log since the last catch-up
+
+        Args:
+            sheets_manager: SheetsManager to stream the log from
+            rebuild: Discard the aggregates and replay the whole log
+
+        Returns:
+            Number of rows applied
+        """
+        if rebuild:
+            self.reset()
+        with self._lock:
+            # Rows of syncs applied so far are below the positions reached now
+            covered = list(self.synced)
+        applied = 0
+        for name in sheets_manager.log_worksheets():
+            applied += self._catch_up_sheet(sheets_manager, name)
+        with self._lock:
+            for sync_id in covered:
+                self.synced.pop(sync_id, None)
+        self.caught_up = datetime.now().isoformat(timespec='seconds')
+        self.save()
+        log.debug(f"Applied {applied} rows ({self.rows} read in total)")
+        return applied
+
+    # ------------------------------------------------------------- reports
+
+    def stale_profiles(self, days: int = 90, now: Optional[datetime] = None,
+                       current_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        🕸️ Profiles not used within the last N days, by host
+
+        Args:
+            days: Staleness threshold
+            now: Reference time (defaults to now)
+            current_only: Only profiles present in their host user's latest sync
+
+        Returns:
+            Profile aggregates ordered by hostname, then oldest use first
+        """
+        cutoff = ((now or datetime.now()) - timedelta(days=days)).isoformat()
+        stale = [
+            profile for profile in self.profiles.values()
+            if (profile['last_used'] or '') < cutoff
+            and (not current_only
+                 or profile['last_seen'] == self.hosts.get(
+                     f"{profile['hostname']}|{profile['username']}", {}
+                 ).get('last_seen'))
+        ]
+        return sorted(
+            stale, key=lambda p: (p['hostname'], p['last_used'] or '', p['profile'])
+        )
+
+    def shared_accounts(self, min_hosts: int = 2) -> List[Dict[str, Any]]:
+        """
+        🔗 Signed-in accounts seen on at least N hosts
+
+        Returns:
+            Dicts with email, hosts, first_seen and last_seen, most hosts first
+        """
+        shared = [
+            dict(aggregate, email=email) for email, aggregate in self.emails.items()
+            if len(aggregate['hosts']) >= min_hosts
+        ]
+        return sorted(shared, key=lambda e: (-len(e['hosts']), e['email']))
@@ -0,0 +1,208 @@
+"""
+chrome_manager/core/batch.py
+📦 Collects all worksheet writes of one sync into a single batchUpdate
+"""
+
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional,
+    Sequence, Tuple
+)
+
+def to_cell(value: Any) -> Dict[str, Any]:
+    """Convert a Python value to a CellData userEnteredValue"""
+    if value is None or value == '':
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)):
+        return {'userEnteredValue': {'numberValue': value}}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
+def to_row_data(rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Convert rows of values to RowData"""
+    return [{'values': [to_cell(value) for value in row]} for row in rows]
+
+class RowChunk(NamedTuple):
+    """📦 A run of rows with their encoded RowData and request size"""
+    rows: List[List[Any]]
+    row_data: List[Dict[str, Any]]
+    size: int
+
+def _encode_rows(rows: List[List[Any]]) -> List[Tuple[List[Any], Dict[str, Any], int]]:
+    """Encode rows to RowData with the size each adds to a request"""
+    return [
+        (row, data, len(json.dumps(data, separators=(',', ':')).encode('utf-8')) + 1)
+        for row, data in zip(rows, to_row_data(rows))
+    ]
+
+def encode_chunk(rows: Sequence[List[Any]]) -> RowChunk:
+    """Encode rows as one chunk, however large"""
+    encoded = _encode_rows(list(rows))
+    return RowChunk(
+        [row for row, _, _ in encoded], [data for _, data, _ in encoded],
+        sum(size for _, _, size in encoded)
+    )
+
+def _iter_encoded(rows: Iterable[List[Any]], slice_rows: int,
+                  workers: int) -> Iterator[Tuple[List[Any], Dict[str, Any], int]]:
+    """Encode rows slice by slice on a pool, at most `workers` slices ahead"""
+    pending: Deque = deque()
+    rows = iter(rows)
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="row-encoder"
+    ) as executor:
+        while True:
+            rows_slice = list(islice(rows, slice_rows))
+            if not rows_slice:
+                break
+            pending.append(executor.submit(_encode_rows, rows_slice))
+            if len(pending) > workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def iter_row_chunks(rows: Iterable[List[Any]], max_rows: int, max_bytes: int,
+                    workers: int = 2) -> Iterator[RowChunk]:
+    """
+    ✂️ Split rows into encoded chunks bounded by row count and byte size
+
+    Rows are encoded in slices on a small thread pool, at most `workers`
+    slices ahead of the consumer, and packed greedily into chunks in row
+    order. Boundaries depend only on the rows and limits, so re-chunking
+    the same rows gives the same chunks.
+
+    Args:
+        rows: Rows of cell values (a generator is consumed lazily)
+        max_rows: Row limit per chunk
+        max_bytes: Encoded RowData limit per chunk (a single larger row
+            still forms its own chunk)
+        workers: Slices encoded ahead of the consumer
+
+    Yields:
+        RowChunk objects in row order
+    """
+    chunk_rows: List[List[Any]] = []
+    chunk_data: List[Dict[str, Any]] = []
+    chunk_size = 0
+    for row, data, size in _iter_encoded(rows, max_rows, max(1, workers)):
+        full = len(chunk_rows) >= max_rows or chunk_size + size > max_bytes
+        if chunk_rows and full:
+            yield RowChunk(chunk_rows, chunk_data, chunk_size)
+            chunk_rows, chunk_data, chunk_size = [], [], 0
+        chunk_rows.append(row)
+        chunk_data.append(data)
+        chunk_size += size
+    if chunk_rows:
+        yield RowChunk(chunk_rows, chunk_data, chunk_size)
+
+class SheetBatch:
+    """
+    📦 Pending spreadsheets:batchUpdate requests for one sync
+
+    Requests are applied by the API in order and atomically, so data rows
+    and any bookkeeping written alongside them land together or not at all.
+    Callbacks registered with on_commit run only after a successful commit.
+    """
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+        self.sheet_ids: Dict[str, int] = {}      # Sheets added by this batch
+        self.sync_ids: List[str] = []            # Syncs carried by this batch
+        self._callbacks: List[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def add_sheet(self, sheet_id: int, title: str, headers: Sequence[str],
+                  rows: int = 1000) -> None:
+        """➕ Create a worksheet with a header row"""
+        self.requests.append({
+            'addSheet': {
+                'properties': {
+                    'sheetId': sheet_id,
+                    'title': title,
+                    'gridProperties': {'rowCount': rows, 'columnCount': len(headers)}
+                }
+            }
+        })
+        self.sheet_ids[title] = sheet_id
+        self.update_rows(sheet_id, 0, [headers])
+
+    def append_rows(self, sheet_id: int, rows: Sequence[Sequence[Any]],
+                    row_data: Optional[List[Dict[str, Any]]] = None) -> None:
+        """📝 Append rows (or their encoded RowData) after the last row with data"""
+        if not rows:
+            return
+        self.requests.append({
+            'appendCells': {
+                'sheetId': sheet_id,
+                'rows': row_data if row_data is not None else to_row_data(rows),
+                'fields': 'userEnteredValue'
+            }
+        })
+
+    def update_rows(self, sheet_id: int, row_index: int, rows: Sequence[Sequence[Any]],
+                    column_index: int = 0) -> None:
+        """✏️ Overwrite cells starting at a 0-based row/column"""
+        if not rows:
+            return
+        self.requests.append({
+            'updateCells': {
+                'start': {
+                    'sheetId': sheet_id, 'rowIndex': row_index,
+                    'columnIndex': column_index
+                },
+                'rows': to_row_data(rows),
+                'fields': 'userEnteredValue'
+            }
+        })
+
+    def delete_rows(self, sheet_id: int, start: int, end: int) -> None:
+        """🗑️ Delete rows [start, end) (0-based); later rows shift up"""
+        self.requests.append({
+            'deleteDimension': {
+                'range': {
+                    'sheetId': sheet_id, 'dimension': 'ROWS',
+                    'startIndex': start, 'endIndex': end
+                }
+            }
+        })
+
+    def append_columns(self, sheet_id: int, count: int) -> None:
+        """➕ Add columns to the right of a worksheet's grid"""
+        self.requests.append({
+            'appendDimension': {
+                'sheetId': sheet_id, 'dimension': 'COLUMNS', 'length': count
+            }
+        })
+
+    def clear_sheet(self, sheet_id: int) -> None:
+        """🧹 Clear all values in a worksheet"""
+        self.requests.append({
+            'updateCells': {
+                'range': {'sheetId': sheet_id},
+                'fields': 'userEnteredValue'
+            }
+        })
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Register local state updates to apply once the batch is committed"""
+        self._callbacks.append(callback)
+
+    def committed(self) -> None:
+        """Run on_commit callbacks in registration order"""
+        for callback in self._callbacks:
+            callback()
+        self._callbacks = []
+
+    def body(self) -> Dict[str, Any]:
+        """Request body for spreadsheets:batchUpdate"""
+        return {'requests': self.requests}
+
+    def sheet_id(self, title: str) -> Optional[int]:
+        """Sheet ID of a worksheet added by this batch"""
+        return self.sheet_ids.get(title)
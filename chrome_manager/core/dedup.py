@@ -0,0 +1,60 @@
+"""
+chrome_manager/core/dedup.py
+🔁 Sync IDs and the local ledger of committed syncs
+"""
+
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Set
+
+log = logging.getLogger("dedup")
+
+def make_sync_id(*parts: object) -> str:
+    """🔑 Deterministic sync ID from the values identifying a batch"""
+    digest = hashlib.sha1('\x1f'.join(str(part) for part in parts).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+class SyncLedger:
+    """📒 Append-only local record of sync IDs known to be committed"""
+
+    def __init__(self, path: Path):
+        """
+        Initialize ledger
+
+        Args:
+            path: Text file holding one committed sync ID per line
+        """
+        self.path = path
+        self._ids: Optional[Set[str]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Set[str]:
+        """Read the ledger file once"""
+        if self._ids is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._ids = {line.strip() for line in f if line.strip()}
+            except FileNotFoundError:
+                self._ids = set()
+            log.debug(f"Loaded {len(self._ids)} committed sync IDs from {self.path}")
+        return self._ids
+
+    def __contains__(self, sync_id: str) -> bool:
+        with self._lock:
+            return sync_id in self._load()
+
+    def add(self, sync_id: str) -> None:
+        """✍️ Record a committed sync ID"""
+        with self._lock:
+            ids = self._load()
+            if sync_id in ids:
+                return
+            ids.add(sync_id)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(f"{sync_id}\n")
+            except OSError as e:
+                log.warning(f"Could not persist sync ID {sync_id}: {e}")
@@ -0,0 +1,161 @@
+"""
+chrome_manager/core/disk_usage.py
+💽 Parallel, mtime-cached disk usage of profile directories
+"""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+log = logging.getLogger("disk_usage")
+
+def cache_path_for(config_path: Path, root: Path = Path("tmp") / "disk_usage") -> Path:
+    """📍 Cache file under root for one browser config directory"""
+    digest = hashlib.sha1(str(config_path).encode('utf-8')).hexdigest()[:12]
+    return root / f"{digest}.json"
+
+class DiskUsage:
+    """
+    💽 Measures directory trees, re-listing only directories that changed
+
+    For every directory the cache keeps its mtime, the allocated size of
+    the directory and the files directly in it, and its subdirectories.
+    Adding, removing or renaming an entry changes a directory's mtime, so
+    an unchanged directory costs one lstat instead of a scandir plus a
+    stat per file.
+
+    Files that grow or shrink in place (History, Cookies, cache blocks)
+    do not touch the directory mtime, so their directory's size can be
+    stale by up to max_age (a day by default), after which it is
+    re-listed regardless. Each level of the tree is visited in parallel
+    on a thread pool shared by every measure() of a scan and stopped by
+    close().
+    """
+
+    def __init__(self, cache_path: Path, workers: int = 8, max_age: float = 86400.0):
+        """
+        Initialize disk usage meter
+
+        Args:
+            cache_path: JSON file holding per-directory entries
+            workers: Threads listing directories in parallel
+            max_age: Seconds before an unchanged directory is re-listed anyway
+        """
+        self.cache_path = cache_path
+        self.workers = workers
+        self.max_age = max_age
+        self._cache: Dict[str, list] = self._load()
+        self._fresh: Dict[str, list] = {}
+        self._roots: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _load(self) -> Dict[str, list]:
+        """Read cached directory entries"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable disk usage cache: {e}")
+            return {}
+
+    def _visit(self, path: str) -> Tuple[int, List[str]]:
+        """Own file bytes and subdirectories of one directory"""
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return 0, []
+
+        now = time.time()
+        mtime_ns = st.st_mtime_ns
+        entry = self._cache.get(path)
+        if entry and entry[0] == mtime_ns and now - entry[3] < self.max_age:
+            self._fresh[path] = entry
+            return entry[1], [os.path.join(path, name) for name in entry[2]]
+
+        own, subdirs = getattr(st, 'st_blocks', 0) * 512, []
+        try:
+            with os.scandir(path) as entries:
+                for item in entries:
+                    try:
+                        if item.is_dir(follow_symlinks=False):
+                            subdirs.append(item.name)
+                        elif item.is_file(follow_symlinks=False):
+                            st = item.stat(follow_symlinks=False)
+                            own += getattr(st, 'st_blocks', 0) * 512 or st.st_size
+                    except OSError:
+                        continue
+        except OSError as e:
+            log.debug(f"Cannot list {path}: {e}")
+            return 0, []
+
+        self._fresh[path] = [mtime_ns, own, subdirs, now]
+        return own, [os.path.join(path, name) for name in subdirs]
+
+    def measure(self, path: Path) -> Optional[int]:
+        """
+        📏 Allocated bytes under a directory
+
+        Sizes of directories unchanged since the cached listing are reused,
+        so in-place growth of their files shows up within max_age.
+
+        Args:
+            path: Directory to measure (symlinks are not followed)
+
+        Returns:
+            Total bytes, or None if path is not a directory
+        """
+        root = str(path)
+        try:
+            if not stat.S_ISDIR(os.lstat(root).st_mode):
+                return None
+        except OSError:
+            return None
+
+        self._roots.add(root)
+        total = 0
+        frontier = [root]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="disk-usage"
+            )
+        while frontier:
+            level, frontier = frontier, []
+            for own, children in self._executor.map(self._visit, level):
+                total += own
+                frontier.extend(children)
+
+        log.debug(f"{root}: {total} bytes")
+        return total
+
+    def close(self) -> None:
+        """🛑 Stop the listing threads (a later measure() starts new ones)"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def save(self) -> None:
+        """💾 Persist the cache, dropping vanished directories under measured roots"""
+        measured = tuple(self._roots)
+        prefixes = tuple(root + os.sep for root in measured)
+        cache = {
+            path: entry for path, entry in self._cache.items()
+            if path not in measured and not path.startswith(prefixes)
+        }
+        cache.update(self._fresh)
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_path.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, separators=(',', ':'))
+            os.replace(tmp_file, self.cache_path)
+            self._cache, self._fresh, self._roots = cache, {}, set()
+        except OSError as e:
+            log.warning(f"Could not save disk usage cache: {e}")
@@ -0,0 +1,169 @@
+"""
+chrome_manager/core/fanout.py
+🌐 Concurrent sync of one batch to several spreadsheets/worksheets
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from chrome_manager.core.records import ProfileLike
+from chrome_manager.core.sheets import SheetsManager
+
+log = logging.getLogger("fanout")
+
+class SyncTarget(NamedTuple):
+    """🎯 One spreadsheet (and optional log worksheet) to sync to"""
+    spreadsheet_id: str
+    worksheet: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        if self.worksheet:
+            return f"{self.spreadsheet_id}:{self.worksheet}"
+        return self.spreadsheet_id
+
+class TargetResult(NamedTuple):
+    """📋 Outcome of syncing to one target"""
+    target: SyncTarget
+    ok: bool
+    elapsed: float
+    error: Optional[str] = None
+
+def parse_targets(spec: str) -> List[SyncTarget]:
+    """
+    Parse a comma-separated "spreadsheet_id[:worksheet]" list
+
+    Args:
+        spec: e.g. "abc123,def456:Audit Log"
+
+    Returns:
+        List of SyncTarget
+    """
+    targets = []
+    for item in spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        spreadsheet_id, _, worksheet = item.partition(':')
+        targets.append(SyncTarget(spreadsheet_id.strip(), worksheet.strip() or None))
+    return targets
+
+class MultiTargetSync:
+    """
+    🌐 Writes the same sync batch to several targets on a bounded pool
+
+    Each target gets its own SheetsManager (and HTTP session), created on
+    first use inside a worker so a slow or unreachable spreadsheet never
+    delays the others. A sync waits at most `timeout` seconds; targets
+    still running then are reported as timed out and skipped by later
+    syncs until they finish.
+    """
+
+    def __init__(self, credentials_path: Path, targets: Iterable[SyncTarget],
+                 max_workers: int = 4, timeout: float = 120.0,
+                 managers: Optional[Dict[SyncTarget, SheetsManager]] = None,
+                 manager_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Initialize multi-target sync
+
+        Args:
+            credentials_path: Path to service account credentials
+            targets: Spreadsheets/worksheets to sync to
+            max_workers: Upper bound on concurrent target writes
+            timeout: Seconds a sync waits for all targets
+            managers: Already-initialized managers to reuse for some targets
+            manager_kwargs: Extra SheetsManager arguments for new managers
+        """
+        self.credentials_path = credentials_path
+        self.targets = list(dict.fromkeys(targets))
+        self.timeout = timeout
+        self.manager_kwargs = manager_kwargs or {}
+        self._managers: Dict[SyncTarget, SheetsManager] = dict(managers or {})
+        self._busy: set = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(self.targets))),
+            thread_name_prefix="sheets-target"
+        )
+
+    def _get_manager(self, target: SyncTarget) -> SheetsManager:
+        """Get or create the manager for a target"""
+        manager = self._managers.get(target)
+        if manager is None:
+            manager = SheetsManager(
+                credentials_path=self.credentials_path,
+                spreadsheet_id=target.spreadsheet_id,
+                worksheet_name=target.worksheet,
+                **self.manager_kwargs
+            )
+            self._managers[target] = manager
+        return manager
+
+    def _sync_one(self, target: SyncTarget, profiles: List[ProfileLike],
+                  system_info: Dict, timestamp: str) -> TargetResult:
+        """Sync to one target (runs in a worker thread)"""
+        started = time.monotonic()
+        try:
+            manager = self._get_manager(target)
+            ok = manager.update_profiles(profiles, system_info, timestamp)
+            error = None if ok else "update failed"
+        except Exception as e:
+            ok, error = False, str(e)
+        finally:
+            with self._lock:
+                self._busy.discard(target)
+
+        elapsed = time.monotonic() - started
+        log.debug(f"Target {target.label}: {'ok' if ok else error} in {elapsed:.2f}s")
+        return TargetResult(target, ok, elapsed, error)
+
+    def sync(self, profiles: Iterable[ProfileLike], system_info: Dict,
+             timestamp: Optional[str] = None) -> List[TargetResult]:
+        """
+        🚀 Write one batch to every target concurrently
+
+        Args:
+            profiles: Profile records (or tmp-file dicts)
+            system_info: Sheet-formatted system info
+            timestamp: Sync timestamp shared by all targets (defaults to now)
+
+        Returns:
+            TargetResult per target, in configured order
+        """
+        profiles = list(profiles)
+        timestamp = timestamp or datetime.now().isoformat()
+        started = time.monotonic()
+
+        futures = {}
+        results: Dict[SyncTarget, TargetResult] = {}
+        for target in self.targets:
+            with self._lock:
+                if target in self._busy:
+                    results[target] = TargetResult(
+                        target, False, 0.0, "previous sync still running"
+                    )
+                    continue
+                self._busy.add(target)
+            futures[target] = self._executor.submit(
+                self._sync_one, target, profiles, system_info, timestamp
+            )
+
+        wait(futures.values(), timeout=self.timeout)
+        for target, future in futures.items():
+            if future.done():
+                results[target] = future.result()
+            else:
+                elapsed = time.monotonic() - started
+                log.warning(f"Target {target.label} still running after {elapsed:.0f}s")
+                results[target] = TargetResult(target, False, elapsed, "timed out")
+
+        return [results[target] for target in self.targets]
+
+    def close(self) -> None:
+        """Release worker threads without waiting for stragglers"""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,145 @@
+"""
+chrome_manager/core/keyed.py
+🗝️ Worksheets addressed by key columns and upserted in place
+"""
+
+import logging
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence, Tuple
+
+from chrome_manager.core.batch import SheetBatch
+
+log = logging.getLogger("keyed")
+
+def _as_text(row: Sequence[Any]) -> List[str]:
+    """Row values as the worksheet returns them"""
+    return ['' if value is None else str(value) for value in row]
+
+class KeyedRows:
+    """
+    🗝️ Local mirror of a worksheet whose data rows are unique by key columns
+
+    The mirror is kept in step with the upserts this process commits, but
+    other writers move rows too, so callers re-load it from the worksheet
+    right before queueing an upsert; positions are only as current as
+    that read.
+    """
+
+    def __init__(self, name: str, key_columns: Sequence[int]):
+        """
+        Initialize keyed rows
+
+        Args:
+            name: Worksheet title
+            key_columns: 0-based columns that together identify a row
+        """
+        self.name = name
+        self.key_columns = tuple(key_columns)
+        self.rows: Optional[List[List[str]]] = None
+        self.index: Dict[Tuple[str, ...], int] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self.rows is not None
+
+    def key(self, row: Sequence[Any]) -> Tuple[str, ...]:
+        """Key of a row"""
+        return tuple(str(row[i]) if i < len(row) else '' for i in self.key_columns)
+
+    def load(self, values: List[List[str]]) -> None:
+        """📂 Replace the mirror with the worksheet's data rows (header excluded)"""
+        self.rows = [list(row) for row in values]
+        self._reindex()
+        log.debug(f"Indexed {len(self.index)} rows of {self.name}")
+
+    def invalidate(self) -> None:
+        """Forget the mirror so it is re-read before the next upsert"""
+        self.rows = None
+        self.index = {}
+
+    def _reindex(self) -> None:
+        self.index = {self.key(row): i for i, row in enumerate(self.rows or [])}
+
+    def queue_upsert(self, batch: SheetBatch, sheet_id: int,
+                     rows: Sequence[Sequence[Any]], scope: int = 0,
+                     seen: AbstractSet[Tuple[str, ...]] = frozenset()
+                     ) -> Tuple[int, int, int]:
+        """
+        ⬆️ Queue writes that make the worksheet reflect rows
+
+        Known keys are overwritten in place (one updateCells per contiguous
+        run), unknown keys appended. With a scope, every existing row whose
+        first `scope` key fields match an incoming row but whose key is not
+        among the incoming rows is deleted, bottom-up so the positions of
+        the rows above stay valid. Updates use positions from before the
+        deletions, so they are queued first and appends last. The mirror is
+        updated once the batch commits.
+
+        A row set upserted in several batches passes the keys of the
+        earlier ones as `seen` with its last batch, so the scope covers
+        the whole set.
+
+        Args:
+            batch: Batch to queue the writes into (mirror must be loaded)
+            sheet_id: Sheet ID of the worksheet
+            rows: Rows to write
+            scope: Leading key fields a row set replaces as a whole (0 = none)
+            seen: Keys of the same row set committed by earlier batches
+
+        Returns:
+            Tuple of (updated, deleted, appended) row counts
+        """
+        incoming = {self.key(row): list(row) for row in rows}
+        updates = sorted(
+            (self.index[key], row) for key, row in incoming.items() if key in self.index
+        )
+        appends = [row for key, row in incoming.items() if key not in self.index]
+        deletes: List[int] = []
+        if scope:
+            scopes = {key[:scope] for key in incoming} | {key[:scope] for key in seen}
+            deletes = sorted(
+                (i for key, i in self.index.items()
+                 if key[:scope] in scopes and key not in incoming and key not in seen),
+                reverse=True
+            )
+
+        run_start, run = 0, []
+        for i, row in updates:
+            if run and i != run_start + len(run):
+                batch.update_rows(sheet_id, run_start + 1, run)
+                run = []
+            if not run:
+                run_start = i
+            run.append(row)
+        batch.update_rows(sheet_id, run_start + 1, run)
+
+        run_end: Optional[int] = None
+        for i in deletes:
+            if run_end is not None and i != run_start - 1:
+                batch.delete_rows(sheet_id, run_start + 1, run_end + 1)
+                run_end = None
+            if run_end is None:
+                run_end = i + 1
+            run_start = i
+        if run_end is not None:
+            batch.delete_rows(sheet_id, run_start + 1, run_end + 1)
+
+        batch.append_rows(sheet_id, appends)
+
+        mirror = self.rows
+
+        def apply() -> None:
+            if self.rows is not mirror:
+                return  # Reloaded meanwhile; the fresh read wins
+            for i, row in updates:
+                mirror[i] = _as_text(row)
+            for i in deletes:
+                del mirror[i]
+            mirror.extend(_as_text(row) for row in appends)
+            self._reindex()
+        batch.on_commit(apply)
+
+        log.debug(
+            f"{self.name}: {len(updates)} updated, "
+            f"{len(deletes)} deleted, {len(appends)} added"
+        )
+        return len(updates), len(deletes), len(appends)
@@ -0,0 +1,138 @@
+"""
+chrome_manager/core/partitions.py
+🗂️ Time/size partitioning of the profile log across worksheets
+"""
+
+import logging
+from typing import List, NamedTuple, Optional, Tuple
+
+log = logging.getLogger("partitions")
+
+class Partition(NamedTuple):
+    """📋 One worksheet partition as recorded in the index sheet"""
+    name: str       # Worksheet title
+    start: str      # First sync timestamp stored in the partition
+    end: str        # Last sync timestamp stored in the partition
+    rows: int       # Number of data rows (excluding header)
+
+class PartitionIndex:
+    """🗂️ In-memory view of the partition index worksheet"""
+
+    MODES = ('monthly', 'rows')
+
+    def __init__(self, base_name: str, mode: str, max_rows: int):
+        """
+        Initialize partition index
+
+        Args:
+            base_name: Worksheet name the partition titles are derived from
+            mode: 'monthly' (one partition per calendar month) or
+                'rows' (a new partition every max_rows rows)
+            max_rows: Row limit per partition in 'rows' mode
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown partition mode: {mode}")
+        self.base_name = base_name
+        self.mode = mode
+        self.max_rows = max_rows
+        self.partitions: List[Partition] = []
+
+    def load(self, values: List[List[str]]) -> None:
+        """📥 Load partitions from index sheet rows (header excluded)"""
+        self.partitions = []
+        for row in values:
+            if not row or not row[0]:
+                continue
+            try:
+                rows = int(row[3]) if len(row) > 3 and row[3] else 0
+            except ValueError:
+                rows = 0
+            self.partitions.append(Partition(
+                name=row[0],
+                start=row[1] if len(row) > 1 else '',
+                end=row[2] if len(row) > 2 else '',
+                rows=rows
+            ))
+        log.debug(f"Loaded {len(self.partitions)} partitions")
+
+    def active(self) -> Optional[Partition]:
+        """Get the partition receiving writes (the one with the latest rows)"""
+        return max(self.partitions, key=lambda p: p.end) if self.partitions else None
+
+    def partition_name(self, timestamp: str) -> str:
+        """🏷️ Worksheet title for a new partition starting at timestamp"""
+        if self.mode == 'monthly':
+            return f"{self.base_name} {timestamp[:7]}"
+        return f"{self.base_name} {len(self.partitions) + 1:04d}"
+
+    def plan_write(self, timestamp: str, n_rows: int) -> Tuple[str, bool]:
+        """
+        🧭 Decide which partition a write of n_rows at timestamp goes to
+
+        A single sync is never split: in 'rows' mode an oversized batch
+        opens a fresh partition and lands there whole.
+
+        Returns:
+            Tuple of (partition name, True if the partition must be created)
+        """
+        active = self.active()
+        if active is None:
+            return self.partition_name(timestamp), True
+
+        if self.mode == 'monthly':
+            name = self.partition_name(timestamp)
+            if name != active.name:
+                return name, True
+        elif active.rows + n_rows > self.max_rows and active.rows > 0:
+            return self.partition_name(timestamp), True
+
+        return active.name, False
+
+    def preview_write(self, name: str, timestamp: str, n_rows: int,
+                      start: Optional[str] = None) -> Tuple[int, Partition]:
+        """
+        👀 Index entry a write would produce, without recording it
+
+        Args:
+            name: Partition written to
+            timestamp: Latest timestamp among the written rows
+            n_rows: Number of rows written
+            start: Earliest timestamp among the rows (defaults to timestamp)
+
+        Returns:
+            Tuple of (position in the index, updated partition entry);
+            position == len(partitions) means a new entry is appended
+        """
+        start = start or timestamp
+        for pos, partition in enumerate(self.partitions):
+            if partition.name == name:
+                return pos, partition._replace(
+                    start=min(partition.start, start) if partition.start else start,
+                    end=max(partition.end, timestamp),
+                    rows=partition.rows + n_rows
+                )
+        return len(self.partitions), Partition(name, start, timestamp, n_rows)
+
+    def record_write(self, name: str, timestamp: str, n_rows: int,
+                     start: Optional[str] = None) -> int:
+        """
+        ✍️ Record a completed write in the index
+
+        Returns:
+            Position of the partition in the index (0-based)
+        """
+        pos, partition = self.preview_write(name, timestamp, n_rows, start)
+        if pos == len(self.partitions):
+            self.partitions.append(partition)
+        else:
+            self.partitions[pos] = partition
+        return pos
+
+    def overlapping(self, start: Optional[str] = None,
+                    end: Optional[str] = None) -> List[Partition]:
+        """🔎 Partitions whose time range overlaps [start, end]"""
+        return [
+            p for p in self.partitions
+            if (end is None or not p.start or p.start <= end)
+            and (start is None or not p.end or p.end >= start)
+        ]
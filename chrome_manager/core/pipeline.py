@@ -0,0 +1,96 @@
+"""
+chrome_manager/core/pipeline.py
+🚰 Bounded hand-off between a producing generator and its consumer
+"""
+
+import logging
+import queue
+import threading
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+log = logging.getLogger("pipeline")
+
+T = TypeVar('T')
+
+_DONE = object()
+
+class _Failed:
+    """Producer exception carried across the queue"""
+    def __init__(self, error: BaseException):
+        self.error = error
+
+def bounded(source: Iterable[T], maxsize: int = 256,
+            name: str = "producer") -> Iterator[T]:
+    """
+    🚰 Run a generator on its own thread behind a bounded queue
+
+    The producer blocks once `maxsize` items wait for the consumer, so a
+    fast scanner never gets more than that far ahead of a slow uploader.
+    Producer exceptions are re-raised in the consumer, and a producer
+    thread that dies without reaching its source (e.g. a failing
+    threading.setprofile hook) raises RuntimeError rather than leaving the
+    consumer blocked; if the consumer stops early, the producer is stopped
+    at its next item.
+
+    Args:
+        source: Items to produce (iterated on the producer thread)
+        maxsize: Items buffered between producer and consumer
+        name: Producer thread name
+
+    Yields:
+        The source's items, in order
+    """
+    items: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in source:
+                if not put(item):
+                    log.debug(f"{name} stopped by its consumer")
+                    return
+        except BaseException as e:
+            put(_Failed(e))
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=produce, name=name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            try:
+                item = items.get(timeout=0.1)
+            except queue.Empty:
+                if thread.is_alive():
+                    continue
+                try:
+                    item = items.get_nowait()  # Put just before it exited
+                except queue.Empty:
+                    raise RuntimeError(f"{name} thread died without finishing")
+            if item is _DONE:
+                return
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group items into lists of at most `size`, consuming lazily"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, max(1, size)))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,107 @@
+"""
+chrome_manager/core/read_cache.py
+🗃️ LRU cache of Sheets range reads, validated by the spreadsheet's revision
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger("read_cache")
+
+Values = List[List[str]]
+
+class ReadCache:
+    """
+    🗃️ Range reads shared across SheetsManagers, keyed by (spreadsheet, range)
+
+    Every entry remembers the spreadsheet's Drive modifiedTime it was read
+    under and is served only while that is still the current one. Checking
+    costs a small metadata call, made at most once per `ttl` seconds per
+    spreadsheet, instead of downloading the range again. Entries are
+    evicted least recently used first once the cache holds more than
+    `max_cells` cells; a single read larger than that is not cached.
+    """
+
+    def __init__(self, max_cells: int = 250_000, ttl: float = 2.0):
+        """
+        Initialize read cache
+
+        Args:
+            max_cells: Upper bound on cached cells across all entries
+            ttl: Seconds a checked modifiedTime is trusted without asking again
+        """
+        self.max_cells = max_cells
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[str, Values, int]]' = (
+            OrderedDict()
+        )
+        self._versions: Dict[str, Tuple[str, float]] = {}
+        self._cells = 0
+
+    def version(self, spreadsheet_id: str, fetch: Callable[[], str]) -> Optional[str]:
+        """
+        🔖 Current revision of a spreadsheet
+
+        Args:
+            spreadsheet_id: Spreadsheet the revision belongs to
+            fetch: Metadata call returning the modifiedTime, used when the
+                last check is older than ttl
+
+        Returns:
+            The revision, or None if it cannot be determined (reads then
+            bypass the cache)
+        """
+        with self._lock:
+            known = self._versions.get(spreadsheet_id)
+            if known and time.monotonic() - known[1] < self.ttl:
+                return known[0]
+        try:
+            version = fetch()
+        except Exception as e:
+            log.debug(f"Cannot check revision of {spreadsheet_id}: {e}")
+            return None
+        with self._lock:
+            self._versions[spreadsheet_id] = (version, time.monotonic())
+        return version
+
+    def get(self, spreadsheet_id: str, cells: str, version: str) -> Optional[Values]:
+        """Values read under version, or None"""
+        key = (spreadsheet_id, cells)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, spreadsheet_id: str, cells: str, version: str,
+            values: Values) -> None:
+        """Store values read under version, evicting the least recently used"""
+        size = sum(len(row) for row in values) or 1
+        if size > self.max_cells:
+            return
+        key = (spreadsheet_id, cells)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self._cells -= old[2]
+            self._entries[key] = (version, values, size)
+            self._cells += size
+            while self._cells > self.max_cells:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._cells -= evicted
+
+    def invalidate(self, spreadsheet_id: str) -> None:
+        """🧹 Drop everything cached for a spreadsheet (after writing to it)"""
+        with self._lock:
+            self._versions.pop(spreadsheet_id, None)
+            for key in [key for key in self._entries if key[0] == spreadsheet_id]:
+                self._cells -= self._entries.pop(key)[2]
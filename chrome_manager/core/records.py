@@ -0,0 +1,286 @@
+"""
+chrome_manager/core/records.py
+📋 Compact profile records and batch sheet row building
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# system_info keys stored in the host dimension (Username is appended last)
+HOST_FIELDS = ('hostname', 'os_info', 'ip_address', 'memory_total', 'memory_available')
+
+# Host fields that change between runs: kept on each normalized profile row
+# (after the inventory columns) and left out of the host snapshot and its key
+VOLATILE_HOST_FIELDS = ('ip_address', 'memory_available')
+VOLATILE_COLUMN = 11  # First volatile column of a normalized row
+
+class ProfileRecord:
+    """📋 Compact Chrome profile record (no per-instance __dict__)"""
+
+    __slots__ = (
+        'name', 'path', 'email', 'custom_name', 'last_used', 'username', 'browser',
+        'disk_usage', 'extensions', 'bookmarks', 'history_size'
+    )
+
+    def __init__(self, name: str, path: str, email: Optional[str] = None,
+                 custom_name: Optional[str] = None, last_used: Optional[str] = None,
+                 username: Optional[str] = None, browser: Optional[str] = None,
+                 disk_usage: Optional[int] = None, extensions: Optional[int] = None,
+                 bookmarks: Optional[int] = None, history_size: Optional[int] = None):
+        self.name = name                # Directory name (e.g., "Profile 1")
+        self.path = path                # Full path to profile directory
+        self.email = email              # Email if signed in
+        self.custom_name = custom_name  # User-set profile name
+        self.last_used = last_used      # Last used ISO timestamp
+        self.username = username        # Owning OS user (host sweeps only)
+        self.browser = browser          # Browser flavour (host sweeps only)
+        self.disk_usage = disk_usage    # Allocated bytes on disk, if measured
+        self.extensions = extensions    # Installed extensions, if inventoried
+        self.bookmarks = bookmarks      # URL bookmarks, if inventoried
+        self.history_size = history_size  # Bytes in use by History, if inventoried
+
+    @property
+    def is_local(self) -> bool:
+        """True if the profile is not signed in"""
+        return not self.email
+
+    @property
+    def identity(self) -> str:
+        """Email, or the custom name for local profiles"""
+        return self.email or self.custom_name or 'Local Profile'
+
+    @property
+    def disk_usage_mb(self) -> Any:
+        """Disk usage in MB for the sheet ('' if not measured)"""
+        return '' if self.disk_usage is None else round(self.disk_usage / 2**20, 1)
+
+    @property
+    def inventory_cells(self) -> List[Any]:
+        """Extensions, Bookmarks and History Size (MB) sheet cells"""
+        return [
+            '' if self.extensions is None else self.extensions,
+            '' if self.bookmarks is None else self.bookmarks,
+            '' if self.history_size is None else round(self.history_size / 2**20, 1),
+        ]
+
+    @property
+    def display_name(self) -> str:
+        """Profile directory name, prefixed for non-Chrome browsers"""
+        if self.browser and self.browser != 'Chrome':
+            return f"{self.browser}: {self.name}"
+        return self.name
+
+    def to_dict(self) -> Dict[str, Any]:
+        """💾 Serialize to the tmp-file profile format"""
+        return {
+            'name': self.name,
+            'path': self.path,
+            'is_local': self.is_local,
+            'email': self.identity,
+            'custom_name': self.custom_name or 'Unknown',
+            'last_used': self.last_used,
+            'username': self.username,
+            'browser': self.browser,
+            'disk_usage': self.disk_usage,
+            'extensions': self.extensions,
+            'bookmarks': self.bookmarks,
+            'history_size': self.history_size,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ProfileRecord':
+        """📥 Build a record from the tmp-file profile format"""
+        custom_name = data.get('custom_name')
+        return cls(
+            name=data.get('name', ''),
+            path=data.get('path', ''),
+            email=None if data.get('is_local', True) else data.get('email'),
+            custom_name=None if custom_name == 'Unknown' else custom_name,
+            last_used=data.get('last_used'),
+            username=data.get('username'),
+            browser=data.get('browser'),
+            disk_usage=data.get('disk_usage'),
+            extensions=data.get('extensions'),
+            bookmarks=data.get('bookmarks'),
+            history_size=data.get('history_size'),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ProfileRecord):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"ProfileRecord(name={self.name!r}, email={self.email!r})"
+
+ProfileLike = Union[ProfileRecord, Dict[str, Any]]
+
+def iter_records(profiles: Iterable[ProfileLike]) -> Iterator[ProfileRecord]:
+    """Yield records, converting tmp-file dicts on the fly"""
+    for profile in profiles:
+        if isinstance(profile, ProfileRecord):
+            yield profile
+        else:
+            yield ProfileRecord.from_dict(profile)
+
+def build_rows(profiles: Iterable[ProfileLike], system_info: Dict[str, str],
+               timestamp: str) -> List[List[str]]:
+    """
+    📊 Build sheet rows for many profiles in one pass
+
+    Host columns are resolved once per batch rather than once per profile.
+    Records attributed to a user by a host sweep override the Username
+    column; all others use the collecting user from system_info.
+
+    Args:
+        profiles: Profile records (or tmp-file dicts)
+        system_info: Sheet-formatted system info
+        timestamp: Sync timestamp written to every row
+
+    Returns:
+        Rows in SheetsManager.SHEET_CONFIG['headers'] order
+    """
+    hostname = system_info.get('hostname', '')
+    os_info = system_info.get('os_info', '')
+    ip_address = system_info.get('ip_address', '')
+    memory_total = system_info.get('memory_total', '')
+    memory_available = system_info.get('memory_available', '')
+    username = system_info.get('username', '')
+
+    return [
+        [
+            timestamp, hostname, os_info, ip_address, memory_total, memory_available,
+            record.display_name,
+            record.identity,
+            'Local' if record.is_local else 'Signed-in',
+            record.custom_name or 'Unknown',
+            record.last_used or '',
+            record.username or username,
+            record.disk_usage_mb,
+            *record.inventory_cells,
+        ]
+        for record in iter_records(profiles)
+    ]
+
+def host_key(host_values: Sequence[str]) -> str:
+    """🔑 Content hash identifying a host snapshot (volatile fields blanked)"""
+    return hashlib.sha1('\x1f'.join(host_values).encode('utf-8')).hexdigest()[:12]
+
+def build_normalized_rows(
+    profiles: Iterable[ProfileLike], system_info: Dict[str, str], timestamp: str
+) -> Tuple[List[List[str]], Dict[str, List[str]]]:
+    """
+    📊 Build normalized profile rows plus the host snapshots they point to
+
+    Args:
+        profiles: Profile records (or tmp-file dicts)
+        system_info: Sheet-formatted system info
+        timestamp: Sync timestamp written to every row
+
+    Returns:
+        Tuple of (profile rows in NORMALIZED_SHEET_CONFIG order,
+        mapping of host key to host values in HOSTS_SHEET_CONFIG order
+        without the key and first-seen columns)
+    """
+    host = [
+        '' if field in VOLATILE_HOST_FIELDS else system_info.get(field, '')
+        for field in HOST_FIELDS
+    ]
+    volatile = [system_info.get(field, '') for field in VOLATILE_HOST_FIELDS]
+    default_username = system_info.get('username', '')
+
+    hosts: Dict[str, List[str]] = {}
+    keys_by_user: Dict[str, str] = {}
+    rows = []
+    for record in iter_records(profiles):
+        username = record.username or default_username
+        key = keys_by_user.get(username)
+        if key is None:
+            values = host + [username]
+            key = keys_by_user[username] = host_key(values)
+            hosts[key] = values
+
+        rows.append([
+            timestamp,
+            key,
+            record.display_name,
+            record.identity,
+            'Local' if record.is_local else 'Signed-in',
+            record.custom_name or 'Unknown',
+            record.last_used or '',
+            record.disk_usage_mb,
+            *record.inventory_cells,
+            *volatile,
+        ])
+    return rows, hosts
+
+def join_host_rows(rows: Iterable[List[str]],
+                   hosts: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    🔗 Expand normalized profile rows back into full-width sheet rows
+
+    Volatile host fields come from the row itself when it carries them;
+    rows written before they moved there take them from the host snapshot.
+
+    Args:
+        rows: Normalized profile rows
+        hosts: Mapping of host key to host values (as from build_normalized_rows)
+
+    Returns:
+        Rows in SheetsManager.SHEET_CONFIG['headers'] order
+    """
+    blank = [''] * (len(HOST_FIELDS) + 1)
+    joined = []
+    for row in rows:
+        host = list(hosts.get(row[1], blank) if len(row) > 1 else blank)
+        for field, value in zip(VOLATILE_HOST_FIELDS, row[VOLATILE_COLUMN:]):
+            if value != '':
+                host[HOST_FIELDS.index(field)] = value
+        profile = (list(row[2:7]) + [''] * 5)[:5]
+        extra = list(row[7:VOLATILE_COLUMN])  # Disk usage and inventory columns
+        identity, username = host[:len(HOST_FIELDS)], host[len(HOST_FIELDS)]
+        joined.append([row[0]] + identity + profile + [username] + extra)
+    return joined
+
+SummaryTotals = Dict[Tuple[str, str], List[Any]]
+
+def tally_summary(rows: Iterable[Sequence[Any]],
+                  groups: Optional[SummaryTotals] = None) -> SummaryTotals:
+    """
+    🧮 Add full-width sheet rows to per host and user totals
+
+    Args:
+        rows: Rows in SheetsManager.SHEET_CONFIG['headers'] order
+        groups: Totals to add to (a new mapping if None)
+
+    Returns:
+        (profiles, signed-in, last sync) per (hostname, username)
+    """
+    groups = {} if groups is None else groups
+    for row in rows:
+        totals = groups.setdefault((row[1], row[11]), [0, 0, ''])
+        totals[0] += 1
+        if row[8] != 'Local':
+            totals[1] += 1
+        totals[2] = max(totals[2], row[0])
+    return groups
+
+def summary_rows(groups: SummaryTotals) -> List[List[Any]]:
+    """Host Summary rows from per host and user totals"""
+    return [
+        [hostname, username, profiles, signed_in, profiles - signed_in,
+         round(signed_in / profiles, 2), last_sync]
+        for (hostname, username), (profiles, signed_in, last_sync) in groups.items()
+    ]
+
+def build_summary_rows(rows: Iterable[Sequence[Any]]) -> List[List[Any]]:
+    """
+    📈 Summarize full-width sheet rows per host and user
+
+    Args:
+        rows: Rows in SheetsManager.SHEET_CONFIG['headers'] order
+
+    Returns:
+        Rows in SheetsManager.HOST_SUMMARY_CONFIG['headers'] order
+    """
+    return summary_rows(tally_summary(rows))
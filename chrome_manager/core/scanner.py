@@ -0,0 +1,308 @@
+"""
+chrome_manager/core/scanner.py - Chrome Profile Scanner
+🔍 Unified scanning engine for Chrome profile information
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from datetime import datetime
+
+from rich.console import Console
+
+from chrome_manager.core.disk_usage import DiskUsage, cache_path_for
+from chrome_manager.core.inventory import InventoryCollector
+from chrome_manager.core.records import ProfileRecord
+
+console = Console()
+log = logging.getLogger("chrome_scanner")
+
+class ProfileScanner:
+    """🔎 Scans a Chrome config directory and yields compact profile records"""
+
+    def __init__(self, chrome_config_path: Optional[Path] = None,
+                 use_local_state: bool = True, measure_disk: bool = False,
+                 collect_inventory: bool = False):
+        """
+        Initialize scanner with configuration path
+
+        Args:
+            chrome_config_path: Optional custom path to Chrome config directory
+            use_local_state: Build profiles from the shared Local State file,
+                reading per-profile Preferences only for missing fields
+            measure_disk: Record each profile directory's disk usage
+            collect_inventory: Record extension, bookmark and History metrics
+        """
+        self.config_path = (
+            chrome_config_path or Path.home() / ".config" / "google-chrome"
+        )
+        self.use_local_state = use_local_state
+        self._validate_config_path()
+        self.disk_usage = (
+            DiskUsage(cache_path_for(self.config_path)) if measure_disk else None
+        )
+        self.inventory = (
+            InventoryCollector(
+                cache_path_for(self.config_path, Path("tmp") / "inventory")
+            )
+            if collect_inventory else None
+        )
+
+    def _validate_config_path(self) -> None:
+        """✅ Validate Chrome configuration path exists"""
+        if not self.config_path.exists():
+            log.error(f"Chrome config path not found: {self.config_path}")
+            raise FileNotFoundError(
+                f"Chrome configuration not found at {self.config_path}"
+            )
+        log.debug(f"Found Chrome config at: {self.config_path}")
+
+    def get_profile_dirs(self) -> List[Path]:
+        """
+        📂 Get all Chrome profile directories
+
+        Returns:
+            List of profile directory paths, Default first
+        """
+        try:
+            with os.scandir(self.config_path) as entries:
+                names = [
+                    entry.name for entry in entries
+                    if (entry.name == "Default" or entry.name.startswith("Profile "))
+                    and entry.is_dir()
+                ]
+
+            log.debug(f"Found {len(names)} Chrome profiles")
+            return [
+                self.config_path / name
+                for name in sorted(names, key=self._profile_sort_key)
+            ]
+
+        except Exception as e:
+            log.error(f"Error scanning profile directories: {e}")
+            raise
+
+    @staticmethod
+    def _profile_sort_key(name: str) -> tuple:
+        """🔤 Sort key for profile directory names"""
+        if name == "Default":
+            return (0, 0, name)
+        try:
+            return (1, int(name.split()[-1]), name)
+        except (IndexError, ValueError):
+            return (2, 0, name)
+
+    def read_profile_preferences(self, profile_path: Path) -> Optional[Dict]:
+        """
+        📖 Read and parse profile preferences file
+
+        Args:
+            profile_path: Path to profile directory
+
+        Returns:
+            Dictionary of profile preferences, or None if unreadable
+        """
+        try:
+            with open(profile_path / "Preferences", 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        except FileNotFoundError:
+            log.debug(f"No preferences file found for {profile_path.name}")
+            return None
+        except json.JSONDecodeError as e:
+            log.error(f"Invalid JSON in preferences file: {profile_path.name} - {e}")
+            return None
+        except Exception as e:
+            log.error(f"Error reading preferences for {profile_path.name}: {e}")
+            return None
+
+    def read_local_state(self) -> Optional[Dict[str, Dict]]:
+        """
+        📖 Read the profile info cache from the config root's Local State
+
+        Returns:
+            Mapping of profile directory name to info cache entry, or None
+            if Local State is missing or unreadable
+        """
+        try:
+            with open(self.config_path / "Local State", 'r', encoding='utf-8') as f:
+                info_cache = json.load(f).get('profile', {}).get('info_cache')
+            return info_cache if isinstance(info_cache, dict) else None
+
+        except FileNotFoundError:
+            log.debug(f"No Local State file found in {self.config_path}")
+            return None
+        except Exception as e:
+            log.warning(f"Error reading Local State, falling back to Preferences: {e}")
+            return None
+
+    def extract_local_state_info(self, profile_path: Path,
+                                 entry: Dict) -> ProfileRecord:
+        """
+        📑 Extract profile information from a Local State info cache entry
+
+        Preferences is read only when the entry lacks a name, account
+        field or activity time.
+
+        Args:
+            profile_path: Path to profile directory
+            entry: The profile's profile.info_cache entry from Local State
+
+        Returns:
+            ProfileRecord with extracted information
+        """
+        last_used = None
+        if active_time := entry.get('active_time'):
+            try:
+                last_used = datetime.fromtimestamp(active_time).isoformat()
+            except (TypeError, ValueError, OverflowError, OSError):
+                log.debug(f"Invalid active_time for {profile_path.name}: {active_time}")
+
+        record = ProfileRecord(
+            name=profile_path.name,
+            path=str(profile_path),
+            email=entry.get('user_name') or None,
+            custom_name=entry.get('name') or None,
+            last_used=last_used
+        )
+
+        if record.custom_name and record.last_used and 'user_name' in entry:
+            return record
+
+        prefs = self.read_profile_preferences(profile_path)
+        if prefs:
+            fallback = self.extract_profile_info(profile_path, prefs)
+            record.email = record.email or fallback.email
+            record.custom_name = record.custom_name or fallback.custom_name
+            record.last_used = record.last_used or fallback.last_used
+        return record
+
+    def extract_profile_info(self, profile_path: Path, prefs: Dict) -> ProfileRecord:
+        """
+        📑 Extract profile information from preferences
+
+        Args:
+            profile_path: Path to profile directory
+            prefs: Profile preferences dictionary
+
+        Returns:
+            ProfileRecord with extracted information
+        """
+        try:
+            # Get account info
+            account_info = (prefs.get('account_info') or [{}])[0]
+            email = account_info.get('email') or None
+
+            # Profile name: profile settings, then sync info, then info cache
+            profile_info = prefs.get('profile', {})
+            info_cache = profile_info.get('info_cache', {})
+            custom_name = (
+                profile_info.get('name')
+                or prefs.get('google', {}).get('chrome_sync', {}).get('profile_name')
+                or info_cache.get('name')
+            )
+
+            # Get last used time
+            last_used = None
+            if last_used_timestamp := info_cache.get('last_used'):
+                try:
+                    last_used = datetime.fromtimestamp(last_used_timestamp).isoformat()
+                except (TypeError, ValueError, OverflowError, OSError):
+                    log.debug(
+                        f"Invalid last_used for {profile_path.name}: "
+                        f"{last_used_timestamp}"
+                    )
+
+            return ProfileRecord(
+                name=profile_path.name,
+                path=str(profile_path),
+                email=email,
+                custom_name=custom_name,
+                last_used=last_used
+            )
+
+        except Exception as e:
+            log.error(f"Error extracting profile info for {profile_path.name}: {e}")
+            # Return a basic profile if extraction fails
+            return ProfileRecord(name=profile_path.name, path=str(profile_path))
+
+    def iter_profiles(self) -> Iterator[ProfileRecord]:
+        """
+        🔍 Lazily scan all Chrome profiles
+
+        With use_local_state, profiles listed in Local State are built from
+        that single file. Otherwise only one Preferences document is held in
+        memory at a time, and directories without one are skipped.
+
+        Yields:
+            ProfileRecord per profile
+        """
+        info_cache = self.read_local_state() if self.use_local_state else None
+
+        try:
+            for profile_dir in self.get_profile_dirs():
+                try:
+                    if info_cache and (entry := info_cache.get(profile_dir.name)):
+                        profile = self.extract_local_state_info(profile_dir, entry)
+                        log.debug(f"Processed profile: {profile.name} (Local State)")
+                    else:
+                        prefs = self.read_profile_preferences(profile_dir)
+                        if prefs is None:
+                            continue
+                        profile = self.extract_profile_info(profile_dir, prefs)
+                        del prefs
+                        log.debug(
+                            f"Processed profile: {profile.name} "
+                            f"({profile.email or 'local'})"
+                        )
+
+                    if self.disk_usage:
+                        profile.disk_usage = self.disk_usage.measure(profile_dir)
+                    if self.inventory:
+                        for field, value in self.inventory.collect(profile_dir).items():
+                            setattr(profile, field, value)
+                    yield profile
+                except Exception as e:
+                    log.error(f"Error processing profile {profile_dir.name}: {e}")
+                    continue
+        finally:
+            if self.disk_usage:
+                self.disk_usage.close()
+
+        if self.disk_usage:
+            self.disk_usage.save()
+        if self.inventory:
+            self.inventory.save()
+
+    def scan_profiles(self) -> List[ProfileRecord]:
+        """
+        🔍 Scan all Chrome profiles and extract information
+
+        Returns:
+            List of ProfileRecord objects
+        """
+        return list(self.iter_profiles())
+
+if __name__ == "__main__":
+    # Simple test code
+    try:
+        scanner = ProfileScanner()
+        console.print("🔍 Scanning Chrome Profiles...", style="bold blue")
+
+        profiles = scanner.scan_profiles()
+
+        console.print("\n📊 Found Profiles:", style="bold green")
+        for profile in profiles:
+            profile_type = (
+                "🔒 Local" if profile.is_local else f"🌐 Signed-in ({profile.email})"
+            )
+            console.print(f"  • {profile.name}: {profile_type}")
+            if profile.custom_name:
+                console.print(f"    └─ Custom Name: {profile.custom_name}")
+            if profile.last_used:
+                console.print(f"    └─ Last Used: {profile.last_used}")
+
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="bold red")
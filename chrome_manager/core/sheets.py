@@ -4,17 +4,44 @@ chrome_manager/core/sheets.py
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Callable, Iterable, Iterator, List, Dict, Any, NamedTuple, Optional, Set, Tuple
+)
 from datetime import datetime
 from pathlib import Path
 
 import gspread
+import requests
 from google.oauth2.service_account import Credentials
 from rich.console import Console
 
+from chrome_manager.core.batch import (
+    RowChunk, SheetBatch, encode_chunk, iter_row_chunks
+)
+from chrome_manager.core.dedup import SyncLedger, make_sync_id
+from chrome_manager.core.keyed import KeyedRows
+from chrome_manager.core.read_cache import ReadCache
+from chrome_manager.core.pipeline import batched
+from chrome_manager.core.records import (
+    ProfileLike, SummaryTotals, build_normalized_rows, build_rows, build_summary_rows,
+    join_host_rows, summary_rows, tally_summary
+)
+from chrome_manager.core.partitions import Partition, PartitionIndex
+from chrome_manager.core.singleflight import SharedBackoff
+
 console = Console()
 log = logging.getLogger("sheets")
 
+class BackfillResult(NamedTuple):
+    """📼 Outcome of a snapshot backfill"""
+    uploaded: int       # Snapshots written by this run
+    skipped: int        # Snapshots already in the sheet (or empty)
+    complete: bool      # False if a batch failed; running again resumes
+
 class SheetsManager:
     """📝 Google Sheets management for Chrome profile tracking"""
     
@@ -37,14 +64,172 @@ class SheetsManager:
             'Profile Type',
             'Custom Name',
             'Last Used',
+            'Username',
+            'Disk Usage (MB)',
+            'Extensions',
+            'Bookmarks',
+            'History Size (MB)'
+        ]
+    }
+    
+    NORMALIZED_SHEET_CONFIG = {
+        'name': 'Chrome Profile Rows',
+        'headers': [
+            'Timestamp',
+            'Host Key',
+            'Profile Name',
+            'Profile Email',
+            'Profile Type',
+            'Custom Name',
+            'Last Used',
+            'Disk Usage (MB)',
+            'Extensions',
+            'Bookmarks',
+            'History Size (MB)',
+            'IP Address',
+            'Memory Available'
+        ]
+    }
+    
+    # IP Address and Memory Available are only filled for host snapshots
+    # written before they moved onto the profile rows
+    HOSTS_SHEET_CONFIG = {
+        'name': 'Hosts',
+        'headers': [
+            'Host Key',
+            'First Seen',
+            'Hostname',
+            'OS Info',
+            'IP Address',
+            'Memory Total',
+            'Memory Available',
             'Username'
         ]
     }
     
-    def __init__(self, credentials_path: Path, spreadsheet_id: str):
-        """Initialize sheets manager"""
+    PARTITION_INDEX_CONFIG = {
+        'name': 'Partition Index',
+        'headers': ['Partition', 'Start', 'End', 'Rows']
+    }
+    
+    CURRENT_STATE_CONFIG = {
+        'name': 'Current State',
+        'headers': SHEET_CONFIG['headers']
+    }
+    
+    # Current State key columns: Hostname, Username, Profile Name
+    STATE_KEY = (1, 11, 6)
+    
+    HOST_SUMMARY_CONFIG = {
+        'name': 'Host Summary',
+        'headers': [
+            'Hostname',
+            'Username',
+            'Profiles',
+            'Signed-in',
+            'Local',
+            'Signed-in Ratio',
+            'Last Sync'
+        ]
+    }
+    
+    # Host Summary key columns: Hostname, Username
+    SUMMARY_KEY = (0, 1)
+    
+    SYNC_LOG_CONFIG = {
+        'name': 'Sync Log',
+        'headers': ['Sync ID', 'Timestamp', 'Hostname', 'Rows', 'Worksheet']
+    }
+    
+    LAYOUTS = ('wide', 'normalized')
+    
+    # HTTP statuses worth retrying (rate limit and transient server errors)
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+    
+    # Sync Log rows read for the dedup check (older IDs: local ledger)
+    SYNC_LOG_TAIL = 5000
+    
+    def __init__(self, credentials_path: Path, spreadsheet_id: str,
+                 partition_mode: Optional[str] = None,
+                 partition_rows: int = 50000,
+                 layout: str = 'wide',
+                 ledger_path: Optional[Path] = None,
+                 max_retries: int = 3,
+                 worksheet_name: Optional[str] = None,
+                 chunk_rows: int = 5000,
+                 chunk_bytes: int = 2_000_000,
+                 pipeline_depth: int = 2,
+                 backoff: Optional[SharedBackoff] = None,
+                 current_state: bool = False,
+                 summary: bool = False,
+                 read_cache: Optional[ReadCache] = None):
+        """
+        Initialize sheets manager
+        
+        Args:
+            credentials_path: Path to service account credentials
+            spreadsheet_id: Target spreadsheet ID
+            partition_mode: None for a single log worksheet, or 'monthly' /
+                'rows' to roll over into partition worksheets
+            partition_rows: Row limit per partition in 'rows' mode
+            layout: 'wide' repeats host columns on every row; 'normalized'
+                stores host snapshots once in a Hosts worksheet and points
+                profile rows at them by content-hash key
+            ledger_path: Local file recording committed sync IDs
+            max_retries: Retries for a sync batch after a transient failure
+            worksheet_name: Log worksheet name (defaults to the layout's name)
+            chunk_rows: Row limit per append request
+            chunk_bytes: Encoded size limit per append request
+            pipeline_depth: Chunks encoded ahead of the one being sent
+            backoff: Rate-limit backoff shared with other processes on the host
+            current_state: Also keep a Current State worksheet holding the
+                latest row of every profile, upserted with each sync
+            summary: Also keep a Host Summary worksheet of per-host profile
+                counts, rewritten in place for the hosts in each sync
+            read_cache: Cache of range reads (may be shared by managers);
+                None reads every range from the API
+        """
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown sheet layout: {layout}")
         self.credentials_path = credentials_path
         self.spreadsheet_id = spreadsheet_id
+        self.layout = layout
+        base_config = (
+            self.SHEET_CONFIG if layout == 'wide' else self.NORMALIZED_SHEET_CONFIG
+        )
+        self.log_config = dict(base_config, name=worksheet_name or base_config['name'])
+        self.index_name = (
+            self.PARTITION_INDEX_CONFIG['name'] if self.log_config == self.SHEET_CONFIG
+            else f"{self.log_config['name']} Index"
+        )
+        self.current_state = KeyedRows(
+            self._derived_name(worksheet_name, self.CURRENT_STATE_CONFIG['name']),
+            self.STATE_KEY
+        ) if current_state else None
+        self.summary = KeyedRows(
+            self._derived_name(worksheet_name, self.HOST_SUMMARY_CONFIG['name']),
+            self.SUMMARY_KEY
+        ) if summary else None
+        self.partitions = (
+            PartitionIndex(self.log_config['name'], partition_mode, partition_rows)
+            if partition_mode else None
+        )
+        self._hosts: Dict[str, List[str]] = {}
+        self._worksheets: Dict[str, gspread.Worksheet] = {}
+        self.ledger = SyncLedger(ledger_path or Path("tmp") / "sync_ledger.txt")
+        self.max_retries = max_retries
+        self.chunk_rows = (
+            min(chunk_rows, partition_rows) if partition_mode == 'rows' else chunk_rows
+        )
+        self.chunk_bytes = chunk_bytes
+        self.pipeline_depth = pipeline_depth
+        self.backoff = backoff
+        self.read_cache = read_cache
+        self._remote_sync_ids: Optional[Set[str]] = None
+        self._sync_log_next = 2  # First Sync Log row not read yet
+        self._sync_log_complete = False
+        self._row_listeners: List[Callable[[List[List[str]], str], None]] = []
+        self._sync_listeners: List[Callable[[], None]] = []
         
         # Add debug logging
         log.debug(f"Initializing SheetsManager with:")
@@ -55,6 +240,11 @@ class SheetsManager:
         self.spreadsheet = self._get_spreadsheet()
         self._ensure_sheet_exists()
 
+    @staticmethod
+    def _derived_name(worksheet_name: Optional[str], name: str) -> str:
+        """Title of a worksheet derived from a (possibly custom) log worksheet"""
+        return name if worksheet_name is None else f"{worksheet_name} {name}"
+
     def _initialize_client(self) -> gspread.Client:
         """Initialize Google Sheets client"""
         try:
@@ -82,83 +272,1082 @@ class SheetsManager:
             raise
 
     def _ensure_sheet_exists(self) -> None:
-        """Ensure the worksheet exists with correct headers"""
+        """Ensure the worksheets exist with correct headers"""
         try:
-            try:
-                worksheet = self.spreadsheet.worksheet(self.SHEET_CONFIG['name'])
-                headers = worksheet.row_values(1)
-                if headers != self.SHEET_CONFIG['headers']:
-                    log.debug("Updating sheet headers...")
-                    worksheet.clear()
-                    worksheet.append_row(self.SHEET_CONFIG['headers'])
-                    log.debug("Updated sheet headers")
-            except gspread.WorksheetNotFound:
-                log.debug("Creating new worksheet...")
-                worksheet = self.spreadsheet.add_worksheet(
-                    self.SHEET_CONFIG['name'],
-                    1000,
-                    len(self.SHEET_CONFIG['headers'])
+            self._worksheets = {ws.title: ws for ws in self.spreadsheet.worksheets()}
+            
+            required = [(self.SYNC_LOG_CONFIG['name'], self.SYNC_LOG_CONFIG['headers'])]
+            if self.partitions is None:
+                required.append((self.log_config['name'], self.log_config['headers']))
+            else:
+                required.append(
+                    (self.index_name, self.PARTITION_INDEX_CONFIG['headers'])
+                )
+            if self.layout == 'normalized':
+                hosts_config = self.HOSTS_SHEET_CONFIG
+                required.append((hosts_config['name'], hosts_config['headers']))
+            if self.current_state:
+                required.append(
+                    (self.current_state.name, self.CURRENT_STATE_CONFIG['headers'])
                 )
-                worksheet.append_row(self.SHEET_CONFIG['headers'])
-                log.debug("Created new worksheet")
+            if self.summary:
+                required.append(
+                    (self.summary.name, self.HOST_SUMMARY_CONFIG['headers'])
+                )
+            self._ensure_worksheets(required)
+            
+            if self.partitions is not None:
+                self._load_partition_index()
+                active = self.partitions.active()
+                if active and active.name in self._worksheets:
+                    self._ensure_worksheets([(active.name, self.log_config['headers'])])
+            if self.layout == 'normalized':
+                self._load_hosts()
                 
         except Exception as e:
             log.error(f"Error setting up worksheet: {e}")
             raise
 
-    def update_profiles(self, profiles: List[Dict], system_info: Dict) -> bool:
-        """Update sheet with profile and system information"""
-        try:
-            worksheet = self.spreadsheet.worksheet(self.SHEET_CONFIG['name'])
-            timestamp = datetime.now().isoformat()
+    @staticmethod
+    def _a1(name: str, cells: str) -> str:
+        """A1 range on a named worksheet"""
+        return "'{}'!{}".format(name.replace("'", "''"), cells)
+
+    def _ensure_worksheets(self, required: List[Tuple[str, List[str]]]) -> None:
+        """
+        Create missing worksheets and fix headers with one read and one write
+        
+        Headers that are a prefix of the expected ones are migrated in place
+        by appending the new columns; any other mismatch resets the sheet.
+        """
+        batch = self.new_batch()
+        existing = [
+            (name, headers) for name, headers in required if name in self._worksheets
+        ]
+        
+        if existing:
+            header_rows = self._read_ranges(
+                [self._a1(name, '1:1') for name, _ in existing]
+            )
+            for (name, headers), values in zip(existing, header_rows):
+                current = (values or [[]])[0]
+                if current == headers:
+                    continue
+                worksheet = self._worksheets[name]
+                if headers[:len(current)] == current:
+                    # Columns were added: extend the header row, keep the data
+                    added = headers[len(current):]
+                    log.debug(f"Adding {name} columns: {', '.join(added)}")
+                    if worksheet.col_count < len(headers):
+                        batch.append_columns(
+                            worksheet.id, len(headers) - worksheet.col_count
+                        )
+                    batch.update_rows(worksheet.id, 0, [added], len(current))
+                else:
+                    log.warning(f"Resetting {name}: headers {current} do not match")
+                    batch.clear_sheet(worksheet.id)
+                    batch.update_rows(worksheet.id, 0, [headers])
+        
+        for name, headers in required:
+            if name not in self._worksheets:
+                log.debug(f"Creating new worksheet {name}...")
+                batch.add_sheet(self._new_sheet_id(batch), name, headers)
+        
+        if len(batch):
+            self.commit(batch)
+
+    def _read_ranges(self, ranges: List[str],
+                     fresh: bool = False) -> List[List[List[str]]]:
+        """
+        📥 Values of A1 ranges, from the read cache where still current
+        
+        Ranges not served by the cache are fetched together in one
+        values_batch_get call.
+        
+        Args:
+            ranges: A1 ranges (see _a1)
+            fresh: Bypass the cache (e.g. to check what a failed write did)
             
-            log.debug("Preparing profile data for sheet update...")
-            # Prepare rows with combined information
-            rows = []
-            for profile in profiles:
-                row = [
-                    timestamp,
-                    system_info.get('hostname', ''),
-                    system_info.get('os_info', ''),
-                    system_info.get('ip_address', ''),
-                    system_info.get('memory_total', ''),
-                    system_info.get('memory_available', ''),
-                    profile.get('name', ''),
-                    profile.get('email', ''),
-                    'Local' if profile.get('is_local', True) else 'Signed-in',
-                    profile.get('custom_name', ''),
-                    profile.get('last_used', ''),
-                    system_info.get('username', '')
-                ]
-                rows.append(row)
-            
-            if rows:
-                log.debug(f"Attempting to update sheet with {len(rows)} rows...")
-                worksheet.append_rows(
-                    rows,
-                    value_input_option='USER_ENTERED',
-                    insert_data_option='INSERT_ROWS'
+        Returns:
+            Rows of values per range (rows are not padded)
+        """
+        cache = None if fresh else self.read_cache
+        version = (
+            cache.version(self.spreadsheet_id, self.spreadsheet.get_lastUpdateTime)
+            if cache else None
+        )
+        results: List[Optional[List[List[str]]]] = [
+            cache.get(self.spreadsheet_id, cells, version) if version else None
+            for cells in ranges
+        ]
+        missing = [i for i, values in enumerate(results) if values is None]
+        if missing:
+            response = self.spreadsheet.values_batch_get([ranges[i] for i in missing])
+            for i, value_range in zip(missing, response.get('valueRanges', [])):
+                results[i] = value_range.get('values', [])
+                if version:
+                    cache.put(self.spreadsheet_id, ranges[i], version, results[i])
+        return [values or [] for values in results]
+
+    def _read_rows(self, name: str, width: int, first: int = 2,
+                   last: Optional[int] = None, fresh: bool = False) -> List[List[str]]:
+        """Rows first..last (1-based, default to the end) of a worksheet, padded"""
+        last_column = gspread.utils.rowcol_to_a1(1, width)[:-1]
+        cells = f"A{first}:{last_column}{'' if last is None else last}"
+        values = self._read_ranges([self._a1(name, cells)], fresh)[0]
+        return [row + [''] * (width - len(row)) for row in values]
+
+    def _read_column(self, name: str, fresh: bool = False) -> List[str]:
+        """First-column values of a worksheet's data rows"""
+        return [row[0] for row in self._read_rows(name, 1, fresh=fresh)]
+
+    def _worksheet(self, name: str) -> gspread.Worksheet:
+        """Get a worksheet by title from the local cache"""
+        if name not in self._worksheets:
+            self._worksheets[name] = self.spreadsheet.worksheet(name)
+        return self._worksheets[name]
+
+    def _sheet_id(self, name: str, batch: SheetBatch) -> int:
+        """Sheet ID of an existing worksheet or one added by the batch"""
+        sheet_id = batch.sheet_id(name)
+        return sheet_id if sheet_id is not None else self._worksheet(name).id
+
+    def _new_sheet_id(self, batch: SheetBatch) -> int:
+        """Pick an unused sheet ID for a worksheet created in a batch"""
+        used = {ws.id for ws in self._worksheets.values()}
+        used |= set(batch.sheet_ids.values())
+        while True:
+            sheet_id = random.randint(1, 2**31 - 1)
+            if sheet_id not in used:
+                return sheet_id
+
+    def new_batch(self) -> SheetBatch:
+        """📦 Start collecting writes for one sync"""
+        return SheetBatch()
+
+    def commit(self, batch: SheetBatch) -> Dict[str, Any]:
+        """
+        📤 Send all collected writes as one spreadsheets:batchUpdate call
+        
+        batchUpdate is atomic and every sync batch logs its sync ID in the
+        Sync Log worksheet, so after an ambiguous failure (timeout, 5xx) the
+        Sync Log tells whether the batch landed. Sync batches are retried
+        with backoff only when it did not, so a replay never duplicates rows.
+        
+        Batches are sent one at a time: keeping several in flight is out of
+        scope. Keyed upserts and partition index counts are planned from a
+        read taken after the previous batch landed, and a chunk's sync ID
+        must only reach the Sync Log once every earlier chunk did, so a
+        resumed sync can skip exactly the committed prefix. Encoding of the
+        following chunks already overlaps each request (pipeline_depth).
+        
+        Args:
+            batch: Writes collected for this sync
+            
+        Returns:
+            The batchUpdate API response ({} if found already applied)
+        """
+        attempt = 0
+        while True:
+            try:
+                if self.backoff:
+                    self.backoff.wait()
+                log.debug(f"Committing {len(batch)} write requests in one batch")
+                response = self.spreadsheet.batch_update(batch.body())
+                break
+            except Exception as e:
+                if self.backoff and self._is_rate_limited(e):
+                    self.backoff.push(min(30, 2 ** (attempt + 1)))
+                retryable = batch.sync_ids and self._is_transient(e)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                if self._applied_remotely(batch.sync_ids):
+                    log.info("Sync batch was applied before the failure; not resending")
+                    self._worksheets = {
+                        ws.title: ws for ws in self.spreadsheet.worksheets()
+                    }
+                    self._mark_committed(batch)
+                    return {}
+                delay = min(30, 2 ** attempt) + random.random()
+                log.warning(
+                    f"Sync batch failed ({e}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
                 )
-                log.info(f"Successfully updated {len(rows)} profile entries")
+                time.sleep(delay)
+        
+        for reply in response.get('replies', []):
+            if properties := reply.get('addSheet', {}).get('properties'):
+                self._worksheets[properties['title']] = gspread.Worksheet(
+                    self.spreadsheet, properties,
+                    self.spreadsheet.id, self.spreadsheet.client
+                )
+        
+        self._mark_committed(batch)
+        return response
+
+    def _invalidate_reads(self) -> None:
+        """Drop cached reads after writing to the spreadsheet"""
+        if self.read_cache is not None:
+            self.read_cache.invalidate(self.spreadsheet_id)
+
+    def _mark_committed(self, batch: SheetBatch) -> None:
+        """Apply local state updates and record the batch's sync IDs"""
+        self._invalidate_reads()
+        batch.committed()
+        for sync_id in batch.sync_ids:
+            self.ledger.add(sync_id)
+            if self._remote_sync_ids is not None:
+                self._remote_sync_ids.add(sync_id)
+
+    @staticmethod
+    def _is_rate_limited(error: Exception) -> bool:
+        """Whether a failed request hit the Sheets API quota"""
+        return (isinstance(error, gspread.exceptions.APIError)
+                and getattr(error.response, 'status_code', None) == 429)
+
+    def _is_transient(self, error: Exception) -> bool:
+        """Whether a failed request may succeed when retried"""
+        if isinstance(error, gspread.exceptions.APIError):
+            return getattr(error.response, 'status_code', None) in self.RETRY_STATUS
+        return isinstance(error, (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            ConnectionError,
+            TimeoutError
+        ))
+
+    def _load_remote_sync_ids(self, refresh: bool = False,
+                              complete: bool = False) -> Set[str]:
+        """
+        🔁 Sync IDs recorded in the tail of the Sync Log worksheet
+        
+        The first load reads the last SYNC_LOG_TAIL rows, and a refresh
+        only the rows appended since. Replays are of recent syncs and
+        older IDs of this host are in the local ledger, so the whole
+        column is only read with complete=True (e.g. for a backfill of
+        old snapshots from a host that lost its ledger).
+        
+        Args:
+            refresh: Also read rows appended since the last load
+            complete: Read the whole column (once)
+        """
+        name = self.SYNC_LOG_CONFIG['name']
+        if complete and not self._sync_log_complete:
+            self._remote_sync_ids, self._sync_log_next = set(), 2
+        elif self._remote_sync_ids is None:
+            grid_rows = getattr(self._worksheet(name), 'row_count', 0) or 0
+            self._remote_sync_ids = set()
+            self._sync_log_next = max(2, grid_rows - self.SYNC_LOG_TAIL + 1)
+        elif not refresh:
+            return self._remote_sync_ids
+        
+        first = self._sync_log_next
+        values = self._read_rows(name, 1, first=first, fresh=refresh)
+        self._remote_sync_ids.update(row[0] for row in values)
+        self._sync_log_next = first + len(values)
+        self._sync_log_complete = self._sync_log_complete or first == 2
+        log.debug(
+            f"Read {len(values)} Sync Log rows from row {first}; "
+            f"{len(self._remote_sync_ids)} remote sync IDs known"
+        )
+        return self._remote_sync_ids
+
+    def _applied_remotely(self, sync_ids: List[str]) -> bool:
+        """Re-read the Sync Log to see whether all sync IDs landed"""
+        try:
+            remote = self._load_remote_sync_ids(refresh=True)
+            return all(sync_id in remote for sync_id in sync_ids)
+        except Exception as e:
+            log.warning(f"Could not check Sync Log: {e}")
+            return False
+
+    def is_synced(self, sync_id: str) -> bool:
+        """✅ Whether a sync ID is committed (local ledger, then the Sync Log tail)"""
+        return sync_id in self.ledger or sync_id in self._load_remote_sync_ids()
+
+    def _load_partition_index(self, values: Optional[List[List[str]]] = None) -> None:
+        """
+        🗂️ Load the partition index, adopting a legacy log worksheet once
+
+        Args:
+            values: Index rows already read (read from the sheet if None)
+        """
+        if values is None:
+            values = self._read_rows(
+                self.index_name, len(self.PARTITION_INDEX_CONFIG['headers'])
+            )
+        self.partitions.load(values)
+        
+        if not self.partitions.partitions:
+            self._adopt_legacy_worksheet()
+
+    def _adopt_legacy_worksheet(self) -> None:
+        """Register an existing unpartitioned log as the first partition"""
+        worksheet = self._worksheets.get(self.log_config['name'])
+        if worksheet is None:
+            return
+        
+        timestamps = [ts for ts in self._read_column(worksheet.title) if ts]
+        if not timestamps:
+            return
+        
+        log.debug(f"Adopting {len(timestamps)} legacy rows as first partition")
+        partition = Partition(
+            worksheet.title, min(timestamps), max(timestamps), len(timestamps)
+        )
+        self.partitions.partitions.append(partition)
+        self._worksheet(self.index_name).append_row(list(partition))
+        self._invalidate_reads()
+
+    def _queue_log_rows(self, batch: SheetBatch, rows: List[List[str]], timestamp: str,
+                        row_data: Optional[List[Dict[str, Any]]] = None,
+                        start: Optional[str] = None) -> str:
+        """
+        Queue log rows, plus partition creation and index upkeep if partitioned
+        
+        Rows spanning several timestamps (start to timestamp) must all
+        belong in the same partition.
+        
+        Returns:
+            Title of the worksheet the rows go to
+        """
+        if self.partitions is None:
+            batch.append_rows(
+                self._sheet_id(self.log_config['name'], batch), rows, row_data
+            )
+            return self.log_config['name']
+        
+        name, is_new = self.partitions.plan_write(timestamp, len(rows))
+        if is_new and name not in self._worksheets and batch.sheet_id(name) is None:
+            batch.add_sheet(
+                self._new_sheet_id(batch), name, self.log_config['headers'],
+                rows=max(1000, len(rows) + 1)
+            )
+        batch.append_rows(self._sheet_id(name, batch), rows, row_data)
+        
+        pos, entry = self.partitions.preview_write(name, timestamp, len(rows), start)
+        index_id = self._sheet_id(self.index_name, batch)
+        if pos == len(self.partitions.partitions):
+            batch.append_rows(index_id, [list(entry)])
+        else:
+            batch.update_rows(index_id, pos + 1, [list(entry)])
+        batch.on_commit(
+            lambda: self.partitions.record_write(name, timestamp, len(rows), start)
+        )
+        return name
+
+    def _load_hosts(self) -> None:
+        """🖥️ Load known host snapshots for the normalized layout"""
+        values = self._read_rows(
+            self.HOSTS_SHEET_CONFIG['name'], len(self.HOSTS_SHEET_CONFIG['headers'])
+        )
+        self._hosts = {row[0]: row[2:] for row in values if row[0]}
+        log.debug(f"Loaded {len(self._hosts)} host snapshots")
+
+    def _queue_new_hosts(self, batch: SheetBatch, hosts: Dict[str, List[str]],
+                         timestamp: str) -> None:
+        """Queue host snapshots not yet present in the Hosts worksheet"""
+        new_hosts = {
+            key: values for key, values in hosts.items() if key not in self._hosts
+        }
+        if not new_hosts:
+            return
+        
+        log.debug(f"Adding {len(new_hosts)} new host snapshots")
+        batch.append_rows(
+            self._sheet_id(self.HOSTS_SHEET_CONFIG['name'], batch),
+            [[key, timestamp] + values for key, values in new_hosts.items()]
+        )
+        batch.on_commit(lambda: self._hosts.update(new_hosts))
+
+    def _keyed_views(self) -> List[KeyedRows]:
+        """Enabled worksheets derived from each sync's rows"""
+        return [view for view in (self.current_state, self.summary) if view is not None]
+
+    def _keyed_range(self, view: KeyedRows) -> str:
+        """A1 range of a keyed worksheet's data rows"""
+        width = max(
+            len(self.CURRENT_STATE_CONFIG['headers']),
+            len(self.HOST_SUMMARY_CONFIG['headers'])
+        )
+        last_column = gspread.utils.rowcol_to_a1(1, width)[:-1]
+        return self._a1(view.name, f"A2:{last_column}")
+
+    def _load_keyed(self, views: List[KeyedRows]) -> None:
+        """🗂️ Load the mirrors of keyed worksheets with one read"""
+        if not views:
+            return
+        values = self._read_ranges([self._keyed_range(view) for view in views])
+        for view, rows in zip(views, values):
+            view.load(rows)
+
+    def _refresh_for_write(self, views: List[KeyedRows]) -> None:
+        """
+        🔄 Re-read the rows a batch's positional writes are planned from
+
+        Every host appends to and prunes the same keyed worksheets and
+        rolls the same partition index over, so positions, row counts and
+        partitions remembered from an earlier read go stale as soon as
+        another host commits. The mirrors and the partition index are
+        therefore re-read with one values_batch_get, bypassing the read
+        cache, right before each batch that writes log rows. A commit by
+        another host between this read and the batch can still move rows;
+        that window is a single round trip.
+
+        Args:
+            views: Keyed worksheets the batch will upsert
+        """
+        ranges = [self._keyed_range(view) for view in views]
+        if self.partitions is not None:
+            width = len(self.PARTITION_INDEX_CONFIG['headers'])
+            last_column = gspread.utils.rowcol_to_a1(1, width)[:-1]
+            ranges.append(self._a1(self.index_name, f"A2:{last_column}"))
+        if not ranges:
+            return
+        values = self._read_ranges(ranges, fresh=True)
+        for view, rows in zip(views, values):
+            view.load(rows)
+        if self.partitions is not None:
+            self._load_partition_index(values[-1])
+
+    @staticmethod
+    def _is_sheet_conflict(error: Exception) -> bool:
+        """Whether a batch was rejected because a worksheet it adds exists"""
+        return (isinstance(error, gspread.exceptions.APIError)
+                and getattr(error.response, 'status_code', None) == 400
+                and 'already exists' in str(error))
+
+    def _commit_fresh(self, plan: Callable[[SheetBatch], None],
+                      views: List[KeyedRows]) -> Dict[str, Any]:
+        """
+        📤 Plan a batch from freshly read state and commit it
+
+        If another host created a worksheet the batch adds (the new month's
+        partition) after the read, the API rejects the whole batch. The
+        worksheet list and partition index are then re-read and the batch
+        is planned again, so the rows land in the existing partition.
+
+        Args:
+            plan: Queues the batch's writes (may run twice)
+            views: Keyed worksheets the batch will upsert
+
+        Returns:
+            The batchUpdate API response
+        """
+        for attempt in range(2):
+            self._refresh_for_write(views)
+            batch = self.new_batch()
+            plan(batch)
+            try:
+                return self.commit(batch)
+            except Exception as e:
+                if attempt or not self._is_sheet_conflict(e):
+                    raise
+                log.info(f"Worksheet created by another writer; re-planning ({e})")
+                self._worksheets = {
+                    ws.title: ws for ws in self.spreadsheet.worksheets()
+                }
+
+    def _queue_keyed_views(self, batch: SheetBatch, rows: List[List[Any]]) -> None:
+        """
+        Queue Current State and Host Summary upserts for a sync
+        
+        Args:
+            batch: Batch carrying the sync's last chunk
+            rows: All of the sync's rows in SHEET_CONFIG['headers'] order
+        """
+        self._load_keyed([view for view in self._keyed_views() if not view.loaded])
+        if self.current_state:
+            # A sync replaces everything its (hostname, username) pairs had
+            self.current_state.queue_upsert(
+                batch, self._sheet_id(self.current_state.name, batch), rows, scope=2
+            )
+        if self.summary:
+            self.summary.queue_upsert(
+                batch, self._sheet_id(self.summary.name, batch),
+                build_summary_rows(rows)
+            )
+
+    def _queue_keyed_chunk(self, batch: SheetBatch, rows: List[List[Any]],
+                           seen: Set[Tuple[str, ...]], totals: SummaryTotals,
+                           last: bool) -> None:
+        """
+        Queue one streamed chunk's share of the Current State and Host Summary upserts
+        
+        Args:
+            batch: Batch carrying the chunk
+            rows: The chunk's rows in SHEET_CONFIG['headers'] order
+            seen: Current State keys of the sync's earlier chunks
+            totals: Host Summary totals of the sync's earlier chunks
+            last: Whether this is the sync's last chunk
+        """
+        self._load_keyed([view for view in self._keyed_views() if not view.loaded])
+        if self.current_state:
+            # Vanished profiles can only be pruned once the whole sync is known
+            self.current_state.queue_upsert(
+                batch, self._sheet_id(self.current_state.name, batch), rows,
+                scope=2 if last else 0, seen=seen
+            )
+        if self.summary and last:
+            totals = {group: list(counts) for group, counts in totals.items()}
+            self.summary.queue_upsert(
+                batch, self._sheet_id(self.summary.name, batch),
+                summary_rows(tally_summary(rows, totals))
+            )
+
+    def get_current_state(self, hostname: Optional[str] = None) -> List[List[str]]:
+        """
+        🗂️ Latest row of every profile, read directly from Current State
+        
+        The read also refreshes the cached key-to-row index.
+        
+        Args:
+            hostname: Only rows of this host
+            
+        Returns:
+            Rows in SHEET_CONFIG['headers'] order
+        """
+        if self.current_state is None:
+            log.warning("Current state is not enabled for this sheets manager")
+            return []
+        try:
+            self._load_keyed([self.current_state])
+            return [
+                row for row in self.current_state.rows
+                if hostname is None or row[1] == hostname
+            ]
+        except Exception as e:
+            self.current_state.invalidate()
+            log.error(f"Error reading current state: {e}")
+            return []
+
+    def add_row_listener(self,
+                         listener: Callable[[List[List[str]], str], None]) -> None:
+        """
+        👂 Register a callback for rows once they are committed
+        
+        Listeners receive full-width rows (SHEET_CONFIG['headers'] order)
+        and the sync ID they were committed under, for each committed chunk
+        in commit order.
+        """
+        self._row_listeners.append(listener)
+
+    def add_sync_listener(self, listener: Callable[[], None]) -> None:
+        """
+        🏁 Register a callback for the end of each sync
+        
+        Listeners run once per update_profiles, stream_update or backfill
+        call (also when it failed part way) and once per committed
+        queue_profiles batch, after the row listeners saw its last chunk,
+        e.g. to persist state once per sync rather than once per chunk.
+        """
+        self._sync_listeners.append(listener)
+
+    def _notify_rows(self, rows: List[List[str]], sync_id: str) -> None:
+        """Pass committed rows to listeners; a failing listener never fails the sync"""
+        for listener in self._row_listeners:
+            try:
+                listener(rows, sync_id)
+            except Exception as e:
+                log.error(f"Row listener failed: {e}")
+
+    def _notify_sync_end(self) -> None:
+        """Run sync listeners; a failing listener never fails the sync"""
+        for listener in self._sync_listeners:
+            try:
+                listener()
+            except Exception as e:
+                log.error(f"Sync listener failed: {e}")
+
+    def _build_log_rows(self, profiles: Iterable[ProfileLike], system_info: Dict,
+                        timestamp: str) -> Tuple[List[List[str]], Dict[str, List[str]]]:
+        """Build log rows (and host snapshots for the normalized layout)"""
+        log.debug("Preparing profile data for sheet update...")
+        if self.layout == 'normalized':
+            return build_normalized_rows(profiles, system_info, timestamp)
+        return build_rows(profiles, system_info, timestamp), {}
+
+    def _default_sync_id(self, system_info: Dict, timestamp: str, n_rows: int) -> str:
+        """Sync ID of a scan written to this target"""
+        return make_sync_id(
+            system_info.get('hostname', ''), system_info.get('username', ''),
+            timestamp, n_rows, self.spreadsheet_id, self.log_config['name']
+        )
+
+    def _queue_chunk(self, batch: SheetBatch, chunk: RowChunk,
+                     hosts: Dict[str, List[str]], system_info: Dict,
+                     timestamp: str, sync_id: str,
+                     sync_rows: Optional[List[List[str]]] = None) -> None:
+        """Queue one chunk of log rows with its hosts, Sync Log entry and keyed views"""
+        if hosts:
+            self._queue_new_hosts(batch, hosts, timestamp)
+        target = self._queue_log_rows(batch, chunk.rows, timestamp, chunk.row_data)
+        batch.append_rows(
+            self._sheet_id(self.SYNC_LOG_CONFIG['name'], batch),
+            [[sync_id, timestamp, system_info.get('hostname', ''),
+              len(chunk.rows), target]]
+        )
+        batch.sync_ids.append(sync_id)
+        if sync_rows is not None:
+            self._queue_keyed_views(batch, sync_rows)
+        if self._row_listeners:
+            rows = self._full_rows(chunk.rows, hosts)
+            batch.on_commit(lambda: self._notify_rows(rows, sync_id))
+
+    def _full_rows(self, rows: List[List[str]],
+                   hosts: Dict[str, List[str]]) -> List[List[str]]:
+        """Log rows in SHEET_CONFIG['headers'] order"""
+        return join_host_rows(rows, hosts) if self.layout == 'normalized' else rows
+
+    def queue_profiles(self, batch: SheetBatch, profiles: Iterable[ProfileLike],
+                       system_info: Dict, timestamp: Optional[str] = None,
+                       sync_id: Optional[str] = None) -> int:
+        """
+        📝 Queue a sync's profile rows and their bookkeeping into one batch
+        
+        Unlike update_profiles, the rows are not split into chunks. The
+        Current State and Host Summary upserts, if enabled, are queued into
+        the same batch, planned from a fresh read, so the batch should be
+        committed right away.
+        
+        Args:
+            batch: Batch collecting this sync's writes
+            profiles: Profile records (or tmp-file dicts)
+            system_info: Sheet-formatted system info
+            timestamp: Sync timestamp (defaults to now)
+            sync_id: Idempotency key for this sync; defaults to a hash of
+                host, user, timestamp, row count and target worksheet, so
+                replaying the same scan to the same target yields the same ID
+            
+        Returns:
+            Number of profile rows queued
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        rows, hosts = self._build_log_rows(profiles, system_info, timestamp)
+        if rows:
+            self._refresh_for_write(self._keyed_views())
+            self._queue_chunk(
+                batch, RowChunk(rows, None, 0), hosts, system_info, timestamp,
+                sync_id or self._default_sync_id(system_info, timestamp, len(rows)),
+                self._full_rows(rows, hosts) if self._keyed_views() else None
+            )
+            if self._sync_listeners:
+                batch.on_commit(self._notify_sync_end)
+        return len(rows)
+
+    def update_profiles(self, profiles: Iterable[ProfileLike], system_info: Dict,
+                        timestamp: Optional[str] = None,
+                        sync_id: Optional[str] = None) -> bool:
+        """
+        Update sheet with profile and system information
+        
+        Rows are split into chunks of at most chunk_rows rows and
+        chunk_bytes of encoded data. Chunks are encoded ahead on a small
+        pool but committed strictly in order, each in its own batch with its
+        own sync ID ("<sync_id>:<n>" when there is more than one). After a
+        failure, replaying the same scan skips every chunk already committed
+        and resumes from the first one that was not. The Current State and
+        Host Summary upserts, if enabled, ride in the last chunk's batch.
+        
+        Returns:
+            True if every row is committed (including by an earlier replay)
+        """
+        try:
+            timestamp = timestamp or datetime.now().isoformat()
+            rows, hosts = self._build_log_rows(profiles, system_info, timestamp)
+            if not rows:
+                log.warning("No rows to update")
+                return False
+            
+            sync_id = sync_id or self._default_sync_id(
+                system_info, timestamp, len(rows)
+            )
+            if self.is_synced(sync_id):
+                log.info(f"Sync {sync_id} already committed; skipping")
                 return True
             
-            log.warning("No rows to update")
-            return False
+            chunks = iter_row_chunks(
+                rows, self.chunk_rows, self.chunk_bytes, self.pipeline_depth
+            )
+            chunk = next(chunks)
+            following = next(chunks, None)
+            index = 0
+            while chunk is not None:
+                single = following is None and index == 0
+                chunk_id = sync_id if single else f"{sync_id}:{index}"
+                if self.is_synced(chunk_id):
+                    log.info(f"Chunk {chunk_id} already committed; skipping")
+                else:
+                    sync_rows = (
+                        self._full_rows(rows, hosts)
+                        if following is None and self._keyed_views() else None
+                    )
+                    log.debug(
+                        f"Committing chunk {chunk_id}: "
+                        f"{len(chunk.rows)} rows, {chunk.size} bytes"
+                    )
+                    self._commit_fresh(
+                        partial(
+                            self._queue_chunk, chunk=chunk, hosts=hosts,
+                            system_info=system_info, timestamp=timestamp,
+                            sync_id=chunk_id, sync_rows=sync_rows
+                        ),
+                        self._keyed_views() if sync_rows is not None else []
+                    )
+                chunk, following, index = following, next(chunks, None), index + 1
+            
+            log.info(
+                f"Successfully updated {len(rows)} profile entries in {index} chunk(s)"
+            )
+            return True
             
         except Exception as e:
+            for view in self._keyed_views():
+                view.invalidate()  # Re-read the mirror rather than trust it
             log.error(f"Error updating sheet: {e}")
             return False
+        finally:
+            self._notify_sync_end()
+
+    def stream_update(self, profiles: Iterable[ProfileLike], system_info: Dict,
+                      timestamp: Optional[str] = None,
+                      sync_id: Optional[str] = None) -> bool:
+        """
+        🚰 Update the sheet from a stream of profiles in bounded memory
+        
+        Profiles are turned into rows a chunk_rows batch at a time and sent
+        in chunks as soon as each fills, so only a few chunks are held
+        however long the stream is. A chunk is committed in its own batch
+        as "<sync_id>:<n>" and skipped if already committed, so replaying
+        the same scan with the same timestamp only sends the missing
+        chunks. The row count is unknown until the end, so the default sync
+        ID leaves it out and differs from the one update_profiles gives the
+        same scan. Current State is upserted chunk by chunk and pruned of
+        vanished profiles with the last chunk, which also carries the Host
+        Summary upsert.
+        
+        Args:
+            profiles: Profile records, consumed once
+            system_info: Sheet-formatted system info
+            timestamp: Sync timestamp (defaults to now)
+            sync_id: Idempotency key of the sync (derived from the scan by default)
+            
+        Returns:
+            True if every row is committed
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        sync_id = sync_id or make_sync_id(
+            system_info.get('hostname', ''), system_info.get('username', ''),
+            timestamp, 'stream', self.spreadsheet_id, self.log_config['name']
+        )
+        hosts: Dict[str, List[str]] = {}
+        seen: Set[Tuple[str, ...]] = set()
+        totals: SummaryTotals = {}
+        
+        def iter_rows() -> Iterator[List[str]]:
+            for batch in batched(profiles, self.chunk_rows):
+                rows, batch_hosts = self._build_log_rows(batch, system_info, timestamp)
+                hosts.update(batch_hosts)
+                yield from rows
+        
+        try:
+            chunks = iter_row_chunks(
+                iter_rows(), self.chunk_rows, self.chunk_bytes, self.pipeline_depth
+            )
+            chunk = next(chunks, None)
+            if chunk is None:
+                log.warning("No rows to update")
+                return False
+            
+            following = next(chunks, None)
+            index = total = 0
+            while chunk is not None:
+                chunk_id = f"{sync_id}:{index}"
+                full_rows = (
+                    self._full_rows(chunk.rows, hosts) if self._keyed_views() else []
+                )
+                if self.is_synced(chunk_id):
+                    log.info(f"Chunk {chunk_id} already committed; skipping")
+                else:
+                    last = following is None
+
+                    def plan(batch: SheetBatch) -> None:
+                        self._queue_chunk(
+                            batch, chunk, hosts, system_info, timestamp, chunk_id
+                        )
+                        if full_rows:
+                            self._queue_keyed_chunk(
+                                batch, full_rows, seen, totals, last
+                            )
+
+                    log.debug(
+                        f"Committing streamed chunk {chunk_id}: "
+                        f"{len(chunk.rows)} rows, {chunk.size} bytes"
+                    )
+                    # Host Summary is only rewritten with the last chunk
+                    self._commit_fresh(plan, [
+                        view for view in self._keyed_views()
+                        if full_rows and (last or view is self.current_state)
+                    ])
+                # Committed now or earlier, its profiles count for the final prune
+                if self.current_state:
+                    seen.update(self.current_state.key(row) for row in full_rows)
+                if self.summary:
+                    tally_summary(full_rows, totals)
+                total += len(chunk.rows)
+                chunk, following, index = following, next(chunks, None), index + 1
+            
+            log.info(
+                f"Successfully streamed {total} profile entries in {index} chunk(s)"
+            )
+            return True
+            
+        except Exception as e:
+            for view in self._keyed_views():
+                view.invalidate()
+            log.error(f"Error streaming to sheet: {e}")
+            return False
+        finally:
+            self._notify_sync_end()
+
+    def _same_partition(self, first: str, timestamp: str) -> bool:
+        """Whether rows at both timestamps may share one log write"""
+        if self.partitions is None or self.partitions.mode != 'monthly':
+            return True
+        return first[:7] == timestamp[:7]
+
+    def _queue_backfill(self, batch: SheetBatch,
+                        pending: List[Tuple[str, str, RowChunk]],
+                        hosts: Dict[str, List[str]], identity: Dict) -> None:
+        """Queue several snapshots as one log write plus a Sync Log entry each"""
+        first, last = pending[0][1], pending[-1][1]
+        if hosts:
+            self._queue_new_hosts(batch, hosts, first)
+        rows = [row for _, _, chunk in pending for row in chunk.rows]
+        row_data = [data for _, _, chunk in pending for data in chunk.row_data]
+        target = self._queue_log_rows(batch, rows, last, row_data, start=first)
+        batch.append_rows(
+            self._sheet_id(self.SYNC_LOG_CONFIG['name'], batch),
+            [[sync_id, timestamp, identity.get('hostname', ''),
+              len(chunk.rows), target]
+             for sync_id, timestamp, chunk in pending]
+        )
+        batch.sync_ids.extend(sync_id for sync_id, _, _ in pending)
+        if self._row_listeners:
+            for sync_id, _, chunk in pending:
+                full_rows = self._full_rows(chunk.rows, hosts)
+                batch.on_commit(partial(self._notify_rows, full_rows, sync_id))
+
+    def backfill(self, snapshots: Iterable[Tuple[str, List[ProfileLike]]],
+                 system_info: Dict,
+                 requests_per_minute: float = 50.0,
+                 identity: Optional[Dict] = None) -> BackfillResult:
+        """
+        📼 Upload historical snapshots in large, quota-paced batches
+
+        Snapshots are packed, in order and never split, into batches of up
+        to chunk_rows rows and chunk_bytes of encoded data (one monthly
+        partition per batch). Each snapshot keeps its own timestamp and
+        gets the sync ID a regular sync of it from the identity's host
+        would have, so snapshots
+        already in the sheet are skipped and an interrupted backfill
+        resumes where it stopped. Batches are sent no faster than
+        requests_per_minute, and the Current State and Host Summary
+        worksheets are left alone.
+
+        Args:
+            snapshots: (timestamp, profiles) pairs in timestamp order
+            system_info: Sheet-formatted system info for every row
+            requests_per_minute: Upper bound on batchUpdate calls per minute
+            identity: Hostname and username of the uploading host, for the
+                sync IDs and Sync Log entries (defaults to system_info)
+
+        Returns:
+            BackfillResult with uploaded and skipped snapshot counts
+        """
+        uploaded = skipped = pending_rows = pending_bytes = 0
+        pending: List[Tuple[str, str, RowChunk]] = []
+        hosts: Dict[str, List[str]] = {}
+        interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        next_send = 0.0
+
+        def flush() -> None:
+            nonlocal uploaded, next_send, pending_rows, pending_bytes
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            log.debug(f"Backfilling {len(pending)} snapshots from {pending[0][1]}")
+            next_send = time.monotonic() + interval
+            self._commit_fresh(
+                partial(self._queue_backfill, pending=pending, hosts=hosts,
+                        identity=identity or system_info),
+                []
+            )
+            uploaded += len(pending)
+            pending.clear()
+            hosts.clear()
+            pending_rows = pending_bytes = 0
+
+        try:
+            self._load_remote_sync_ids(complete=True)
+            for timestamp, profiles in snapshots:
+                rows, snapshot_hosts = self._build_log_rows(
+                    profiles, system_info, timestamp
+                )
+                if not rows:
+                    skipped += 1
+                    continue
+                sync_id = self._default_sync_id(
+                    identity or system_info, timestamp, len(rows)
+                )
+                if self.is_synced(sync_id):
+                    skipped += 1
+                    continue
+
+                chunk = encode_chunk(rows)
+                if pending and (
+                    pending_rows + len(rows) > self.chunk_rows
+                    or pending_bytes + chunk.size > self.chunk_bytes
+                    or not self._same_partition(pending[0][1], timestamp)
+                ):
+                    flush()
+                pending.append((sync_id, timestamp, chunk))
+                pending_rows += len(rows)
+                pending_bytes += chunk.size
+                hosts.update(snapshot_hosts)
+
+            if pending:
+                flush()
+        except Exception as e:
+            log.error(f"Backfill stopped after {uploaded} snapshots: {e}")
+            return BackfillResult(uploaded, skipped, False)
+        finally:
+            self._notify_sync_end()
+
+        return BackfillResult(uploaded, skipped, True)
 
     def get_last_sync_time(self) -> Optional[str]:
         """Get the timestamp of last sync"""
         try:
-            worksheet = self.spreadsheet.worksheet(self.SHEET_CONFIG['name'])
-            values = worksheet.get_all_values()
+            if self.partitions is not None:
+                self._load_partition_index()
+                active = self.partitions.active()
+                return active.end if active and active.rows else None
             
-            if len(values) > 1:
-                return values[-1][0]
-            return None
+            timestamps = self._read_column(self.log_config['name'])
+            return timestamps[-1] if timestamps else None
             
         except Exception as e:
             log.error(f"Error getting last sync time: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def _history_sheets(self, start: Optional[str], end: Optional[str]) -> List[str]:
+        """Log worksheets that may hold rows within [start, end]"""
+        if self.partitions is not None:
+            return [p.name for p in self.partitions.overlapping(start, end)]
+        return [self.log_config['name']]
+
+    def iter_history(self, start: Optional[str] = None, end: Optional[str] = None,
+                     chunk_rows: int = 5000) -> Iterator[List[List[str]]]:
+        """
+        📜 Stream logged rows within [start, end] in fixed-size chunks
+        
+        Each worksheet is read chunk_rows rows at a time, and the next chunk
+        is fetched on a background thread while the caller handles the
+        current one, so at most two chunks are held in memory.
+        
+        Args:
+            start: Optional ISO timestamp lower bound
+            end: Optional ISO timestamp upper bound
+            chunk_rows: Rows per read request
+            
+        Yields:
+            Non-empty lists of rows in SHEET_CONFIG['headers'] order (log order)
+        """
+        for name in self._history_sheets(start, end):
+            for values in self._iter_sheet_rows(name, 0, chunk_rows):
+                rows = [
+                    row for row in values
+                    if row[0] and (start is None or row[0] >= start)
+                    and (end is None or row[0] <= end)
+                ]
+                if self.layout == 'normalized':
+                    rows = join_host_rows(rows, self._hosts)
+                if rows:
+                    yield rows
+
+    def _iter_sheet_rows(self, name: str, offset: int,
+                         chunk_rows: int) -> Iterator[List[List[str]]]:
+        """Read a log worksheet's rows from offset on, prefetching the next chunk"""
+        width = len(self.log_config['headers'])
+
+        def fetch(first: int) -> List[List[str]]:
+            log.debug(f"Reading {name} rows {first}-{first + chunk_rows - 1}")
+            return self._read_rows(name, width, first, first + chunk_rows - 1)
+
+        with ThreadPoolExecutor(max_workers=1,
+                                thread_name_prefix="sheets-prefetch") as executor:
+            first = offset + 2  # Skip the header row
+            pending = executor.submit(fetch, first)
+            while pending is not None:
+                values = pending.result()
+                first += chunk_rows
+                pending = (
+                    executor.submit(fetch, first) if len(values) >= chunk_rows else None
+                )
+                if values:
+                    yield values
+
+    def log_worksheets(self) -> List[str]:
+        """Names of every log worksheet (all partitions, even other hosts' new ones)"""
+        if self.partitions is not None:
+            self._load_partition_index()
+        return self._history_sheets(None, None)
+
+    def iter_log_rows(self, name: str, offset: int = 0,
+                      chunk_rows: int = 5000) -> Iterator[List[List[str]]]:
+        """
+        📜 Stream one log worksheet's rows by position, unfiltered
+
+        Unlike iter_history, every data row is yielded (in worksheet
+        order), so callers can remember how far they have read.
+
+        Args:
+            name: Log worksheet (see log_worksheets)
+            offset: Data rows to skip
+            chunk_rows: Rows per read request
+
+        Yields:
+            Non-empty lists of rows in SHEET_CONFIG['headers'] order
+        """
+        for values in self._iter_sheet_rows(name, offset, chunk_rows):
+            if self.layout == 'normalized':
+                values = join_host_rows(values, self._hosts)
+            yield values
+
+    def get_history(self, start: Optional[str] = None,
+                    end: Optional[str] = None) -> List[List[str]]:
+        """
+        📜 Get logged rows with a timestamp within [start, end]
+        
+        Only partitions whose time range overlaps the query are read.
+        Normalized rows are joined with their host snapshots, so callers
+        always get full-width rows.
+        
+        Args:
+            start: Optional ISO timestamp lower bound
+            end: Optional ISO timestamp upper bound
+            
+        Returns:
+            List of rows in SHEET_CONFIG['headers'] order (log order)
+        """
+        try:
+            rows = []
+            for chunk in self.iter_history(start, end):
+                rows.extend(chunk)
+            return rows
+            
+        except Exception as e:
+            log.error(f"Error getting sheet history: {e}")
+            return []
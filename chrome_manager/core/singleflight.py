@@ -0,0 +1,223 @@
+"""
+chrome_manager/core/singleflight.py
+🛫 Per-user single-flight runs and shared rate-limit backoff
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+log = logging.getLogger("singleflight")
+
+def flight_key(*parts: object) -> str:
+    """🔑 File-safe key for the work identified by parts"""
+    encoded = '\x1f'.join(str(part) for part in parts).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+def _prepare_dir(path: Path) -> None:
+    """
+    Create the run directory private to this user, or refuse to use it
+
+    Raises:
+        PermissionError: If it is a symlink, owned by another user or
+            accessible to others
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"Run directory {path} is not owned by this user")
+    if info.st_mode & 0o077:
+        raise PermissionError(f"Run directory {path} is accessible to other users")
+
+def _open_owned(path: Path, flags: int) -> int:
+    """Open a run file without following symlinks, checking it is ours"""
+    fd = os.open(path, flags | os.O_NOFOLLOW, 0o600)
+    if os.fstat(fd).st_uid != os.getuid():
+        os.close(fd)
+        raise PermissionError(f"{path} is not owned by this user")
+    return fd
+
+@contextmanager
+def _locked(path: Path, blocking: bool = True) -> Iterator[Optional[int]]:
+    """Hold an exclusive flock on path (yields None if non-blocking and busy)"""
+    fd = _open_owned(path, os.O_RDWR | os.O_CREAT)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield None
+            return
+        try:
+            yield fd
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Atomically replace a JSON file (private to this user)"""
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f"{path.name}.", suffix='.tmp', dir=path.parent
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a JSON run file, ignoring it unless this user owns it"""
+    try:
+        with os.fdopen(_open_owned(path, os.O_RDONLY), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+class SingleFlight:
+    """
+    🛫 Runs identical work once per user, sharing the result with latecomers
+
+    The first process to ask for a key takes its lock file and runs the
+    work; processes asking while it runs wait on the lock and then reuse
+    the result it left in the key's result file. If the leader died
+    without a result, the next waiter runs the work itself. Results must
+    be JSON-serializable. Lock and result files live in a directory only
+    this user can access, so another local user cannot plant a result,
+    pre-create the files or redirect them through symlinks.
+    """
+
+    def __init__(self, root: Path, wait_timeout: float = 600.0):
+        """
+        Initialize single-flight coordinator
+
+        Args:
+            root: Per-user directory for lock and result files (0700)
+            wait_timeout: Seconds to wait for a running leader before
+                running the work independently
+        """
+        self.root = root
+        self.wait_timeout = wait_timeout
+
+    def run(self, key: str, work: Callable[[], Any]) -> Any:
+        """
+        🚀 Run work for key, or join the run already in flight
+
+        Args:
+            key: Identity of the work (see flight_key)
+            work: Callable producing a JSON-serializable result
+
+        Returns:
+            The work's result, possibly from another process's run
+        """
+        ran = False
+
+        def tracked() -> Any:
+            nonlocal ran
+            ran = True
+            return work()
+
+        try:
+            _prepare_dir(self.root)
+            lock_path = self.root / f"{key}.lock"
+            result_path = self.root / f"{key}.json"
+            deadline = time.monotonic() + self.wait_timeout
+            busy_since: Optional[float] = None
+
+            while True:
+                attempted = time.time()
+                with _locked(lock_path, blocking=False) as fd:
+                    if fd is not None:
+                        shared = (
+                            _read_json(result_path) if busy_since is not None else None
+                        )
+                        # Only a run that held the lock when it was found busy
+                        # (or started since) can have finished after that
+                        finished = shared.get('finished', 0) if shared else 0
+                        if shared and finished >= busy_since:
+                            log.info(f"Reusing result from process {shared.get('pid')}")
+                            return shared.get('result')
+                        return self._lead(result_path, tracked)
+
+                if busy_since is None:
+                    busy_since = attempted
+                    log.info(
+                        "Same work already running on this host; waiting for its result"
+                    )
+                if time.monotonic() >= deadline:
+                    log.warning(
+                        "Timed out waiting for the running instance; "
+                        "running independently"
+                    )
+                    return tracked()
+                time.sleep(0.2)
+
+        except OSError as e:
+            if ran:
+                raise
+            log.warning(f"Single-flight unavailable ({e}); running independently")
+            return work()
+
+    @staticmethod
+    def _lead(result_path: Path, work: Callable[[], Any]) -> Any:
+        """Run the work while holding the lock and publish its result"""
+        started = time.time()
+        result = work()
+        try:
+            _write_json(result_path, {
+                'pid': os.getpid(), 'started': started,
+                'finished': time.time(), 'result': result
+            })
+        except (OSError, TypeError) as e:
+            log.warning(f"Could not share result: {e}")
+        return result
+
+class SharedBackoff:
+    """
+    ⏳ Rate-limit backoff shared by every process of this user
+
+    A process that is rate limited pushes a resume time into a shared file;
+    every process waits for it before sending further requests, so one
+    429 slows them all down instead of each process finding out alone.
+    """
+
+    def __init__(self, path: Path, max_wait: float = 60.0):
+        """
+        Initialize shared backoff
+
+        Args:
+            path: JSON file in the per-user run directory holding the resume time
+            max_wait: Upper bound on a single wait
+        """
+        self.path = path
+        self.max_wait = max_wait
+
+    def wait(self) -> float:
+        """Sleep until the shared resume time; returns seconds slept"""
+        state = _read_json(self.path)
+        delay = min(self.max_wait, (state or {}).get('until', 0) - time.time())
+        if delay <= 0:
+            return 0.0
+        log.info(f"Host is rate limited; waiting {delay:.1f}s")
+        time.sleep(delay)
+        return delay
+
+    def push(self, delay: float) -> None:
+        """Ask every process to hold off for delay seconds"""
+        try:
+            _prepare_dir(self.path.parent)
+            with _locked(self.path.with_suffix('.lock')):
+                state = _read_json(self.path) or {}
+                until = max(state.get('until', 0), time.time() + delay)
+                _write_json(self.path, {'until': until, 'pid': os.getpid()})
+        except OSError as e:
+            log.warning(f"Could not share backoff: {e}")
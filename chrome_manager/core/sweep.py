@@ -0,0 +1,140 @@
+"""
+chrome_manager/core/sweep.py
+🖥️ Multi-user, multi-browser host sweep with process-pool fan-out
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from chrome_manager.core.records import ProfileRecord
+from chrome_manager.core.scanner import ProfileScanner
+
+log = logging.getLogger("host_sweep")
+
+# Config directory name under ~/.config -> browser label
+BROWSER_DIRS = {
+    'google-chrome': 'Chrome',
+    'google-chrome-beta': 'Chrome Beta',
+    'google-chrome-unstable': 'Chrome Dev',
+    'chromium': 'Chromium',
+}
+
+class ConfigRoot(NamedTuple):
+    """📍 One browser config directory owned by one user"""
+    username: str
+    browser: str
+    path: str
+
+def discover_config_roots(home_root: Path = Path('/home'),
+                          extra_homes: Iterable[Path] = ()) -> List[ConfigRoot]:
+    """
+    🔎 Find every browser config root under the user home directories
+
+    Args:
+        home_root: Directory holding user homes (e.g. /home)
+        extra_homes: Additional home directories outside home_root (e.g. /root)
+
+    Returns:
+        ConfigRoot per existing browser config directory, ordered by user
+    """
+    homes = []
+    try:
+        with os.scandir(home_root) as entries:
+            homes = [Path(entry.path) for entry in entries if entry.is_dir()]
+    except OSError as e:
+        log.warning(f"Cannot list home directories in {home_root}: {e}")
+
+    seen = set()
+    roots = []
+    for home in sorted(set(homes) | set(extra_homes)):
+        for dir_name, browser in BROWSER_DIRS.items():
+            config_dir = home / '.config' / dir_name
+            try:
+                if not config_dir.is_dir():
+                    continue
+                real = config_dir.resolve()
+            except OSError:
+                continue
+            if real in seen:
+                continue
+            seen.add(real)
+            roots.append(ConfigRoot(home.name, browser, str(config_dir)))
+
+    log.debug(f"Discovered {len(roots)} browser config roots")
+    return roots
+
+def scan_config_root(root: ConfigRoot, measure_disk: bool = False,
+                     collect_inventory: bool = False) -> List[ProfileRecord]:
+    """
+    🔍 Scan one config root and attribute its profiles
+
+    Module-level so it can run in a worker process.
+    """
+    try:
+        scanner = ProfileScanner(
+            Path(root.path), measure_disk=measure_disk,
+            collect_inventory=collect_inventory
+        )
+        records = list(scanner.iter_profiles())
+    except OSError as e:
+        log.warning(f"Skipping {root.path}: {e}")
+        return []
+
+    for record in records:
+        record.username = root.username
+        record.browser = root.browser
+    return records
+
+def iter_sweep(home_root: Path = Path('/home'), max_workers: Optional[int] = None,
+               measure_disk: bool = False,
+               collect_inventory: bool = False) -> Iterator[ProfileRecord]:
+    """
+    🖥️ Lazily scan every user's browser profiles on this host
+
+    Config roots are scanned in parallel across a process pool; records
+    are yielded in discovery order (by user, then browser) as each root's
+    results arrive.
+
+    Args:
+        home_root: Directory holding user homes
+        max_workers: Process pool size (defaults to CPU count)
+        measure_disk: Record each profile directory's disk usage
+        collect_inventory: Record extension, bookmark and History metrics
+
+    Yields:
+        ProfileRecord objects carrying username and browser
+    """
+    roots = discover_config_roots(home_root, extra_homes=[Path.home()])
+    if not roots:
+        log.warning("No browser config roots found")
+        return
+
+    scan = partial(scan_config_root, measure_disk=measure_disk,
+                   collect_inventory=collect_inventory)
+    if len(roots) == 1 or max_workers == 1:
+        for root in roots:
+            yield from scan(root)
+        return
+
+    workers = min(max_workers or os.cpu_count() or 1, len(roots))
+    chunksize = max(1, len(roots) // (workers * 4))
+    log.debug(f"Sweeping {len(roots)} config roots on {workers} workers")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for records in executor.map(scan, roots, chunksize=chunksize):
+            yield from records
+
+def sweep_host(home_root: Path = Path('/home'), max_workers: Optional[int] = None,
+               measure_disk: bool = False,
+               collect_inventory: bool = False) -> List[ProfileRecord]:
+    """
+    🖥️ Scan every user's browser profiles on this host
+
+    Returns:
+        List of ProfileRecord objects carrying username and browser
+    """
+    return list(iter_sweep(home_root, max_workers, measure_disk, collect_inventory))
@@ -0,0 +1,173 @@
+"""
+chrome_manager/utils/formatters.py
+🧾 Streaming record writers for JSON, NDJSON, CSV and Parquet output
+"""
+
+import csv
+import json
+from datetime import datetime
+from typing import Any, Dict, IO, List, Optional, Sequence
+
+try:  # Optional: only needed for Parquet output
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+FORMATS = ('json', 'csv', 'ndjson')
+BINARY_FORMATS = ('parquet',)
+
+class RecordWriter:
+    """🧾 Writes records to a stream one at a time"""
+
+    def __init__(self, stream: IO[str], columns: Sequence[str], flush: bool = True):
+        """
+        Initialize writer
+
+        Args:
+            stream: Text stream to write to
+            columns: Field order for each record
+            flush: Flush after every record so piped consumers see it at once
+        """
+        self.stream = stream
+        self.columns = list(columns)
+        self.flush = flush
+        self.count = 0
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record"""
+        self._write(record)
+        self.count += 1
+        if self.flush:
+            self.stream.flush()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Finish the output (does not close the stream)"""
+        self.stream.flush()
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+class NDJSONWriter(RecordWriter):
+    """One JSON object per line"""
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps({c: record.get(c) for c in self.columns}) + '\n')
+
+class JSONWriter(RecordWriter):
+    """A single JSON array, emitted element by element"""
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(('[\n  ' if self.count == 0 else ',\n  ')
+                          + json.dumps({c: record.get(c) for c in self.columns}))
+
+    def close(self) -> None:
+        self.stream.write('[]\n' if self.count == 0 else '\n]\n')
+        super().close()
+
+class CSVWriter(RecordWriter):
+    """CSV with a header row"""
+
+    def __init__(self, stream: IO[str], columns: Sequence[str], flush: bool = True):
+        super().__init__(stream, columns, flush)
+        self._writer = csv.DictWriter(
+            stream, fieldnames=self.columns, extrasaction='ignore'
+        )
+        self._writer.writeheader()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._writer.writerow(record)
+
+class ParquetWriter(RecordWriter):
+    """
+    Parquet file with typed columns, one row group per buffered chunk
+
+    Column types are 'string', 'int', 'float' or 'timestamp' (ISO strings);
+    values that do not convert are written as nulls.
+    """
+
+    ARROW_TYPES = {
+        'string': lambda: pyarrow.string(),
+        'int': lambda: pyarrow.int64(),
+        'float': lambda: pyarrow.float64(),
+        'timestamp': lambda: pyarrow.timestamp('us'),
+    }
+
+    def __init__(self, stream: IO[bytes], columns: Sequence[str], flush: bool = True,
+                 types: Optional[Dict[str, str]] = None, row_group_size: int = 5000):
+        if pyarrow is None:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+        super().__init__(stream, columns, flush)
+        self.types = {
+            column: (types or {}).get(column, 'string') for column in self.columns
+        }
+        self.row_group_size = row_group_size
+        self.schema = pyarrow.schema(
+            [(column, self.ARROW_TYPES[self.types[column]]())
+             for column in self.columns]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(stream, self.schema)
+        self._buffer: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def _timestamp(value: Any) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(value) if value else None
+        except (TypeError, ValueError):
+            return None
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._buffer.append(record)
+        if len(self._buffer) >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        """Write buffered records as one row group"""
+        if not self._buffer:
+            return
+        arrays = []
+        for column, field in zip(self.columns, self.schema):
+            values = [record.get(column) for record in self._buffer]
+            if self.types[column] == 'timestamp':
+                values = [self._timestamp(value) for value in values]
+            arrays.append(pyarrow.array(values, type=field.type))
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+        self._buffer = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Buffer one record (row groups are flushed as they fill)"""
+        self._write(record)
+        self.count += 1
+
+    def close(self) -> None:
+        self._write_row_group()
+        self._writer.close()
+        super().close()
+
+def open_writer(fmt: str, stream: IO, columns: Sequence[str], flush: bool = True,
+                types: Optional[Dict[str, str]] = None) -> RecordWriter:
+    """
+    🧾 Create a streaming writer for an output format
+
+    Args:
+        fmt: One of FORMATS (text stream) or BINARY_FORMATS (binary stream)
+        stream: Stream to write to
+        columns: Field order for each record
+        flush: Flush after every record
+        types: Column types for typed formats ('string', 'int', 'float', 'timestamp')
+
+    Returns:
+        RecordWriter for the format
+    """
+    if fmt == 'parquet':
+        return ParquetWriter(stream, columns, flush, types=types)
+    writers = {'json': JSONWriter, 'csv': CSVWriter, 'ndjson': NDJSONWriter}
+    if fmt not in writers:
+        raise ValueError(f"Unknown output format: {fmt}")
+    return writers[fmt](stream, columns, flush)
@@ -0,0 +1,324 @@
+"""
+chrome_manager/utils/profiling.py
+⏱️ Opt-in profiling of CLI commands with a per-phase breakdown
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from types import FrameType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console(stderr=True)
+log = logging.getLogger("profiling")
+
+PHASES = ('scan', 'system-info', 'sheets')
+
+# Frames from these paths belong to a phase when no phase was entered explicitly
+# (worker threads of scan pools, fan-out targets and read prefetching)
+PHASE_PATHS = {
+    'scan': ('chrome_manager/core/scanner', 'chrome_manager/core/sweep',
+             'chrome_manager/core/disk_usage', 'chrome_manager/core/inventory',
+             'chrome_manager/utils/chrome_scanner'),
+    'system-info': ('chrome_manager/utils/system_info', '/psutil/', '/distro/'),
+    'sheets': ('chrome_manager/core/sheets', 'chrome_manager/core/batch',
+               'chrome_manager/core/fanout', '/gspread/', '/google/auth/'),
+}
+
+# From Python 3.12 cProfile runs on sys.monitoring: only one profiler may
+# be enabled per interpreter, and it already sees calls on every thread
+_SHARED_PROFILER = sys.version_info >= (3, 12)
+
+_active: Optional['Profiler'] = None
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    ⏱️ Attribute the enclosed work to a phase while a profiler is active
+
+    Phases nest: time spent in an inner phase is taken off the enclosing
+    one, so waits inside a phase can be attributed elsewhere. Costs
+    nothing when profiling is off.
+
+    Args:
+        name: One of PHASES
+    """
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    tid = threading.get_ident()
+    stack = profiler._phase_stacks[tid]
+    stack.append(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        stack.pop()
+        with profiler._lock:
+            profiler.phase_times[name] += elapsed
+            if stack:
+                profiler.phase_times[stack[-1]] -= elapsed
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+def _path_phase(filename: str) -> Optional[str]:
+    """Phase a source file belongs to, if any"""
+    filename = filename.replace(os.sep, '/')
+    for name, paths in PHASE_PATHS.items():
+        if any(path in filename for path in paths):
+            return name
+    return None
+
+class Profiler:
+    """
+    ⏱️ Profiles one command run and writes a flame graph input plus a summary
+
+    'sample' mode polls every thread's stack at a fixed interval and writes
+    folded stacks ("phase;frame;...;frame count", one line per distinct
+    stack) that flamegraph.pl, speedscope and inferno read directly. It is
+    wall-clock based, so waits on the network count. 'cprofile' mode runs
+    the deterministic profiler on the calling thread and on every thread
+    started while it runs (scan producers, worker pools), and writes their
+    merged stats to a .prof file for snakeviz or flameprof. Before Python
+    3.12 each new thread gets its own profiler and threads that were
+    already running are not covered; from 3.12 the one profiler allowed
+    covers every thread. Both report the wall time of each phase and the
+    hottest functions.
+    """
+
+    MODES = ('sample', 'cprofile')
+
+    def __init__(self, mode: str = 'sample',
+                 output_dir: Path = Path("tmp") / "profiles", label: str = 'command',
+                 interval: float = 0.005, top: int = 15):
+        """
+        Initialize profiler
+
+        Args:
+            mode: 'sample' or 'cprofile'
+            output_dir: Directory the profile files are written to
+            label: Name of the profiled command (used in file names)
+            interval: Seconds between samples in 'sample' mode
+            top: Number of hot functions in the summary
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.mode = mode
+        self.output_dir = output_dir
+        self.label = label
+        self.interval = interval
+        self.top = top
+        self.phase_times: Dict[str, float] = defaultdict(float)
+        self.stacks: Counter = Counter()
+        self.elapsed = 0.0
+        self._phase_stacks: Dict[int, List[str]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._profile: Optional[cProfile.Profile] = None
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._stats: Optional[pstats.Stats] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started = 0.0
+
+    # -------------------------------------------------------------- sampling
+
+    def _sample_phase(self, tid: int, frames: List[FrameType]) -> str:
+        """Phase of a sampled stack: the thread's entered phase, else by module"""
+        entered = self._phase_stacks.get(tid)
+        if entered:
+            return entered[-1]
+        for frame in frames:  # Outermost first
+            name = _path_phase(frame.f_code.co_filename)
+            if name:
+                return name
+        return 'other'
+
+    def _sample(self) -> None:
+        """Sampler thread: record every other thread's stack each interval"""
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for tid, frame in sys._current_frames().items():
+                if tid == own:
+                    continue
+                frames = []
+                while frame is not None:
+                    frames.append(frame)
+                    frame = frame.f_back
+                frames.reverse()
+                stack = (self._sample_phase(tid, frames),)
+                stack += tuple(_frame_label(f) for f in frames)
+                self.stacks[stack] += 1
+
+    def _profile_thread(self, frame: FrameType, event: str, arg: object) -> None:
+        """threading.setprofile hook: give each new thread its own cProfile"""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()  # Replaces this hook for the rest of the thread
+        except ValueError as e:  # Another profiler holds the interpreter
+            sys.setprofile(None)
+            log.debug(f"Not profiling {threading.current_thread().name}: {e}")
+            return
+        with self._lock:
+            self._thread_profiles.append(profile)
+
+    def _merged_stats(self) -> pstats.Stats:
+        """Stats of the calling thread plus every profiled worker thread"""
+        stats = pstats.Stats(self._profile)
+        with self._lock:
+            profiles, self._thread_profiles = self._thread_profiles, []
+        for profile in profiles:
+            try:
+                stats.add(profile)
+            except TypeError:  # The thread made no calls
+                continue
+        return stats
+
+    # ------------------------------------------------------------- lifecycle
+
+    def start(self) -> None:
+        """▶️ Start profiling (one profiler at a time)"""
+        global _active
+        if _active is not None:
+            raise RuntimeError("A profiler is already running")
+        _active = self
+        self._started = time.perf_counter()
+        if self.mode == 'cprofile':
+            self._profile = cProfile.Profile()
+            if not _SHARED_PROFILER:
+                threading.setprofile(self._profile_thread)
+            self._profile.enable()
+        else:
+            self._stop.clear()
+            self._sampler = threading.Thread(
+                target=self._sample, name="profiler", daemon=True
+            )
+            self._sampler.start()
+
+    def stop(self) -> None:
+        """⏹️ Stop profiling"""
+        global _active
+        if self._profile is not None:
+            self._profile.disable()
+            if not _SHARED_PROFILER:
+                threading.setprofile(None)
+            self._stats = self._merged_stats()
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+        self.elapsed = time.perf_counter() - self._started
+        _active = None
+
+    def __enter__(self) -> 'Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+        try:
+            paths = self.write()
+            self.report(paths)
+        except Exception as e:
+            log.error(f"Could not write profile: {e}")
+
+    # ---------------------------------------------------------------- output
+
+    def hot_functions(self) -> List[Tuple[str, str, float, float]]:
+        """
+        🔥 Hottest functions, excluding time outside the phases in 'sample' mode
+
+        Returns:
+            (function, phase, self seconds, total seconds) tuples, by self time
+        """
+        if self.mode == 'cprofile':
+            stats = self._stats.stats
+            ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+            return [
+                (f"{func} ({os.path.basename(filename)}:{line})",
+                 _path_phase(filename) or 'other', tottime, cumtime)
+                for (filename, line, func), (_, _, tottime, cumtime, _)
+                in ranked[:self.top]
+            ]
+
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.stacks.items():
+            if stack[0] == 'other' or len(stack) < 2:
+                continue
+            own[(stack[-1], stack[0])] += count
+            for frame in set(stack[1:]):
+                total[(frame, stack[0])] += count
+        return [
+            (frame, name, count * self.interval, total[(frame, name)] * self.interval)
+            for (frame, name), count in own.most_common(self.top)
+        ]
+
+    def write(self) -> Dict[str, Path]:
+        """
+        💾 Write the flame graph input and the text summary
+
+        Returns:
+            Mapping of output kind to path
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        started = datetime.now().strftime('%Y%m%d-%H%M%S')
+        base = self.output_dir / f"{started}-{os.getpid()}-{self.label}"
+        paths: Dict[str, Path] = {}
+
+        if self.mode == 'cprofile':
+            paths['pstats'] = base.with_suffix('.prof')
+            self._stats.dump_stats(str(paths['pstats']))
+        else:
+            paths['folded'] = base.with_suffix('.folded')
+            with open(paths['folded'], 'w', encoding='utf-8') as f:
+                for stack, count in sorted(self.stacks.items()):
+                    f.write(f"{';'.join(stack)} {count}\n")
+
+        paths['summary'] = base.with_suffix('.txt')
+        with open(paths['summary'], 'w', encoding='utf-8') as f:
+            f.write(f"{self.label}: {self.elapsed:.3f}s wall ({self.mode})\n\n")
+            for name in PHASES:
+                f.write(f"{name:<12} {self.phase_times.get(name, 0.0):9.3f}s\n")
+            f.write("\nself(s)   total(s)  phase        function\n")
+            for func, name, own, total in self.hot_functions():
+                f.write(f"{own:8.3f} {total:9.3f}  {name:<12} {func}\n")
+        return paths
+
+    def report(self, paths: Dict[str, Path]) -> None:
+        """📋 Print the phase breakdown and hot functions"""
+        phases = Table(title=f"⏱️ {self.label}: {self.elapsed:.2f}s ({self.mode})")
+        phases.add_column("Phase", style="cyan")
+        phases.add_column("Wall time", justify="right")
+        phases.add_column("Share", justify="right")
+        for name in PHASES:
+            seconds = self.phase_times.get(name, 0.0)
+            share = seconds / self.elapsed if self.elapsed else 0.0
+            phases.add_row(name, f"{seconds:.3f}s", f"{share:.0%}")
+
+        hot = Table(title="🔥 Hot functions")
+        hot.add_column("Self", justify="right", style="yellow")
+        hot.add_column("Total", justify="right")
+        hot.add_column("Phase", style="cyan")
+        hot.add_column("Function", style="white")
+        for func, name, own, total in self.hot_functions():
+            hot.add_row(f"{own:.3f}s", f"{total:.3f}s", name, func)
+
+        console.print(phases)
+        console.print(hot)
+        for kind, path in paths.items():
+            console.print(f"📝 {kind}: {path}")
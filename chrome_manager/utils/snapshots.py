@@ -0,0 +1,298 @@
+"""
+chrome_manager/utils/snapshots.py
+🗃️ Keyframe + delta history of profile scans
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from chrome_manager.core.records import ProfileRecord
+
+log = logging.getLogger("snapshots")
+
+def _dumps(value: Any) -> str:
+    """Compact JSON encoding used for history lines"""
+    return json.dumps(value, separators=(',', ':'))
+
+def profile_key(profile: Dict[str, Any]) -> str:
+    """🔑 Stable identity of a profile across scans"""
+    return profile.get('path') or profile.get('name', '')
+
+def profile_digest(profile: Dict[str, Any]) -> str:
+    """Content digest used to detect changed profiles"""
+    encoded = json.dumps(profile, sort_keys=True).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+class SnapshotStore:
+    """
+    🗃️ Scan history stored as periodic keyframes plus deltas
+
+    Each history line is one scan: a keyframe {"t", "k": [profiles]} or a
+    delta {"t", "u": [changed profiles], "r": [removed keys]} against the
+    previous scan (an unchanged scan is just {"t"}). Lines go into one
+    segment file per month, each starting with a keyframe; closed months
+    are gzipped. Digests of the latest scan are kept in state.json so a
+    new scan can be diffed while it streams in.
+    """
+
+    def __init__(self, root: Path = Path("tmp") / "snapshots",
+                 keyframe_interval: int = 288):
+        """
+        Initialize snapshot store
+
+        Args:
+            root: Directory holding history segments
+            keyframe_interval: Scans between keyframes (288 = daily at 5 min)
+        """
+        self.root = root
+        self.keyframe_interval = keyframe_interval
+        self.state_file = root / "state.json"
+
+    # ------------------------------------------------------------------ write
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Read the latest-scan digests"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable snapshot state: {e}")
+            return {}
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        """Atomically replace the latest-scan digests"""
+        tmp_file = self.state_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(_dumps(state))
+        os.replace(tmp_file, self.state_file)
+
+    def _segment_path(self, timestamp: str) -> Path:
+        return self.root / f"history-{timestamp[:7]}.jsonl"
+
+    def _compress_closed_segments(self, active: Path) -> None:
+        """
+        🗜️ Gzip plain segments of other months
+
+        A month written to again after it was closed (clock moved back, an
+        explicit earlier timestamp) is appended to its archive as another
+        gzip member, so the earlier history is kept.
+        """
+        for segment in self.root.glob("history-*.jsonl"):
+            if segment == active:
+                continue
+            with open(segment, 'rb') as src, gzip.open(f"{segment}.gz", 'ab') as dst:
+                dst.write(src.read())
+            segment.unlink()
+            log.debug(f"Compressed snapshot segment {segment.name}")
+
+    @staticmethod
+    def _open_for_append(path: Path) -> IO[str]:
+        """Open a segment for appending, terminating any torn last line"""
+        f = open(path, 'a+', encoding='utf-8')
+        if f.tell() > 0:
+            f.seek(f.tell() - 1)
+            if f.read(1) != '\n':
+                f.write('\n')
+        return f
+
+    def write(self, profiles: Iterable[ProfileRecord],
+              timestamp: Optional[str] = None) -> str:
+        """
+        💾 Append one scan to the history, streaming profiles as they arrive
+
+        Args:
+            profiles: Scanned profile records (consumed once)
+            timestamp: Scan timestamp (defaults to now)
+
+        Returns:
+            The snapshot timestamp
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        for _ in self.record(profiles, timestamp):
+            pass
+        return timestamp
+
+    def record(self, profiles: Iterable[ProfileRecord],
+               timestamp: str) -> Iterator[ProfileRecord]:
+        """
+        📼 Append one scan to the history while passing its records on
+
+        Each record is written before it is yielded, so the scan can feed
+        an uploader in the same pass. The history line is completed when
+        the records run out; if the scan fails or the consumer stops early,
+        the partial line is cut off again and nothing is recorded.
+
+        Args:
+            profiles: Scanned profile records (consumed once)
+            timestamp: Scan timestamp
+
+        Yields:
+            The records, unchanged
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        state = self._load_state()
+        segment = self._segment_path(timestamp)
+        previous = state.get('digests', {})
+        keyframe = (
+            not state
+            or state.get('segment') != segment.name
+            or state.get('since_keyframe', 0) + 1 >= self.keyframe_interval
+        )
+        if state.get('segment') != segment.name:
+            self._compress_closed_segments(segment)
+
+        digests: Dict[str, str] = {}
+        with self._open_for_append(segment) as f:
+            start = f.tell()
+            f.write(f'{{"t":{_dumps(timestamp)}')
+            opened = False
+            try:
+                for record in profiles:
+                    profile = record.to_dict()
+                    key = profile_key(profile)
+                    digest = digests[key] = profile_digest(profile)
+                    if keyframe or previous.get(key) != digest:
+                        if opened:
+                            prefix = ','
+                        else:
+                            prefix = ',"k":[' if keyframe else ',"u":['
+                        f.write(prefix + _dumps(profile))
+                        opened = True
+                    yield record
+            except BaseException:
+                f.truncate(start)
+                raise
+
+            if keyframe and not opened:
+                f.write(',"k":[')
+                opened = True
+            if opened:
+                f.write(']')
+            if not keyframe:
+                removed = [key for key in previous if key not in digests]
+                if removed:
+                    f.write(f',"r":{_dumps(removed)}')
+            f.write('}\n')
+
+        self._save_state({
+            'timestamp': timestamp,
+            'segment': segment.name,
+            'since_keyframe': 0 if keyframe else state.get('since_keyframe', 0) + 1,
+            'digests': digests,
+        })
+        kind = 'keyframe' if keyframe else 'delta'
+        log.debug(f"Recorded {kind} snapshot {timestamp}")
+
+    # ------------------------------------------------------------------- read
+
+    def _segments(self) -> List[Path]:
+        """History segments in chronological order"""
+        if not self.root.exists():
+            return []
+        # A month's archive holds lines written before its plain segment
+        return sorted(
+            list(self.root.glob("history-*.jsonl"))
+            + list(self.root.glob("history-*.jsonl.gz")),
+            key=lambda p: (p.name.split('.')[0], p.suffix != '.gz')
+        )
+
+    @staticmethod
+    def _read_lines(segment: Path) -> Iterator[str]:
+        opener = gzip.open if segment.suffix == '.gz' else open
+        with opener(segment, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.endswith('\n'):
+                    yield line
+
+    @staticmethod
+    def _line_timestamp(line: str) -> str:
+        """Timestamp of a history line without parsing the whole line"""
+        parts = line.split('"', 4)
+        return parts[3] if len(parts) > 4 else ''
+
+    @staticmethod
+    def _is_keyframe(line: str) -> bool:
+        parts = line.split('"', 4)
+        return len(parts) > 4 and parts[4].startswith(',"k":')
+
+    def list_snapshots(self, limit: Optional[int] = None) -> List[str]:
+        """
+        📋 Snapshot timestamps in chronological order
+
+        Args:
+            limit: Only return the most recent N
+        """
+        segments = self._segments()
+        timestamps: List[str] = []
+        for segment in reversed(segments):
+            timestamps[:0] = [
+                ts for ts in map(self._line_timestamp, self._read_lines(segment)) if ts
+            ]
+            if limit and len(timestamps) >= limit:
+                break
+        return timestamps[-limit:] if limit else timestamps
+
+    def load(self, timestamp: Optional[str] = None
+             ) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        📂 Reconstruct the profile list as of a snapshot
+
+        Only lines from the last keyframe at or before the target are parsed.
+        If that keyframe is corrupt, the one before it is used and the lines
+        in between are replayed as well.
+
+        Args:
+            timestamp: Snapshot timestamp (defaults to the latest); the latest
+                snapshot at or before it is returned
+
+        Returns:
+            Tuple of (snapshot timestamp, profile dicts), or None if no
+            snapshot exists at or before the timestamp
+        """
+        for segment in reversed(self._segments()):
+            if timestamp and segment.name[len("history-"):][:7] > timestamp[:7]:
+                continue
+
+            lines = [
+                line for line in self._read_lines(segment)
+                if not timestamp or self._line_timestamp(line) <= timestamp
+            ]
+            keyframe = None
+            candidates = [i for i, line in enumerate(lines) if self._is_keyframe(line)]
+            for start in reversed(candidates):
+                try:
+                    keyframe = json.loads(lines[start])
+                    break
+                except ValueError:
+                    log.warning(f"Corrupt snapshot keyframe in {segment.name}; "
+                                "falling back to the previous one")
+            if keyframe is None:
+                continue
+
+            found = keyframe['t']
+            state = {profile_key(p): p for p in keyframe['k']}
+            for line in lines[start + 1:]:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    log.warning(f"Skipping corrupt snapshot line in {segment.name}")
+                    continue
+                if 'k' in entry:
+                    state = {profile_key(p): p for p in entry['k']}
+                for profile in entry.get('u', []):
+                    state[profile_key(profile)] = profile
+                for key in entry.get('r', []):
+                    state.pop(key, None)
+                found = entry['t']
+            return found, list(state.values())
+
+        return None
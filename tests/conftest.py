@@ -0,0 +1,230 @@
+"""
+tests/conftest.py
+🧪 In-memory stand-in for a gspread spreadsheet and manager fixtures
+"""
+
+import itertools
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+import gspread
+import pytest
+
+from chrome_manager.core.sheets import SheetsManager
+
+def cell_value(cell: Dict[str, Any]) -> str:
+    """Text of an encoded CellData, as the Sheets UI would show it"""
+    value = cell.get('userEnteredValue', {})
+    if not value:
+        return ''
+    value = next(iter(value.values()))
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+class FakeResponse:
+    """HTTP response carrying an API error"""
+
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        self.text = message
+
+    def json(self) -> Dict[str, Any]:
+        return {'error': {'code': self.status_code, 'message': self.text}}
+
+class FakeWorksheet:
+    """📄 Worksheet held as a list of rows"""
+
+    def __init__(self, spreadsheet: 'FakeSpreadsheet', sheet_id: int, title: str,
+                 col_count: int = 26, rows: int = 1000):
+        self.spreadsheet = spreadsheet
+        self.id = sheet_id
+        self.title = title
+        self.col_count = col_count
+        self.rows = rows
+        self.grid: List[List[str]] = []
+
+    def col_values(self, column: int) -> List[str]:
+        self.spreadsheet.calls.append(('col_values', self.title))
+        return [row[column - 1] if len(row) >= column else '' for row in self.grid]
+
+    def append_row(self, row: List[Any]) -> None:
+        self.spreadsheet.calls.append(('append_row', self.title))
+        self.grid.append([str(value) for value in row])
+
+    @property
+    def row_count(self) -> int:
+        """Grid rows; appends past the end of the grid extend it"""
+        return max(self.rows, len(self.grid))
+
+    @property
+    def data(self) -> List[List[str]]:
+        """Rows below the header"""
+        return self.grid[1:]
+
+class FakeSpreadsheet:
+    """
+    📊 Spreadsheet answering the batch requests SheetsManager sends
+
+    Set fail_next to make that many batch_update calls time out; with
+    apply_before_failure the first of them is applied before it fails,
+    like a request whose response was lost.
+    """
+
+    id = 'fake-spreadsheet'
+    client = None
+
+    def __init__(self):
+        self.sheets: Dict[str, FakeWorksheet] = {}
+        self.calls: List[tuple] = []
+        self.fail_next = 0
+        self.apply_before_failure = False
+        self.modified = 0
+        self.ranges: List[str] = []
+        self._ids = itertools.count(1000)
+
+    def worksheets(self) -> List[FakeWorksheet]:
+        self.calls.append(('worksheets',))
+        return list(self.sheets.values())
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self.calls.append(('worksheet', title))
+        if title not in self.sheets:
+            raise gspread.WorksheetNotFound(title)
+        return self.sheets[title]
+
+    def add_worksheet(self, title: str, rows: List[List[str]]) -> FakeWorksheet:
+        """Create a worksheet directly (as another client would have)"""
+        worksheet = FakeWorksheet(self, next(self._ids), title)
+        worksheet.grid = [list(row) for row in rows]
+        self.sheets[title] = worksheet
+        return worksheet
+
+    def get_lastUpdateTime(self) -> str:
+        self.calls.append(('get_lastUpdateTime',))
+        return str(self.modified)
+
+    def values_batch_get(self, ranges: List[str], params: Any = None) -> Dict[str, Any]:
+        self.calls.append(('values_batch_get', len(ranges)))
+        self.ranges.extend(ranges)
+        results = []
+        for a1 in ranges:
+            title, cells = re.match(r"'(.*)'!(.*)", a1).groups()
+            grid = self.sheets[title.replace("''", "'")].grid
+            if cells == '1:1':
+                results.append({'values': [list(grid[0])]} if grid else {})
+                continue
+            match = re.match(r"A(\d+):([A-Z]+)(\d*)", cells)
+            first = int(match.group(1))
+            last = int(match.group(3)) if match.group(3) else len(grid)
+            width = gspread.utils.a1_to_rowcol(match.group(2) + '1')[1]
+            values = [list(row[:width]) for row in grid[first - 1:last]]
+            while values and not any(values[-1]):
+                values.pop()
+            results.append({'values': values} if values else {})
+        return {'valueRanges': results}
+
+    def batch_update(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls.append(('batch_update', len(body['requests'])))
+        if self.fail_next:
+            self.fail_next -= 1
+            if self.apply_before_failure:
+                self.apply_before_failure = False
+                self._apply(body)
+            raise TimeoutError("simulated timeout")
+        return self._apply(body)
+
+    def _apply(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        for request in body['requests']:
+            title = request.get('addSheet', {}).get('properties', {}).get('title')
+            if title in self.sheets:
+                # The API rejects the whole batch
+                raise gspread.exceptions.APIError(FakeResponse(400, (
+                    f'Invalid requests[0].addSheet: A sheet with the name "{title}" '
+                    'already exists. Please enter another name.'
+                )))
+        by_id = {worksheet.id: worksheet for worksheet in self.sheets.values()}
+        replies = []
+        for request in body['requests']:
+            (kind, params), = request.items()
+            reply: Dict[str, Any] = {}
+            if kind == 'addSheet':
+                properties = params['properties']
+                worksheet = FakeWorksheet(
+                    self, properties['sheetId'], properties['title'],
+                    properties.get('gridProperties', {}).get('columnCount', 26),
+                    properties.get('gridProperties', {}).get('rowCount', 1000)
+                )
+                self.sheets[worksheet.title] = by_id[worksheet.id] = worksheet
+                reply = {'addSheet': {'properties': properties}}
+            elif kind == 'appendCells':
+                worksheet = by_id[params['sheetId']]
+                while worksheet.grid and not any(worksheet.grid[-1]):
+                    worksheet.grid.pop()
+                for row in params['rows']:
+                    worksheet.grid.append([cell_value(cell) for cell in row['values']])
+            elif kind == 'updateCells' and 'range' in params:
+                by_id[params['range']['sheetId']].grid = []
+            elif kind == 'updateCells':
+                start = params['start']
+                worksheet = by_id[start['sheetId']]
+                for i, row in enumerate(params['rows']):
+                    index = start['rowIndex'] + i
+                    while len(worksheet.grid) <= index:
+                        worksheet.grid.append([])
+                    current = worksheet.grid[index]
+                    for j, cell in enumerate(row['values']):
+                        column = start['columnIndex'] + j
+                        assert column < worksheet.col_count, "column outside the grid"
+                        current.extend([''] * (column + 1 - len(current)))
+                        current[column] = cell_value(cell)
+            elif kind == 'appendDimension':
+                by_id[params['sheetId']].col_count += params['length']
+            elif kind == 'deleteDimension':
+                span = params['range']
+                del by_id[span['sheetId']].grid[span['startIndex']:span['endIndex']]
+            else:
+                raise ValueError(f"Unsupported request: {kind}")
+            replies.append(reply)
+        self.modified += 1
+        return {'replies': replies}
+
+    def log_rows(self) -> List[List[str]]:
+        """Data rows of every log worksheet, in title order"""
+        return [
+            row
+            for title in sorted(self.sheets)
+            if title.startswith(SheetsManager.SHEET_CONFIG['name'])
+            and not title.endswith('Index')
+            for row in self.sheets[title].data
+        ]
+
+@pytest.fixture
+def spreadsheet() -> FakeSpreadsheet:
+    return FakeSpreadsheet()
+
+@pytest.fixture
+def make_manager(spreadsheet, tmp_path, monkeypatch):
+    """Factory of SheetsManagers bound to the fake spreadsheet, run from tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SheetsManager, '_initialize_client', lambda self: None)
+    monkeypatch.setattr(SheetsManager, '_get_spreadsheet', lambda self: spreadsheet)
+    monkeypatch.setattr(
+        gspread, 'Worksheet',
+        lambda owner, properties, *args: owner.sheets[properties['title']]
+    )
+    ledgers = itertools.count()
+
+    def make(**kwargs: Any) -> SheetsManager:
+        kwargs.setdefault('ledger_path', tmp_path / f"ledger-{next(ledgers)}.txt")
+        return SheetsManager(Path("credentials.json"), spreadsheet.id, **kwargs)
+
+    return make
+
+@pytest.fixture
+def system_info() -> Dict[str, str]:
+    return {
+        'hostname': 'host-a', 'username': 'alice', 'os_info': 'Linux 6.1',
+        'ip_address': '10.0.0.1', 'memory_total': '16.0GB', 'memory_available': '8.0GB'
+    }
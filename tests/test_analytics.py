@@ -0,0 +1,55 @@
+"""
+tests/test_analytics.py
+📈 Running profile aggregates fed by committed rows
+"""
+
+from chrome_manager.core.analytics import ProfileAggregates
+from chrome_manager.core.records import ProfileRecord
+
+PROFILES = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(3)]
+
+def test_aggregates_are_saved_once_per_sync(make_manager, system_info, tmp_path):
+    aggregates = ProfileAggregates(tmp_path / 'analytics.json')
+    saves = []
+    save = aggregates.save
+    aggregates.save = lambda: saves.append(save())
+    manager = make_manager(chunk_rows=1)
+    manager.add_row_listener(aggregates.on_rows)
+    manager.add_sync_listener(aggregates.flush)
+
+    assert manager.update_profiles(PROFILES, system_info, '2024-05-01T12:00:00')
+    assert manager.stream_update(iter(PROFILES), system_info, '2024-05-02T12:00:00')
+
+    assert len(saves) == 2
+    assert len(aggregates.synced) == 6
+    assert len(ProfileAggregates(tmp_path / 'analytics.json').profiles) == 3
+
+    # A replay commits nothing, so there is nothing to save
+    assert manager.update_profiles(PROFILES, system_info, '2024-05-01T12:00:00')
+    assert len(saves) == 2
+
+def test_catch_up_forgets_sync_ids_it_read_past(make_manager, system_info, tmp_path):
+    aggregates = ProfileAggregates(tmp_path / 'analytics.json')
+    manager = make_manager(chunk_rows=2)
+    manager.add_row_listener(aggregates.on_rows)
+
+    assert manager.update_profiles(PROFILES, system_info, '2024-05-01T12:00:00')
+    assert len(aggregates.synced) == 2
+
+    assert aggregates.catch_up(manager) == 3
+    assert aggregates.synced == {}
+    assert aggregates.rows == 3
+    assert aggregates.profiles['host-a|alice|Profile 0']['first_seen'] == (
+        '2024-05-01T12:00:00'
+    )
+
+def test_applied_sync_ids_are_bounded(tmp_path):
+    aggregates = ProfileAggregates(tmp_path / 'analytics.json')
+    aggregates.MAX_SYNCED = 3
+    row = ['2024-05-01T12:00:00', 'host-a'] + [''] * 4 + ['Default']
+
+    for i in range(5):
+        aggregates.update([row], f'sync-{i}')
+
+    assert list(aggregates.synced) == ['sync-2', 'sync-3', 'sync-4']
+    assert aggregates.update([row], 'sync-4') == 0
@@ -0,0 +1,105 @@
+"""
+tests/test_backfill.py
+📼 Legacy snapshot backfill and resume
+"""
+
+import json
+
+from chrome_manager.commands import backfill
+from chrome_manager.commands.backfill import (
+    backfill_tmp_snapshots, iter_legacy_snapshots
+)
+
+STAMPS = [
+    '2024-01-05T10:00:00', '2024-01-20T10:00:00',
+    '2024-02-03T10:00:00', '2024-03-01T10:00:00',
+]
+
+def legacy_profile(i):
+    return {'name': f'Profile {i}', 'path': f'/p/{i}', 'is_local': True}
+
+def write_legacy_snapshots(tmp_dir):
+    for timestamp in STAMPS:
+        path = tmp_dir / f"chrome_profiles_{timestamp.replace(':', '-')}.json"
+        path.write_text(json.dumps({
+            'timestamp': timestamp, 'total_profiles': 2,
+            'profiles': [legacy_profile(1), legacy_profile(2)]
+        }))
+    (tmp_dir / 'chrome_profiles_broken.json').write_text('{oops')
+
+def test_legacy_snapshots_stream_in_time_order(tmp_path):
+    write_legacy_snapshots(tmp_path)
+    snapshots = list(iter_legacy_snapshots(tmp_path))
+    assert [timestamp for timestamp, _ in snapshots] == STAMPS
+    assert all(len(profiles) == 2 for _, profiles in snapshots)
+
+def test_backfill_packs_snapshots_per_partition(make_manager, spreadsheet,
+                                                system_info, tmp_path):
+    write_legacy_snapshots(tmp_path)
+    manager = make_manager(partition_mode='monthly')
+    sent = len(spreadsheet.calls)
+
+    result = manager.backfill(iter_legacy_snapshots(tmp_path), system_info, 0)
+
+    assert result == (4, 0, True)
+    batches = [call for call in spreadsheet.calls[sent:] if call[0] == 'batch_update']
+    assert len(batches) == 3  # January's two snapshots share one batch
+    assert len(spreadsheet.sheets['Chrome Profiles 2024-01'].data) == 4
+    assert [row[0] for row in spreadsheet.log_rows()] == [
+        timestamp for timestamp in STAMPS for _ in range(2)
+    ]
+    assert len(spreadsheet.sheets['Sync Log'].data) == 4
+    assert manager.get_last_sync_time() == STAMPS[-1]
+
+def test_interrupted_backfill_resumes(make_manager, spreadsheet, system_info,
+                                      tmp_path):
+    write_legacy_snapshots(tmp_path)
+    manager = make_manager(chunk_rows=2, max_retries=0)
+
+    original = spreadsheet.batch_update
+    sent = []
+
+    def fail_third(body):
+        sent.append(body)
+        if len(sent) == 3:
+            raise TimeoutError("simulated timeout")
+        return original(body)
+
+    spreadsheet.batch_update = fail_third
+    result = manager.backfill(iter_legacy_snapshots(tmp_path), system_info, 0)
+    assert result == (2, 0, False)
+
+    spreadsheet.batch_update = original
+    result = manager.backfill(iter_legacy_snapshots(tmp_path), system_info, 0)
+    assert result == (2, 2, True)
+    assert [row[0] for row in spreadsheet.log_rows()] == [
+        timestamp for timestamp in STAMPS for _ in range(2)
+    ]
+
+    # A regular sync of an already backfilled scan is recognized as well
+    profiles = [legacy_profile(1), legacy_profile(2)]
+    assert manager.update_profiles(profiles, system_info, STAMPS[0])
+    assert len(spreadsheet.log_rows()) == 8
+
+def test_legacy_rows_leave_unrecorded_host_fields_blank(make_manager, spreadsheet,
+                                                        system_info, tmp_path,
+                                                        monkeypatch):
+    write_legacy_snapshots(tmp_path)
+    monkeypatch.setattr(
+        backfill.SystemInfoCollector, 'get_sheet_data',
+        lambda self: dict(system_info, timestamp='2024-06-01T00:00:00')
+    )
+    manager = make_manager()
+
+    assert backfill_tmp_snapshots(manager, tmp_path, 0)
+
+    rows = spreadsheet.log_rows()
+    assert len(rows) == 8
+    # Hostname, OS, IP, memory and username were not in the legacy files
+    assert {tuple(row[1:6]) + (row[11],) for row in rows} == {('',) * 6}
+    assert [row[6] for row in rows[:2]] == ['Profile 1', 'Profile 2']
+    # The uploading host still keys the sync IDs, so a second run skips all
+    assert {row[2] for row in spreadsheet.sheets['Sync Log'].data} == {'host-a'}
+    assert manager.backfill(
+        iter_legacy_snapshots(tmp_path), {}, 0, identity=system_info
+    ) == (0, 4, True)
@@ -0,0 +1,52 @@
+"""
+tests/test_chunks.py
+✂️ Size-aware chunking and chunk-by-chunk replay
+"""
+
+from chrome_manager.core.batch import encode_chunk, iter_row_chunks
+from chrome_manager.core.records import ProfileRecord
+
+PROFILES = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(7)]
+TIMESTAMP = '2024-05-01T12:00:00'
+
+def test_chunks_respect_row_and_byte_limits():
+    rows = [[i, 'x' * 50] for i in range(10)]
+    row_size = encode_chunk(rows[:1]).size
+
+    by_rows = list(iter_row_chunks(rows, 4, 10**6))
+    assert [len(chunk.rows) for chunk in by_rows] == [4, 4, 2]
+
+    by_bytes = list(iter_row_chunks(rows, 100, row_size * 3))
+    assert [len(chunk.rows) for chunk in by_bytes] == [3, 3, 3, 1]
+    assert all(chunk.size <= row_size * 3 for chunk in by_bytes)
+    assert [row for chunk in by_bytes for row in chunk.rows] == rows
+
+def test_oversized_row_forms_its_own_chunk():
+    rows = [['small'], ['x' * 500], ['small']]
+    chunks = list(iter_row_chunks(rows, 100, 100))
+    assert [chunk.rows for chunk in chunks] == [[rows[0]], [rows[1]], [rows[2]]]
+
+def test_replay_resumes_from_the_failed_chunk(make_manager, spreadsheet,
+                                              system_info, monkeypatch):
+    manager = make_manager(chunk_rows=3, current_state=True)
+    commit = manager.commit
+    commits = []
+
+    def flaky(batch):
+        commits.append(batch)
+        if len(commits) == 2:
+            raise RuntimeError("connection reset")
+        return commit(batch)
+
+    monkeypatch.setattr(manager, 'commit', flaky)
+    assert not manager.update_profiles(PROFILES, system_info, TIMESTAMP)
+    assert len(spreadsheet.log_rows()) == 3
+
+    monkeypatch.setattr(manager, 'commit', commit)
+    assert manager.update_profiles(PROFILES, system_info, TIMESTAMP)
+
+    assert [row[6] for row in spreadsheet.log_rows()] == [p.name for p in PROFILES]
+    assert [row[0][-2:] for row in spreadsheet.sheets['Sync Log'].data] == [
+        ':0', ':1', ':2'
+    ]
+    assert len(spreadsheet.sheets['Current State'].data) == 7
@@ -0,0 +1,111 @@
+"""
+tests/test_dedup.py
+🔁 Sync IDs, the local ledger and replay-safe commits
+"""
+
+import pytest
+
+from chrome_manager.core import sheets
+from chrome_manager.core.dedup import SyncLedger, make_sync_id
+from chrome_manager.core.records import ProfileRecord
+
+PROFILES = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(3)]
+TIMESTAMP = '2024-05-01T12:00:00'
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(sheets.time, 'sleep', lambda seconds: None)
+
+def batch_updates(spreadsheet):
+    return sum(1 for call in spreadsheet.calls if call[0] == 'batch_update')
+
+def test_make_sync_id_is_deterministic():
+    assert make_sync_id('host', 'alice', TIMESTAMP, 3) == make_sync_id(
+        'host', 'alice', TIMESTAMP, 3
+    )
+    assert make_sync_id('host', 'alice', TIMESTAMP, 3) != make_sync_id(
+        'host', 'alice', TIMESTAMP, 4
+    )
+    assert make_sync_id('a', 'bc') != make_sync_id('ab', 'c')
+
+def test_ledger_persists_ids_once(tmp_path):
+    path = tmp_path / 'ledger' / 'ids.txt'
+    ledger = SyncLedger(path)
+    assert 'abc' not in ledger
+    ledger.add('abc')
+    ledger.add('abc')
+
+    assert path.read_text(encoding='utf-8') == 'abc\n'
+    assert 'abc' in SyncLedger(path)
+
+def test_replayed_sync_is_skipped(make_manager, spreadsheet, system_info):
+    manager = make_manager()
+    assert manager.update_profiles(PROFILES, system_info, TIMESTAMP)
+    sent = batch_updates(spreadsheet)
+
+    assert manager.update_profiles(PROFILES, system_info, TIMESTAMP)
+
+    assert batch_updates(spreadsheet) == sent
+    assert len(spreadsheet.log_rows()) == 3
+    assert len(spreadsheet.sheets['Sync Log'].data) == 1
+
+def test_sync_log_covers_a_lost_ledger(make_manager, spreadsheet, system_info):
+    assert make_manager().update_profiles(PROFILES, system_info, TIMESTAMP)
+
+    # Another machine (or a wiped tmp/) has an empty ledger
+    assert make_manager().update_profiles(PROFILES, system_info, TIMESTAMP)
+
+    assert len(spreadsheet.log_rows()) == 3
+
+def test_failed_commit_is_retried(make_manager, spreadsheet, system_info, no_sleep):
+    manager = make_manager()
+    spreadsheet.fail_next = 1
+
+    assert manager.update_profiles(PROFILES, system_info, TIMESTAMP)
+
+    assert len(spreadsheet.log_rows()) == 3
+    sync_id = spreadsheet.sheets['Sync Log'].data[0][0]
+    assert sync_id in manager.ledger
+
+def test_commit_applied_before_a_timeout_is_not_resent(make_manager, spreadsheet,
+                                                      system_info, no_sleep):
+    manager = make_manager()
+    sent = batch_updates(spreadsheet)
+    spreadsheet.fail_next = 1
+    spreadsheet.apply_before_failure = True
+
+    assert manager.update_profiles(PROFILES, system_info, TIMESTAMP)
+
+    assert batch_updates(spreadsheet) == sent + 1
+    assert len(spreadsheet.log_rows()) == 3
+    assert spreadsheet.sheets['Sync Log'].data[0][0] in manager.ledger
+
+def test_retries_are_bounded(make_manager, spreadsheet, system_info, no_sleep):
+    manager = make_manager(max_retries=2)
+    sent = batch_updates(spreadsheet)
+    spreadsheet.fail_next = 5
+
+    assert not manager.update_profiles(PROFILES, system_info, TIMESTAMP)
+
+    assert batch_updates(spreadsheet) == sent + 3
+    assert spreadsheet.log_rows() == []
+
+def test_dedup_reads_only_the_sync_log_tail(make_manager, spreadsheet, system_info):
+    manager = make_manager()
+    sync_log = spreadsheet.sheets['Sync Log']
+    sync_log.rows = 1
+    sync_log.grid += [[f'old-{i}'] for i in range(20)]
+    manager.SYNC_LOG_TAIL = 5
+
+    assert manager.is_synced('old-19') and not manager.is_synced('old-0')
+    assert spreadsheet.ranges[-1] == "'Sync Log'!A17:A"
+
+    # Rows appended since are picked up without re-reading the tail
+    sync_log.grid.append(['new-0'])
+    assert manager._applied_remotely(['new-0'])
+    assert spreadsheet.ranges[-1] == "'Sync Log'!A22:A"
+
+    # A backfill may replay old snapshots, so it reads the whole column
+    assert manager.backfill([], system_info).complete
+    assert spreadsheet.ranges[-1] == "'Sync Log'!A2:A"
+    assert manager.is_synced('old-0')
@@ -0,0 +1,56 @@
+"""
+tests/test_disk_usage.py
+💽 Cached disk usage measurement
+"""
+
+import os
+
+from chrome_manager.core.disk_usage import DiskUsage
+
+def make_tree(root):
+    (root / 'Cache').mkdir(parents=True)
+    (root / 'History').write_bytes(b'x' * 10000)
+    (root / 'Cache' / 'data_0').write_bytes(b'x' * 50000)
+
+def test_measure_reuses_unchanged_directories(tmp_path, monkeypatch):
+    profile = tmp_path / 'Profile 1'
+    make_tree(profile)
+    cache_path = tmp_path / 'cache.json'
+
+    meter = DiskUsage(cache_path, workers=2)
+    first = meter.measure(profile)
+    meter.close()
+    meter.save()
+    assert first >= 60000
+
+    listed = []
+    scandir = os.scandir
+
+    def listing(path):
+        listed.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', listing)
+
+    meter = DiskUsage(cache_path, workers=2)
+    assert meter.measure(profile) == first
+    assert listed == []
+
+    (profile / 'Cache' / 'data_1').write_bytes(b'x' * 50000)
+    assert meter.measure(profile) > first
+    assert listed == [str(profile / 'Cache')]
+    meter.close()
+
+def test_measure_shares_one_pool_until_closed(tmp_path):
+    make_tree(tmp_path / 'a')
+    make_tree(tmp_path / 'b')
+    meter = DiskUsage(tmp_path / 'cache.json')
+
+    meter.measure(tmp_path / 'a')
+    executor = meter._executor
+    meter.measure(tmp_path / 'b')
+    assert meter._executor is executor
+
+    meter.close()
+    assert meter._executor is None
+    assert meter.measure(tmp_path / 'missing') is None
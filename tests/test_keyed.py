@@ -0,0 +1,141 @@
+"""
+tests/test_keyed.py
+🗝️ Keyed upserts and the Current State worksheet
+"""
+
+from chrome_manager.core.batch import SheetBatch
+from chrome_manager.core.keyed import KeyedRows
+from chrome_manager.core.records import ProfileRecord
+
+def request_kinds(batch):
+    return [next(iter(request)) for request in batch.requests]
+
+def test_upsert_updates_runs_deletes_bottom_up_and_appends():
+    view = KeyedRows('State', key_columns=(0, 1))
+    view.load([['h1', 'a', '1'], ['h1', 'b', '1'], ['h1', 'c', '1'], ['h2', 'a', '1']])
+    batch = SheetBatch()
+
+    counts = view.queue_upsert(
+        batch, 7, [['h1', 'a', '2'], ['h1', 'b', '2'], ['h1', 'd', '2']], scope=1
+    )
+
+    assert counts == (2, 1, 1)
+    assert request_kinds(batch) == ['updateCells', 'deleteDimension', 'appendCells']
+    assert batch.requests[0]['updateCells']['start']['rowIndex'] == 1
+    assert len(batch.requests[0]['updateCells']['rows']) == 2
+    assert batch.requests[1]['deleteDimension']['range']['startIndex'] == 3
+
+    # The mirror only follows once the batch commits
+    assert view.rows[2] == ['h1', 'c', '1']
+    batch.committed()
+    assert view.rows == [
+        ['h1', 'a', '2'], ['h1', 'b', '2'], ['h2', 'a', '1'], ['h1', 'd', '2']
+    ]
+    assert view.index[('h1', 'd')] == 3
+
+def test_seen_keys_are_not_pruned():
+    view = KeyedRows('State', key_columns=(0, 1))
+    view.load([['h1', 'a'], ['h1', 'b']])
+    batch = SheetBatch()
+
+    view.queue_upsert(batch, 7, [['h1', 'b']], scope=1, seen={('h1', 'a')})
+
+    assert 'deleteDimension' not in request_kinds(batch)
+
+def test_reloaded_mirror_is_not_overwritten():
+    view = KeyedRows('State', key_columns=(0,))
+    view.load([['a', '1']])
+    batch = SheetBatch()
+    view.queue_upsert(batch, 7, [['a', '2']])
+
+    view.load([['a', '3']])
+    batch.committed()
+
+    assert view.rows == [['a', '3']]
+
+def test_current_state_follows_each_sync(make_manager, spreadsheet, system_info):
+    manager = make_manager(current_state=True)
+    other_host = dict(system_info, hostname='host-b')
+    profiles = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(3)]
+
+    assert manager.update_profiles(profiles, system_info, '2024-05-01T00:00:00')
+    assert manager.update_profiles(profiles[:1], other_host, '2024-05-01T00:01:00')
+    assert manager.update_profiles(
+        [profiles[0], profiles[2]], system_info, '2024-05-02T00:00:00'
+    )
+
+    state = spreadsheet.sheets['Current State'].data
+    assert sorted((row[1], row[6], row[0]) for row in state) == [
+        ('host-a', 'Profile 0', '2024-05-02T00:00:00'),
+        ('host-a', 'Profile 2', '2024-05-02T00:00:00'),
+        ('host-b', 'Profile 0', '2024-05-01T00:01:00'),
+    ]
+    assert len(spreadsheet.log_rows()) == 6
+
+    # The mirror matches what a fresh read returns
+    assert manager.current_state.rows == state
+    assert make_manager(current_state=True).get_current_state('host-b') == [
+        row for row in state if row[1] == 'host-b'
+    ]
+
+def test_host_summary_is_rewritten_per_host(make_manager, spreadsheet, system_info):
+    manager = make_manager(summary=True)
+    signed_in = ProfileRecord(name='Profile 1', path='/p/1', email='a@example.com')
+    local = ProfileRecord(name='Default', path='/p/0')
+
+    assert manager.update_profiles([local, signed_in], system_info, '2024-05-01')
+    assert manager.update_profiles(
+        [local], dict(system_info, hostname='host-b'), '2024-05-01'
+    )
+    assert manager.update_profiles([signed_in], system_info, '2024-05-02')
+
+    assert spreadsheet.sheets['Host Summary'].data == [
+        ['host-a', 'alice', '1', '1', '0', '1', '2024-05-02'],
+        ['host-b', 'alice', '1', '0', '1', '0', '2024-05-01'],
+    ]
+
+def test_hosts_sharing_a_spreadsheet_keep_one_row_per_profile(make_manager, spreadsheet,
+                                                               system_info):
+    host_a = make_manager(current_state=True)
+    host_b = make_manager(current_state=True)
+    info_b = dict(system_info, hostname='host-b')
+    profiles = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(3)]
+
+    assert host_a.update_profiles(profiles, system_info, '2024-05-01T00:00:00')
+    assert host_b.update_profiles(profiles, info_b, '2024-05-01T00:01:00')
+    # Host A prunes a row above host B's, shifting them up
+    assert host_a.update_profiles(profiles[1:], system_info, '2024-05-01T00:02:00')
+    assert host_b.stream_update(iter(profiles), info_b, '2024-05-01T00:03:00')
+    assert host_a.update_profiles(profiles[2:], system_info, '2024-05-01T00:04:00')
+
+    state = spreadsheet.sheets['Current State'].data
+    assert sorted((row[1], row[6], row[0]) for row in state) == [
+        ('host-a', 'Profile 2', '2024-05-01T00:04:00'),
+        ('host-b', 'Profile 0', '2024-05-01T00:03:00'),
+        ('host-b', 'Profile 1', '2024-05-01T00:03:00'),
+        ('host-b', 'Profile 2', '2024-05-01T00:03:00'),
+    ]
+
+def test_host_summary_rows_moved_by_another_writer(make_manager, spreadsheet,
+                                                   system_info):
+    host_a = make_manager(summary=True)
+    host_b = make_manager(summary=True)
+    info_b = dict(system_info, hostname='host-b')
+    profile = ProfileRecord(name='Default', path='/p/0')
+    other = ProfileRecord(name='Profile 1', path='/p/1')
+
+    assert host_a.update_profiles([profile], system_info, '2024-05-01')
+    assert host_b.stream_update(iter([profile]), info_b, '2024-05-01')
+    summary = spreadsheet.sheets['Host Summary']
+    summary.grid[1:] = summary.grid[:0:-1]  # Sorted by hand: host-b first
+    assert host_a.update_profiles([profile, other], system_info, '2024-05-02')
+    assert [row[:3] + row[6:] for row in summary.data] == [
+        ['host-b', 'alice', '1', '2024-05-01'],
+        ['host-a', 'alice', '2', '2024-05-02'],
+    ]
+
+    assert host_b.stream_update(iter([profile]), info_b, '2024-05-03')
+    assert [row[:3] + row[6:] for row in summary.data] == [
+        ['host-b', 'alice', '1', '2024-05-03'],
+        ['host-a', 'alice', '2', '2024-05-02'],
+    ]
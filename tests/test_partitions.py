@@ -0,0 +1,149 @@
+"""
+tests/test_partitions.py
+🗂️ Partition planning and worksheet rollover
+"""
+
+import pytest
+
+from chrome_manager.core.partitions import Partition, PartitionIndex
+from chrome_manager.core.records import ProfileRecord
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        PartitionIndex('Log', 'weekly', 10)
+
+def test_load_skips_blank_rows_and_bad_counts():
+    index = PartitionIndex('Log', 'rows', 10)
+    index.load([
+        ['Log 0001', '2024-01-01', '2024-01-31', '7'],
+        [],
+        ['', 'x'],
+        ['Log 0002', '2024-02-01', '2024-02-02', 'many'],
+    ])
+    assert index.partitions == [
+        Partition('Log 0001', '2024-01-01', '2024-01-31', 7),
+        Partition('Log 0002', '2024-02-01', '2024-02-02', 0),
+    ]
+    assert index.active().name == 'Log 0002'
+
+def test_monthly_plan_rolls_over_on_a_new_month():
+    index = PartitionIndex('Log', 'monthly', 0)
+    assert index.plan_write('2024-01-05T10:00:00', 3) == ('Log 2024-01', True)
+    index.record_write('Log 2024-01', '2024-01-05T10:00:00', 3)
+    assert index.plan_write('2024-01-20T10:00:00', 3) == ('Log 2024-01', False)
+    assert index.plan_write('2024-02-01T00:00:00', 3) == ('Log 2024-02', True)
+
+def test_rows_plan_never_splits_a_write():
+    index = PartitionIndex('Log', 'rows', 5)
+    index.record_write('Log 0001', '2024-01-01', 4)
+    assert index.plan_write('2024-01-02', 1) == ('Log 0001', False)
+    assert index.plan_write('2024-01-02', 2) == ('Log 0002', True)
+
+    # An oversized write into an empty partition still lands there whole
+    index.load([['Log 0001', '', '', '0']])
+    assert index.plan_write('2024-01-02', 50) == ('Log 0001', False)
+
+def test_record_write_widens_the_time_range():
+    index = PartitionIndex('Log', 'rows', 100)
+    assert index.record_write('Log 0001', '2024-01-10', 2) == 0
+    assert index.record_write('Log 0001', '2024-01-20', 3, start='2024-01-05') == 0
+    assert index.partitions == [Partition('Log 0001', '2024-01-05', '2024-01-20', 5)]
+
+def test_overlapping():
+    index = PartitionIndex('Log', 'monthly', 0)
+    index.load([
+        ['Log 2024-01', '2024-01-01', '2024-01-31', '1'],
+        ['Log 2024-02', '2024-02-01', '2024-02-29', '1'],
+        ['Log 2024-03', '2024-03-01', '2024-03-31', '1'],
+    ])
+    names = [p.name for p in index.overlapping('2024-01-15', '2024-02-10')]
+    assert names == ['Log 2024-01', 'Log 2024-02']
+    assert [p.name for p in index.overlapping(start='2024-03-05')] == ['Log 2024-03']
+    assert len(index.overlapping()) == 3
+
+def test_monthly_rollover_through_the_manager(make_manager, spreadsheet, system_info):
+    manager = make_manager(partition_mode='monthly')
+    profiles = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(2)]
+
+    assert manager.update_profiles(profiles, system_info, '2024-01-05T10:00:00')
+    assert manager.update_profiles(profiles, system_info, '2024-01-20T10:00:00')
+    assert manager.update_profiles(profiles, system_info, '2024-02-03T10:00:00')
+
+    assert len(spreadsheet.sheets['Chrome Profiles 2024-01'].data) == 4
+    assert len(spreadsheet.sheets['Chrome Profiles 2024-02'].data) == 2
+    assert spreadsheet.sheets['Partition Index'].data == [
+        ['Chrome Profiles 2024-01', '2024-01-05T10:00:00', '2024-01-20T10:00:00', '4'],
+        ['Chrome Profiles 2024-02', '2024-02-03T10:00:00', '2024-02-03T10:00:00', '2'],
+    ]
+    assert manager.get_last_sync_time() == '2024-02-03T10:00:00'
+
+    # A fresh manager picks the index up from the sheet
+    reopened = make_manager(partition_mode='monthly')
+    assert [p.rows for p in reopened.partitions.partitions] == [4, 2]
+
+def test_legacy_log_is_adopted_as_first_partition(make_manager, spreadsheet):
+    headers = make_manager().log_config['headers']
+    spreadsheet.sheets['Chrome Profiles'].grid = [
+        headers,
+        ['2023-12-01T00:00:00'] + [''] * (len(headers) - 1),
+        ['2023-12-02T00:00:00'] + [''] * (len(headers) - 1),
+    ]
+
+    manager = make_manager(partition_mode='rows', partition_rows=10)
+
+    assert manager.partitions.partitions == [
+        Partition('Chrome Profiles', '2023-12-01T00:00:00', '2023-12-02T00:00:00', 2)
+    ]
+
+def test_hosts_share_one_partition_index(make_manager, spreadsheet, system_info):
+    host_a = make_manager(partition_mode='monthly')
+    host_b = make_manager(partition_mode='monthly')
+    info_b = dict(system_info, hostname='host-b')
+    profiles = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(2)]
+
+    assert host_a.update_profiles(profiles, system_info, '2024-01-05T10:00:00')
+    assert host_b.update_profiles(profiles, info_b, '2024-01-06T10:00:00')
+    # Host A opens February; host B must append to it rather than add it again
+    assert host_a.update_profiles(profiles, system_info, '2024-02-01T10:00:00')
+    assert host_b.stream_update(iter(profiles), info_b, '2024-02-02T10:00:00')
+
+    assert spreadsheet.sheets['Partition Index'].data == [
+        ['Chrome Profiles 2024-01', '2024-01-05T10:00:00', '2024-01-06T10:00:00', '4'],
+        ['Chrome Profiles 2024-02', '2024-02-01T10:00:00', '2024-02-02T10:00:00', '4'],
+    ]
+    assert host_a.get_last_sync_time() == '2024-02-02T10:00:00'
+
+def test_row_counts_of_concurrent_hosts_add_up(make_manager, spreadsheet, system_info):
+    hosts = [
+        (make_manager(partition_mode='rows', partition_rows=5),
+         dict(system_info, hostname=f'host-{i}'))
+        for i in range(2)
+    ]
+    profiles = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(2)]
+
+    for minute in range(5):
+        manager, info = hosts[minute % 2]
+        assert manager.update_profiles(profiles, info, f'2024-01-01T00:0{minute}:00')
+
+    index = spreadsheet.sheets['Partition Index'].data
+    assert [(row[0], row[3]) for row in index] == [
+        ('Chrome Profiles 0001', '4'),
+        ('Chrome Profiles 0002', '4'),
+        ('Chrome Profiles 0003', '2'),
+    ]
+    assert [len(spreadsheet.sheets[row[0]].data) for row in index] == [4, 4, 2]
+
+def test_partition_created_meanwhile_is_reused(make_manager, spreadsheet, system_info):
+    manager = make_manager(partition_mode='monthly')
+    profiles = [ProfileRecord(name='Default', path='/p/0')]
+    assert manager.update_profiles(profiles, system_info, '2024-01-05T10:00:00')
+
+    # Created after this manager listed the worksheets, not yet indexed
+    headers = manager.log_config['headers']
+    spreadsheet.add_worksheet('Chrome Profiles 2024-02', [headers])
+
+    assert manager.update_profiles(profiles, system_info, '2024-02-01T10:00:00')
+    assert len(spreadsheet.sheets['Chrome Profiles 2024-02'].data) == 1
+    assert [row[0] for row in spreadsheet.sheets['Partition Index'].data] == [
+        'Chrome Profiles 2024-01', 'Chrome Profiles 2024-02'
+    ]
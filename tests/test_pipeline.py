@@ -0,0 +1,121 @@
+"""
+tests/test_pipeline.py
+🚰 Bounded producer hand-off and streamed syncs
+"""
+
+import threading
+import time
+
+import pytest
+
+from chrome_manager.core.pipeline import batched, bounded
+from chrome_manager.core.records import ProfileRecord
+
+PROFILES = [ProfileRecord(name=f'Profile {i}', path=f'/p/{i}') for i in range(7)]
+TIMESTAMP = '2024-05-01T12:00:00'
+
+def test_bounded_keeps_order_and_limits_read_ahead():
+    produced = []
+
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    consumed = []
+    for item in bounded(source(), maxsize=4):
+        if item == 0:
+            time.sleep(0.2)  # Let the producer run ahead as far as it may
+            # Four queued, one blocked in put, one just handed over
+            assert len(produced) <= 6
+        consumed.append(item)
+
+    assert consumed == list(range(100))
+
+def test_bounded_reraises_producer_errors():
+    def source():
+        yield 1
+        raise ValueError("scan failed")
+
+    items = bounded(source(), maxsize=2)
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="scan failed"):
+        next(items)
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_bounded_fails_when_the_producer_thread_dies():
+    def hook(frame, event, arg):
+        raise ValueError("profiler already active")
+
+    threading.setprofile(hook)
+    try:
+        items = bounded(iter(range(3)), maxsize=2, name='test-producer')
+        with pytest.raises(RuntimeError, match="test-producer"):
+            next(items)
+    finally:
+        threading.setprofile(None)
+
+def test_bounded_stops_the_producer_when_abandoned():
+    produced = []
+
+    def source():
+        for i in range(10**6):
+            produced.append(i)
+            yield i
+
+    items = bounded(source(), maxsize=4, name='test-producer')
+    for item in items:
+        if item == 3:
+            break
+    items.close()
+
+    assert len(produced) < 20
+    assert 'test-producer' not in [thread.name for thread in threading.enumerate()]
+
+def test_batched():
+    assert list(batched(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(batched([], 3)) == []
+
+def test_stream_update_matches_update_profiles(make_manager, spreadsheet,
+                                               system_info):
+    streamed = make_manager(chunk_rows=3, current_state=True, summary=True)
+    assert streamed.stream_update(iter(PROFILES), system_info, TIMESTAMP)
+    assert streamed.stream_update(iter(PROFILES[:2]), system_info, '2024-05-02')
+    state = spreadsheet.sheets['Current State'].data
+    summary = spreadsheet.sheets['Host Summary'].data
+
+    spreadsheet.sheets.clear()
+    batched_sync = make_manager(chunk_rows=3, current_state=True, summary=True)
+    assert batched_sync.update_profiles(PROFILES, system_info, TIMESTAMP)
+    assert batched_sync.update_profiles(PROFILES[:2], system_info, '2024-05-02')
+
+    assert spreadsheet.sheets['Current State'].data == state
+    assert spreadsheet.sheets['Host Summary'].data == summary
+    assert len(state) == 2
+
+def test_stream_replay_sends_only_missing_chunks(make_manager, spreadsheet,
+                                                 system_info, monkeypatch):
+    manager = make_manager(chunk_rows=3, current_state=True, summary=True)
+    commit = manager.commit
+    commits = []
+
+    def flaky(batch):
+        commits.append(batch)
+        if len(commits) == 2:
+            raise RuntimeError("connection reset")
+        return commit(batch)
+
+    monkeypatch.setattr(manager, 'commit', flaky)
+    assert not manager.stream_update(iter(PROFILES), system_info, TIMESTAMP)
+
+    monkeypatch.setattr(manager, 'commit', commit)
+    assert manager.stream_update(iter(PROFILES), system_info, TIMESTAMP)
+    sent = len(spreadsheet.calls)
+    assert manager.stream_update(iter(PROFILES), system_info, TIMESTAMP)
+
+    assert not [call for call in spreadsheet.calls[sent:] if call[0] == 'batch_update']
+    assert [row[6] for row in spreadsheet.log_rows()] == [p.name for p in PROFILES]
+    assert len(spreadsheet.sheets['Sync Log'].data) == 3
+    # Profiles of the chunk skipped on replay are not pruned or left uncounted
+    assert len(spreadsheet.sheets['Current State'].data) == 7
+    assert spreadsheet.sheets['Host Summary'].data[0][2] == '7'
@@ -0,0 +1,73 @@
+"""
+tests/test_profiling.py
+⏱️ Phase accounting and thread coverage of the profiler
+"""
+
+import cProfile
+import sys
+import threading
+import time
+
+import pytest
+
+from chrome_manager.core.pipeline import bounded
+from chrome_manager.utils.profiling import Profiler, phase
+
+def test_nested_phase_time_is_taken_off_the_outer_phase(tmp_path):
+    profiler = Profiler('sample', output_dir=tmp_path)
+    profiler.start()
+    try:
+        with phase('sheets'):
+            time.sleep(0.05)
+            with phase('scan'):
+                time.sleep(0.2)
+    finally:
+        profiler.stop()
+
+    assert 0.15 <= profiler.phase_times['scan'] < 0.4
+    assert 0.03 <= profiler.phase_times['sheets'] < 0.15
+
+def test_phase_is_free_without_a_profiler():
+    with phase('scan'):
+        pass
+
+def test_cprofile_covers_threads_started_while_running(tmp_path):
+    def worker_function():
+        return sum(range(1000))
+
+    profiler = Profiler('cprofile', output_dir=tmp_path, top=1000)
+    profiler.start()
+    try:
+        thread = threading.Thread(target=worker_function)
+        thread.start()
+        thread.join()
+    finally:
+        profiler.stop()
+
+    functions = [func for func, _, _, _ in profiler.hot_functions()]
+    assert any(func.startswith('worker_function ') for func in functions)
+    paths = profiler.write()
+    assert paths['pstats'].exists() and paths['summary'].exists()
+
+def test_cprofile_keeps_bounded_producers_running(tmp_path):
+    profiler = Profiler('cprofile', output_dir=tmp_path)
+    profiler.start()
+    try:
+        assert list(bounded(iter(range(5)), maxsize=2)) == list(range(5))
+    finally:
+        profiler.stop()
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="one profiler per interpreter")
+def test_thread_hook_skips_when_another_profiler_is_active(tmp_path):
+    profiler = Profiler('cprofile', output_dir=tmp_path)
+    other = cProfile.Profile()
+    other.enable()
+    try:
+        thread = threading.Thread(target=profiler._profile_thread,
+                                  args=(sys._getframe(), 'call', None))
+        thread.start()
+        thread.join()
+    finally:
+        other.disable()
+
+    assert profiler._thread_profiles == []
@@ -0,0 +1,79 @@
+"""
+tests/test_singleflight.py
+🛫 Single-flight runs and shared backoff
+"""
+
+import os
+import stat
+import threading
+import time
+
+from chrome_manager.core.singleflight import SharedBackoff, SingleFlight, flight_key
+
+def test_flight_key_is_stable_and_file_safe():
+    assert flight_key('sync', 'abc') == flight_key('sync', 'abc')
+    assert flight_key('sync', 'abc') != flight_key('sync', 'abd')
+    assert flight_key('a/b', '..').isalnum()
+
+def test_run_keeps_its_files_private(tmp_path):
+    root = tmp_path / 'run'
+    assert SingleFlight(root).run('k', lambda: 42) == 42
+
+    assert stat.S_IMODE(os.stat(root).st_mode) == 0o700
+    for path in root.iterdir():
+        assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0
+
+def test_concurrent_callers_share_one_run(tmp_path):
+    calls = []
+    results = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.5)
+        return {'rows': 3}
+
+    def caller():
+        results.append(SingleFlight(tmp_path / 'run').run('sync', work))
+
+    threads = [threading.Thread(target=caller) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{'rows': 3}] * 3
+
+def test_later_run_does_not_reuse_an_old_result(tmp_path):
+    flight = SingleFlight(tmp_path / 'run')
+    assert flight.run('k', lambda: 1) == 1
+    assert flight.run('k', lambda: 2) == 2
+
+def test_planted_symlink_is_not_followed(tmp_path):
+    root = tmp_path / 'run'
+    root.mkdir(mode=0o700)
+    target = tmp_path / 'victim'
+    target.write_text('keep')
+    (root / 'k.lock').symlink_to(target)
+
+    assert SingleFlight(root).run('k', lambda: 'independent') == 'independent'
+    assert target.read_text() == 'keep'
+
+def test_shared_directory_is_refused(tmp_path):
+    root = tmp_path / 'run'
+    root.mkdir()
+    os.chmod(root, 0o777)
+
+    assert SingleFlight(root).run('k', lambda: 'independent') == 'independent'
+    assert list(root.iterdir()) == []
+
+def test_backoff_is_shared_through_the_file(tmp_path, monkeypatch):
+    slept = []
+    monkeypatch.setattr(time, 'sleep', slept.append)
+    path = tmp_path / 'run' / 'backoff.json'
+
+    SharedBackoff(path).push(5.0)
+
+    assert 4.0 < SharedBackoff(path).wait() <= 5.0
+    assert SharedBackoff(path, max_wait=1.0).wait() == 1.0
+    assert len(slept) == 2
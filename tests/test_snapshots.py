@@ -0,0 +1,95 @@
+"""
+tests/test_snapshots.py
+🗃️ Keyframe + delta scan history
+"""
+
+import json
+
+import pytest
+
+from chrome_manager.core.records import ProfileRecord
+from chrome_manager.utils.snapshots import SnapshotStore
+
+def records(*names):
+    return [ProfileRecord(name=name, path=f'/p/{name}') for name in names]
+
+def names(snapshot):
+    return sorted(profile['name'] for profile in snapshot[1])
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path / 'snapshots', keyframe_interval=3)
+
+def test_write_and_load(store):
+    store.write(records('a', 'b'), '2024-03-01T00:00:00')
+    store.write(records('a', 'b', 'c'), '2024-03-02T00:00:00')
+    store.write(records('b', 'c'), '2024-03-03T00:00:00')
+
+    assert store.list_snapshots() == [
+        '2024-03-01T00:00:00', '2024-03-02T00:00:00', '2024-03-03T00:00:00'
+    ]
+    assert store.list_snapshots(limit=1) == ['2024-03-03T00:00:00']
+    assert names(store.load()) == ['b', 'c']
+    assert store.load('2024-03-02T12:00:00')[0] == '2024-03-02T00:00:00'
+    assert names(store.load('2024-03-02T12:00:00')) == ['a', 'b', 'c']
+    assert store.load('2024-02-01T00:00:00') is None
+
+def test_unchanged_profiles_are_stored_as_deltas(store):
+    store.write(records('a', 'b'), '2024-03-01T00:00:00')
+    store.write(records('a', 'b'), '2024-03-02T00:00:00')
+    store.write(records('a', 'c'), '2024-03-03T00:00:00')
+    store.write(records('a', 'c'), '2024-03-04T00:00:00')
+
+    lines = [
+        json.loads(line)
+        for line in (store.root / 'history-2024-03.jsonl').read_text().splitlines()
+    ]
+    assert [profile['name'] for profile in lines[0]['k']] == ['a', 'b']
+    assert lines[1] == {'t': '2024-03-02T00:00:00'}
+    assert [p['name'] for p in lines[2]['u']] == ['c'] and lines[2]['r'] == ['/p/b']
+    assert 'k' in lines[3]  # keyframe_interval reached
+
+def test_months_are_compressed_and_reopened(store):
+    store.write(records('a'), '2024-01-01T00:00:00')
+    store.write(records('a', 'b'), '2024-02-01T00:00:00')
+    store.write(records('c'), '2024-01-15T00:00:00')  # Back into a closed month
+    store.write(records('a', 'b', 'd'), '2024-02-02T00:00:00')
+
+    assert sorted(path.name for path in store.root.glob('history-*')) == [
+        'history-2024-01.jsonl.gz', 'history-2024-02.jsonl', 'history-2024-02.jsonl.gz'
+    ]
+    assert names(store.load('2024-01-10T00:00:00')) == ['a']
+    assert names(store.load('2024-01-20T00:00:00')) == ['c']
+    assert names(store.load()) == ['a', 'b', 'd']
+    assert len(store.list_snapshots()) == 4
+
+def test_corrupt_keyframe_falls_back_to_the_previous_one(tmp_path):
+    store = SnapshotStore(tmp_path, keyframe_interval=2)
+    for day, scan in enumerate([('a',), ('a', 'b'), ('a', 'b', 'c'), ('a', 'c')], 1):
+        store.write(records(*scan), f'2024-03-0{day}T00:00:00')
+
+    segment = tmp_path / 'history-2024-03.jsonl'
+    lines = segment.read_text().splitlines(True)
+    lines[2] = lines[2][:40] + '\n'
+    segment.write_text(''.join(lines))
+
+    timestamp, profiles = store.load()
+    assert timestamp == '2024-03-04T00:00:00'
+    # 'c' was only stored in full in the lost keyframe
+    assert sorted(p['name'] for p in profiles) == ['a']
+
+def test_record_passes_records_through(store):
+    scan = records('a', 'b')
+    assert list(store.record(iter(scan), '2024-03-01T00:00:00')) == scan
+    assert names(store.load()) == ['a', 'b']
+
+def test_abandoned_record_leaves_no_line(store):
+    store.write(records('a', 'b'), '2024-03-01T00:00:00')
+
+    recording = store.record(iter(records('a', 'b', 'c')), '2024-03-02T00:00:00')
+    next(recording)
+    recording.close()
+
+    assert store.list_snapshots() == ['2024-03-01T00:00:00']
+    store.write(records('c'), '2024-03-03T00:00:00')
+    assert names(store.load()) == ['c']